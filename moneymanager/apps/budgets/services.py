@@ -0,0 +1,36 @@
+"""
+Services that keep budget spending in step with transactions.
+"""
+import logging
+
+from .models import Budget
+
+logger = logging.getLogger(__name__)
+
+
+def update_budgets_for_transaction(transaction, until=None):
+    """
+    Update budgets related to this expense transaction.
+
+    ``until`` widens the date window to cover a run of transactions in the
+    same scope, dated from ``transaction.date`` up to ``until``.
+    """
+    try:
+        # Find active budgets that might be affected
+        budgets = Budget.objects.filter(
+            is_active=True,
+            start_date__lte=until or transaction.date,
+            end_date__gte=transaction.date
+        )
+
+        if transaction.family_group_id:
+            budgets = budgets.filter(family_group_id=transaction.family_group_id)
+        else:
+            budgets = budgets.filter(user_id=transaction.user_id, family_group__isnull=True)
+
+        # Update budget spent amounts
+        for budget in budgets:
+            budget.update_spent_amount()
+
+    except Exception as e:
+        logger.error(f"Error updating budgets for transaction {transaction.id}: {str(e)}")
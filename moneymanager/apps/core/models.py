@@ -1,8 +1,24 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+import os
+import time
 import uuid
 
 
+def uuid7():
+    """
+    Return a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, so new primary keys
+    are appended near the end of the index instead of at random positions.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    value = (unix_ts_ms & 0xFFFFFFFFFFFF) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class TimeStampedModel(models.Model):
     """Abstract base model with created and updated timestamps."""
     created_at = models.DateTimeField(auto_now_add=True)
@@ -14,9 +14,11 @@ logger = logging.getLogger(__name__)
 def process_recurring_transactions(self):
     """Process all due recurring transactions."""
     try:
+        from moneymanager.apps.transactions.models import RecurringTransaction
+
         logger.info("Starting recurring transaction processing")
-        call_command('process_recurring_transactions')
-        logger.info("Recurring transaction processing completed successfully")
+        created_count = RecurringTransaction.process_due_recurring()
+        logger.info(f"Recurring transaction processing completed successfully: {created_count} created")
         return "Recurring transactions processed successfully"
 
     except Exception as exc:
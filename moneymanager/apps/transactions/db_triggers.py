@@ -0,0 +1,69 @@
+"""
+Database triggers that keep updated_at current on QuerySet.update().
+
+Model.save() stamps updated_at through auto_now; these triggers cover the
+bulk UPDATE paths (balance deltas, type fixes) that bypass save(). Kept free
+of model imports so migrations can use them.
+"""
+
+# Tables whose updated_at column is bumped by a trigger
+UPDATED_AT_TRIGGER_TABLES = ('transactions_account', 'transactions_transaction')
+
+POSTGRES_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _trigger_name(table):
+    return f'{table}_set_updated_at'
+
+
+def create_updated_at_triggers(connection, tables=UPDATED_AT_TRIGGER_TABLES):
+    """Create the updated_at triggers for ``connection``'s backend, if it has them."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute(POSTGRES_UPDATED_AT_FUNCTION)
+            for table in tables:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table}')
+                cursor.execute(
+                    f'CREATE TRIGGER {_trigger_name(table)} BEFORE UPDATE ON {table} '
+                    f'FOR EACH ROW EXECUTE FUNCTION set_updated_at()'
+                )
+        elif connection.vendor == 'mysql':
+            for table in tables:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {_trigger_name(table)}')
+                # Django stores UTC in MySQL DATETIME(6) columns
+                cursor.execute(
+                    f'CREATE TRIGGER {_trigger_name(table)} BEFORE UPDATE ON {table} '
+                    f'FOR EACH ROW SET NEW.updated_at = UTC_TIMESTAMP(6)'
+                )
+        elif connection.vendor == 'sqlite':
+            # SQLite can't assign NEW in a BEFORE trigger, so an AFTER trigger
+            # stamps the row, but only when the UPDATE left updated_at alone;
+            # save() already sets it, so it is never written twice
+            for table in tables:
+                cursor.execute(
+                    f"CREATE TRIGGER IF NOT EXISTS {_trigger_name(table)} "
+                    f"AFTER UPDATE ON {table} FOR EACH ROW "
+                    f"WHEN NEW.updated_at IS OLD.updated_at BEGIN "
+                    f"UPDATE {table} SET updated_at = STRFTIME('%Y-%m-%d %H:%M:%f', 'NOW') "
+                    f"WHERE rowid = NEW.rowid; END"
+                )
+        # Other backends rely on auto_now alone
+
+
+def drop_updated_at_triggers(connection, tables=UPDATED_AT_TRIGGER_TABLES):
+    """Remove the triggers created by create_updated_at_triggers()."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            for table in tables:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {_trigger_name(table)} ON {table}')
+            cursor.execute('DROP FUNCTION IF EXISTS set_updated_at()')
+        elif connection.vendor in ('mysql', 'sqlite'):
+            for table in tables:
+                cursor.execute(f'DROP TRIGGER IF EXISTS {_trigger_name(table)}')
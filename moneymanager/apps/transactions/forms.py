@@ -1,9 +1,11 @@
 from django import forms
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.forms.models import ModelChoiceIterator
 from crispy_forms.helper import FormHelper
-from crispy_forms.layout import Layout, Submit, Row, Column, Field, Div
+from crispy_forms.layout import Layout, Submit, Row, Column, Field, Div, HTML
 from decimal import Decimal
+import os
 
 from .models import Account, Transaction, RecurringTransaction, TransactionTag
 from moneymanager.apps.core.models import Category, FamilyGroup
@@ -11,6 +13,83 @@ from moneymanager.apps.core.models import Category, FamilyGroup
 User = get_user_model()
 
 
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """Choice iterator that reuses an already evaluated queryset."""
+
+    def __iter__(self):
+        # The stock iterator always calls queryset.iterator(), which ignores
+        # any cached results and queries again on every render
+        if self.queryset._result_cache is None:
+            yield from super().__iter__()
+            return
+
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for obj in self.queryset:
+            yield self.choice(obj)
+
+
+def _use_cached_choices(field, queryset, user, cache_key):
+    """
+    Assign ``queryset`` to a ModelChoiceField, evaluating it once per request.
+
+    The results are stored on the user instance, which for ``request.user``
+    lives only as long as the request, so every form built while handling
+    it shares one list of choices.
+    """
+    field.iterator = CachedModelChoiceIterator
+    field.queryset = queryset
+
+    if user is None:
+        return
+
+    cache = getattr(user, '_form_choice_cache', None)
+    if cache is None:
+        cache = {}
+        user._form_choice_cache = cache
+
+    if cache_key not in cache:
+        cache[cache_key] = list(field.queryset)
+    field.queryset._result_cache = cache[cache_key]
+
+
+def _use_cached_category_choices(field, user, family_group):
+    """Offer the family group's (or personal) categories plus the system ones."""
+    if family_group:
+        scope = models.Q(family_group=family_group)
+    else:
+        scope = models.Q(family_group__isnull=True)
+
+    # Category.__str__ includes the parent's name
+    queryset = Category.objects.filter(
+        scope | models.Q(is_system_category=True)
+    ).select_related('parent')
+    _use_cached_choices(field, queryset, user, ('categories', getattr(family_group, 'pk', None)))
+
+
+# Crispy layouts are only read during rendering, so each form class shares a
+# single module-level instance instead of rebuilding the tree per form.
+_ACCOUNT_FORM_LAYOUT = Layout(
+    Row(
+        Column('name', css_class='form-group col-md-6 mb-3'),
+        Column('account_type', css_class='form-group col-md-6 mb-3'),
+    ),
+    Row(
+        Column('bank_name', css_class='form-group col-md-6 mb-3'),
+        Column('account_number', css_class='form-group col-md-6 mb-3'),
+    ),
+    Row(
+        Column('current_balance', css_class='form-group col-md-6 mb-3'),
+        Column('currency', css_class='form-group col-md-6 mb-3'),
+    ),
+    Row(
+        Column('is_active', css_class='form-group col-md-6 mb-3'),
+        Column('include_in_totals', css_class='form-group col-md-6 mb-3'),
+    ),
+    Submit('submit', 'Save Account', css_class='btn btn-primary')
+)
+
+
 class AccountForm(forms.ModelForm):
     """Form for creating and editing accounts."""
 
@@ -25,25 +104,7 @@ class AccountForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Row(
-                Column('name', css_class='form-group col-md-6 mb-3'),
-                Column('account_type', css_class='form-group col-md-6 mb-3'),
-            ),
-            Row(
-                Column('bank_name', css_class='form-group col-md-6 mb-3'),
-                Column('account_number', css_class='form-group col-md-6 mb-3'),
-            ),
-            Row(
-                Column('current_balance', css_class='form-group col-md-6 mb-3'),
-                Column('currency', css_class='form-group col-md-6 mb-3'),
-            ),
-            Row(
-                Column('is_active', css_class='form-group col-md-6 mb-3'),
-                Column('include_in_totals', css_class='form-group col-md-6 mb-3'),
-            ),
-            Submit('submit', 'Save Account', css_class='btn btn-primary')
-        )
+        self.helper.layout = _ACCOUNT_FORM_LAYOUT
 
     def save(self, commit=True):
         account = super().save(commit=False)
@@ -52,11 +113,43 @@ class AccountForm(forms.ModelForm):
         if self.family_group:
             account.family_group = self.family_group
 
+        # The entered balance includes the transactions recorded so far; keep
+        # the remainder as the opening balance so reconciliation preserves it
+        if 'current_balance' in self.changed_data:
+            account.opening_balance = account.current_balance - account.transactions_balance()
+
         if commit:
             account.save()
         return account
 
 
+_TRANSACTION_FORM_LAYOUT = Layout(
+    Row(
+        Column('transaction_type', css_class='form-group col-md-6 mb-3'),
+        Column('amount', css_class='form-group col-md-6 mb-3'),
+    ),
+    Field('description', css_class='form-group mb-3'),
+    Row(
+        Column('category', css_class='form-group col-md-6 mb-3'),
+        Column('date', css_class='form-group col-md-6 mb-3'),
+    ),
+    Div(
+        Field('account', css_class='form-group mb-3'),
+        css_id='regular-account-field'
+    ),
+    Div(
+        Row(
+            Column('from_account', css_class='form-group col-md-6 mb-3'),
+            Column('to_account', css_class='form-group col-md-6 mb-3'),
+        ),
+        css_id='transfer-account-fields',
+        style='display: none;'
+    ),
+    Field('notes', css_class='form-group mb-3', rows=3),
+    Submit('submit', 'Save Transaction', css_class='btn btn-primary')
+)
+
+
 class TransactionForm(forms.ModelForm):
     """Form for creating and editing transactions."""
 
@@ -71,65 +164,30 @@ class TransactionForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         # Filter accounts and categories by user/family group
+        accounts = None
         if self.family_group:
-            self.fields['account'].queryset = Account.objects.filter(
-                family_group=self.family_group, is_active=True
-            )
-            self.fields['to_account'].queryset = Account.objects.filter(
-                family_group=self.family_group, is_active=True
-            )
-            self.fields['from_account'].queryset = Account.objects.filter(
+            accounts = Account.objects.filter(
                 family_group=self.family_group, is_active=True
             )
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group=self.family_group) |
-                models.Q(is_system_category=True)
-            )
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
         elif self.user:
-            self.fields['account'].queryset = Account.objects.filter(
-                owner=self.user, is_active=True
-            )
-            self.fields['to_account'].queryset = Account.objects.filter(
-                owner=self.user, is_active=True
-            )
-            self.fields['from_account'].queryset = Account.objects.filter(
+            accounts = Account.objects.filter(
                 owner=self.user, is_active=True
             )
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group__isnull=True) |
-                models.Q(is_system_category=True)
-            )
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
+
+        # The three account dropdowns share one evaluated list
+        if accounts is not None:
+            cache_key = ('accounts', getattr(self.family_group, 'pk', None))
+            for field_name in ('account', 'to_account', 'from_account'):
+                _use_cached_choices(self.fields[field_name], accounts, self.user, cache_key)
 
         # Make transfer fields optional initially
         self.fields['to_account'].required = False
         self.fields['from_account'].required = False
 
         self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Row(
-                Column('transaction_type', css_class='form-group col-md-6 mb-3'),
-                Column('amount', css_class='form-group col-md-6 mb-3'),
-            ),
-            Field('description', css_class='form-group mb-3'),
-            Row(
-                Column('category', css_class='form-group col-md-6 mb-3'),
-                Column('date', css_class='form-group col-md-6 mb-3'),
-            ),
-            Div(
-                Field('account', css_class='form-group mb-3'),
-                css_id='regular-account-field'
-            ),
-            Div(
-                Row(
-                    Column('from_account', css_class='form-group col-md-6 mb-3'),
-                    Column('to_account', css_class='form-group col-md-6 mb-3'),
-                ),
-                css_id='transfer-account-fields',
-                style='display: none;'
-            ),
-            Field('notes', css_class='form-group mb-3', rows=3),
-            Submit('submit', 'Save Transaction', css_class='btn btn-primary')
-        )
+        self.helper.layout = _TRANSACTION_FORM_LAYOUT
 
         # Add JavaScript for transaction type handling
         self.helper.include_media = False
@@ -168,6 +226,12 @@ class TransactionForm(forms.ModelForm):
         return transaction
 
 
+_TRANSACTION_TYPE_FILTER_CHOICES = [('', 'All Types')] + Transaction.TRANSACTION_TYPES
+
+# Account.__str__ needs the type label, so the filter dropdown loads just these
+_ACCOUNT_CHOICE_FIELDS = ('id', 'name', 'account_type')
+
+
 class TransactionFilterForm(forms.Form):
     """Form for filtering transactions."""
     PERIOD_CHOICES = [
@@ -188,7 +252,7 @@ class TransactionFilterForm(forms.Form):
         })
     )
     transaction_type = forms.ChoiceField(
-        choices=[('', 'All Types')] + Transaction.TRANSACTION_TYPES,
+        choices=_TRANSACTION_TYPE_FILTER_CHOICES,
         required=False,
         widget=forms.Select(attrs={'class': 'form-select'})
     )
@@ -225,23 +289,47 @@ class TransactionFilterForm(forms.Form):
 
         # Filter categories and accounts
         if self.family_group:
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group=self.family_group) |
-                models.Q(is_system_category=True)
-            )
-            self.fields['account'].queryset = Account.objects.filter(
-                family_group=self.family_group, is_active=True
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
+            _use_cached_choices(
+                self.fields['account'],
+                Account.objects.filter(
+                    family_group=self.family_group, is_active=True
+                ).only(*_ACCOUNT_CHOICE_FIELDS).order_by('name'),
+                self.user,
+                ('filter_accounts', self.family_group.pk),
             )
         elif self.user:
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group__isnull=True) |
-                models.Q(is_system_category=True)
-            )
-            self.fields['account'].queryset = Account.objects.filter(
-                owner=self.user, is_active=True
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
+            _use_cached_choices(
+                self.fields['account'],
+                Account.objects.filter(
+                    owner=self.user, is_active=True
+                ).only(*_ACCOUNT_CHOICE_FIELDS).order_by('name'),
+                self.user,
+                ('filter_accounts', None),
             )
 
 
+_RECURRING_TRANSACTION_FORM_LAYOUT = Layout(
+    Field('name', css_class='form-group mb-3'),
+    Row(
+        Column('transaction_type', css_class='form-group col-md-6 mb-3'),
+        Column('amount', css_class='form-group col-md-6 mb-3'),
+    ),
+    Field('description', css_class='form-group mb-3'),
+    Row(
+        Column('category', css_class='form-group col-md-6 mb-3'),
+        Column('account', css_class='form-group col-md-6 mb-3'),
+    ),
+    Row(
+        Column('frequency', css_class='form-group col-md-6 mb-3'),
+        Column('start_date', css_class='form-group col-md-6 mb-3'),
+    ),
+    Field('end_date', css_class='form-group mb-3'),
+    Submit('submit', 'Save Recurring Transaction', css_class='btn btn-primary')
+)
+
+
 class RecurringTransactionForm(forms.ModelForm):
     """Form for creating recurring transactions."""
 
@@ -257,43 +345,26 @@ class RecurringTransactionForm(forms.ModelForm):
 
         # Filter accounts and categories
         if self.family_group:
-            self.fields['account'].queryset = Account.objects.filter(
-                family_group=self.family_group, is_active=True
-            )
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group=self.family_group) |
-                models.Q(is_system_category=True)
+            _use_cached_choices(
+                self.fields['account'],
+                Account.objects.filter(family_group=self.family_group, is_active=True),
+                self.user,
+                ('accounts', self.family_group.pk),
             )
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
         elif self.user:
-            self.fields['account'].queryset = Account.objects.filter(
-                owner=self.user, is_active=True
-            )
-            self.fields['category'].queryset = Category.objects.filter(
-                models.Q(family_group__isnull=True) |
-                models.Q(is_system_category=True)
+            _use_cached_choices(
+                self.fields['account'],
+                Account.objects.filter(owner=self.user, is_active=True),
+                self.user,
+                ('accounts', None),
             )
+            _use_cached_category_choices(self.fields['category'], self.user, self.family_group)
 
         self.fields['end_date'].required = False
 
         self.helper = FormHelper()
-        self.helper.layout = Layout(
-            Field('name', css_class='form-group mb-3'),
-            Row(
-                Column('transaction_type', css_class='form-group col-md-6 mb-3'),
-                Column('amount', css_class='form-group col-md-6 mb-3'),
-            ),
-            Field('description', css_class='form-group mb-3'),
-            Row(
-                Column('category', css_class='form-group col-md-6 mb-3'),
-                Column('account', css_class='form-group col-md-6 mb-3'),
-            ),
-            Row(
-                Column('frequency', css_class='form-group col-md-6 mb-3'),
-                Column('start_date', css_class='form-group col-md-6 mb-3'),
-            ),
-            Field('end_date', css_class='form-group mb-3'),
-            Submit('submit', 'Save Recurring Transaction', css_class='btn btn-primary')
-        )
+        self.helper.layout = _RECURRING_TRANSACTION_FORM_LAYOUT
 
     def save(self, commit=True):
         recurring_transaction = super().save(commit=False)
@@ -310,6 +381,20 @@ class RecurringTransactionForm(forms.ModelForm):
         return recurring_transaction
 
 
+_UPLOAD_EXTENSIONS = ('.csv', '.xlsx', '.xls', '.pdf')
+_ALLOWED_UPLOAD_EXTS = frozenset(_UPLOAD_EXTENSIONS)
+
+_BULK_UPLOAD_FORM_LAYOUT = Layout(
+    Field('file', css_class='form-group mb-3'),
+    Field('account', css_class='form-group mb-3'),
+    Field('has_header', css_class='form-check'),
+    HTML('<div class="alert alert-info mt-3"><strong>File Format:</strong> '
+         'CSV, Excel, or PDF with columns: Date, Description, Amount, Type (income/expense), Category (optional). '
+         'For PDFs, bank statements with transaction tables are supported.</div>'),
+    Submit('submit', 'Upload Transactions', css_class='btn btn-primary')
+)
+
+
 class BulkTransactionUploadForm(forms.Form):
     """Form for bulk transaction upload."""
     file = forms.FileField(
@@ -352,24 +437,18 @@ class BulkTransactionUploadForm(forms.Form):
         else:
             accounts_qs = Account.objects.none()
 
-        self.fields['account'].queryset = accounts_qs
+        _use_cached_choices(
+            self.fields['account'],
+            accounts_qs,
+            self.user,
+            ('upload_accounts', getattr(self.family_group, 'pk', None)),
+        )
 
         # Add crispy forms helper
-        from crispy_forms.helper import FormHelper
-        from crispy_forms.layout import Layout, Field, Submit, Div, HTML
-
         self.helper = FormHelper()
         self.helper.form_method = 'post'
         self.helper.form_enctype = 'multipart/form-data'
-        self.helper.layout = Layout(
-            Field('file', css_class='form-group mb-3'),
-            Field('account', css_class='form-group mb-3'),
-            Field('has_header', css_class='form-check'),
-            HTML('<div class="alert alert-info mt-3"><strong>File Format:</strong> '
-                 'CSV, Excel, or PDF with columns: Date, Description, Amount, Type (income/expense), Category (optional). '
-                 'For PDFs, bank statements with transaction tables are supported.</div>'),
-            Submit('submit', 'Upload Transactions', css_class='btn btn-primary')
-        )
+        self.helper.layout = _BULK_UPLOAD_FORM_LAYOUT
 
     def clean_file(self):
         """Validate uploaded file."""
@@ -382,12 +461,11 @@ class BulkTransactionUploadForm(forms.Form):
             raise forms.ValidationError('File size must be less than 10MB.')
 
         # Check file extension
-        file_name = file.name.lower()
-        allowed_extensions = ['.csv', '.xlsx', '.xls', '.pdf']
+        extension = os.path.splitext(file.name)[1].lower()
 
-        if not any(file_name.endswith(ext) for ext in allowed_extensions):
+        if extension not in _ALLOWED_UPLOAD_EXTS:
             raise forms.ValidationError(
-                f'Unsupported file format. Please upload: {", ".join(allowed_extensions)}'
+                f'Unsupported file format. Please upload: {", ".join(_UPLOAD_EXTENSIONS)}'
             )
 
         return file
@@ -3,11 +3,90 @@ Django management command to fix transaction types based on description analysis
 """
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
-from moneymanager.apps.transactions.models import Transaction
+from moneymanager.apps.transactions.models import Account, Transaction
+from moneymanager.apps.budgets.services import update_budgets_for_transaction
 import logging
+import re
+
+# Hyperscan is optional; when installed both keyword lists are matched in a
+# single SIMD-accelerated pass per description instead of two regex searches
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Description keywords that suggest each transaction type
+EXPENSE_KEYWORDS = [
+    'payment', 'purchase', 'withdrawal', 'fee', 'charge', 'bill',
+    'transfer to', 'debit', 'atm', 'pos', 'shopping', 'fuel',
+    'electricity', 'water', 'rent', 'loan', 'emi', 'insurance',
+    'grocery', 'restaurant', 'medical', 'pharmacy', 'transport',
+    'uber', 'taxi', 'bus', 'train', 'flight', 'hotel'
+]
+
+INCOME_KEYWORDS = [
+    'salary', 'deposit', 'credit', 'refund', 'cashback', 'interest',
+    'dividend', 'bonus', 'transfer from', 'received', 'incoming',
+    'payroll', 'wage', 'freelance', 'commission', 'reimbursement'
+]
+
+# One case-insensitive alternation per list. Keywords match anywhere in the
+# description (no word boundaries), same as the original substring checks.
+EXPENSE_RE = re.compile('|'.join(map(re.escape, EXPENSE_KEYWORDS)), re.IGNORECASE)
+INCOME_RE = re.compile('|'.join(map(re.escape, INCOME_KEYWORDS)), re.IGNORECASE)
+
+# Descriptions shorter than the shortest keyword can never match
+MIN_KEYWORD_LENGTH = min(len(keyword) for keyword in EXPENSE_KEYWORDS + INCOME_KEYWORDS)
+
+EXPENSE_MATCH = 1
+INCOME_MATCH = 2
+
+_keyword_database = None
+
+
+def _get_keyword_database():
+    """Compile both keyword lists into one Hyperscan database (once)."""
+    global _keyword_database
+
+    if _keyword_database is None:
+        keywords = (
+            [(keyword, EXPENSE_MATCH) for keyword in EXPENSE_KEYWORDS] +
+            [(keyword, INCOME_MATCH) for keyword in INCOME_KEYWORDS]
+        )
+        database = hyperscan.Database()
+        # SINGLEMATCH reports each id at most once, so a scan makes at most
+        # two callbacks however many keywords appear in the description
+        database.compile(
+            expressions=[re.escape(keyword).encode() for keyword, _ in keywords],
+            ids=[match_id for _, match_id in keywords],
+            elements=len(keywords),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(keywords),
+        )
+        _keyword_database = database
+
+    return _keyword_database
+
+
+def _on_keyword_match(match_id, start, end, flags, context):
+    context[0] |= match_id
+
+
+def match_keywords(description):
+    """Return ``(is_likely_expense, is_likely_income)`` for a description."""
+    if not HYPERSCAN_AVAILABLE:
+        return bool(EXPENSE_RE.search(description)), bool(INCOME_RE.search(description))
+
+    matched = [0]
+    _get_keyword_database().scan(
+        description.encode('utf-8'),
+        match_event_handler=_on_keyword_match,
+        context=matched,
+    )
+    return bool(matched[0] & EXPENSE_MATCH), bool(matched[0] & INCOME_MATCH)
+
 
 class Command(BaseCommand):
     help = 'Analyze and fix transaction types based on description keywords'
@@ -32,93 +111,105 @@ class Command(BaseCommand):
             self.style.SUCCESS('Starting transaction type analysis...')
         )
 
-        # Define keyword lists
-        expense_keywords = [
-            'payment', 'purchase', 'withdrawal', 'fee', 'charge', 'bill', 
-            'transfer to', 'debit', 'atm', 'pos', 'shopping', 'fuel',
-            'electricity', 'water', 'rent', 'loan', 'emi', 'insurance',
-            'grocery', 'restaurant', 'medical', 'pharmacy', 'transport',
-            'uber', 'taxi', 'bus', 'train', 'flight', 'hotel'
-        ]
-        
-        income_keywords = [
-            'salary', 'deposit', 'credit', 'refund', 'cashback', 'interest',
-            'dividend', 'bonus', 'transfer from', 'received', 'incoming',
-            'payroll', 'wage', 'freelance', 'commission', 'reimbursement'
-        ]
-
-        # Get transactions to analyze
-        queryset = Transaction.objects.filter(is_active=True)
+        # Get transactions to analyze, loading only what the analysis reads
+        queryset = Transaction.objects.filter(is_active=True).select_related(None).only(
+            'id', 'description', 'transaction_type', 'date', 'account', 'user', 'family_group'
+        )
         if user_id:
             queryset = queryset.filter(user_id=user_id)
 
-        total_transactions = queryset.count()
         changes_made = 0
         changes_to_make = []
+        analyzed = 0
+
+        self.stdout.write('Analyzing transactions...')
+
+        # A row can only change to a type it doesn't already have, so each
+        # keyword check runs over its own pre-filtered candidate set
+        expense_candidates = queryset.exclude(transaction_type='expense')
+        income_candidates = queryset.exclude(transaction_type='income')
+
+        for trans in expense_candidates.iterator(chunk_size=2000):
+            analyzed += 1
+            description = trans.description
+            if not description or len(description) < MIN_KEYWORD_LENGTH:
+                continue
+
+            is_likely_expense, is_likely_income = match_keywords(description)
+            if is_likely_expense and not is_likely_income:
+                changes_to_make.append(self._build_change(trans, 'expense'))
+
+        for trans in income_candidates.iterator(chunk_size=2000):
+            # Rows that are neither expense nor income (transfers) were
+            # already counted in the expense pass
+            if trans.transaction_type == 'expense':
+                analyzed += 1
+            description = trans.description
+            if not description or len(description) < MIN_KEYWORD_LENGTH:
+                continue
+
+            is_likely_expense, is_likely_income = match_keywords(description)
+            if is_likely_income and not is_likely_expense:
+                changes_to_make.append(self._build_change(trans, 'income'))
 
-        self.stdout.write(f'Analyzing {total_transactions} transactions...')
-
-        for trans in queryset:
-            description_lower = trans.description.lower()
-            current_type = trans.transaction_type
-            suggested_type = None
-
-            # Check for expense indicators
-            is_likely_expense = any(keyword in description_lower for keyword in expense_keywords)
-            is_likely_income = any(keyword in description_lower for keyword in income_keywords)
-
-            if is_likely_expense and not is_likely_income and current_type != 'expense':
-                suggested_type = 'expense'
-            elif is_likely_income and not is_likely_expense and current_type != 'income':
-                suggested_type = 'income'
-
-            if suggested_type and suggested_type != current_type:
-                changes_to_make.append({
-                    'transaction': trans,
-                    'current_type': current_type,
-                    'suggested_type': suggested_type,
-                    'description': trans.description[:50]
-                })
+        self.stdout.write(
+            f'Analyzed {analyzed} candidate transactions; {len(changes_to_make)} need fixes.'
+        )
 
         if changes_to_make:
             self.stdout.write(
                 self.style.WARNING(f'Found {len(changes_to_make)} transactions that could be corrected:')
             )
 
-            for change in changes_to_make[:10]:  # Show first 10
-                self.stdout.write(
-                    f"  {change['transaction'].date} | {change['description']} | "
-                    f"{change['current_type']} → {change['suggested_type']}"
-                )
+            preview_lines = [
+                f"  {change['transaction'].date} | {change['description']} | "
+                f"{change['current_type']} → {change['suggested_type']}"
+                for change in changes_to_make[:10]  # Show first 10
+            ]
 
             if len(changes_to_make) > 10:
-                self.stdout.write(f"  ... and {len(changes_to_make) - 10} more")
+                preview_lines.append(f"  ... and {len(changes_to_make) - 10} more")
+
+            self.stdout.write('\n'.join(preview_lines))
 
             if not dry_run:
                 confirm = input("\nDo you want to apply these changes? (y/N): ")
                 if confirm.lower() == 'y':
+                    # One UPDATE per target type; balances are recalculated
+                    # below, so the per-row save() and its signals are skipped
                     with transaction.atomic():
-                        for change in changes_to_make:
-                            trans = change['transaction']
-                            trans.transaction_type = change['suggested_type']
-                            trans.save(update_fields=['transaction_type'])
-                            changes_made += 1
+                        for suggested_type in ('expense', 'income'):
+                            transaction_ids = [
+                                change['transaction'].pk for change in changes_to_make
+                                if change['suggested_type'] == suggested_type
+                            ]
+                            if transaction_ids:
+                                changes_made += Transaction.objects.filter(
+                                    pk__in=transaction_ids
+                                ).update(transaction_type=suggested_type)
 
                     self.stdout.write(
                         self.style.SUCCESS(f'Successfully updated {changes_made} transactions!')
                     )
 
                     # Update account balances
-                    affected_accounts = set()
-                    for change in changes_to_make:
-                        affected_accounts.add(change['transaction'].account)
-
-                    for account in affected_accounts:
-                        account.update_balance()
+                    affected_account_ids = {
+                        change['transaction'].account_id for change in changes_to_make
+                    }
+                    Account.update_balances(affected_account_ids)
 
                     self.stdout.write(
-                        self.style.SUCCESS(f'Updated balances for {len(affected_accounts)} accounts')
+                        self.style.SUCCESS(f'Updated balances for {len(affected_account_ids)} accounts')
                     )
+
+                    # Budgets only depend on scope and date, refresh each once
+                    budget_scopes = {}
+                    for change in changes_to_make:
+                        trans = change['transaction']
+                        scope = (trans.family_group_id, trans.user_id, trans.date)
+                        budget_scopes.setdefault(scope, trans)
+                    for trans in budget_scopes.values():
+                        update_budgets_for_transaction(trans)
                 else:
                     self.stdout.write('Operation cancelled.')
             else:
@@ -128,4 +219,13 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS('No transaction type corrections needed!')
-            )
\ No newline at end of file
+            )
+
+    def _build_change(self, trans, suggested_type):
+        """Describe a proposed type change for a transaction."""
+        return {
+            'transaction': trans,
+            'current_type': trans.transaction_type,
+            'suggested_type': suggested_type,
+            'description': trans.description[:50]
+        }
@@ -1,6 +1,5 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
-from django.db import transaction
 from moneymanager.apps.transactions.models import RecurringTransaction
 import logging
 
@@ -24,83 +23,79 @@ class Command(BaseCommand):
             self.stdout.write(
                 self.style.WARNING('DRY RUN MODE - No transactions will be created')
             )
+            self._list_due_recurring_transactions()
+            return
+
+        # Shared with the Celery task; claims rows with SKIP LOCKED so it can
+        # run alongside the scheduled task without generating a period twice
+        try:
+            created_count = RecurringTransaction.process_due_recurring()
+        except Exception as e:
+            logger.error(f'Error processing recurring transactions: {str(e)}')
+            self.stdout.write(
+                self.style.ERROR(f'Error processing recurring transactions: {str(e)}')
+            )
+            return
+
+        if not created_count:
+            self.stdout.write(
+                self.style.SUCCESS('No recurring transactions are due today')
+            )
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Created {created_count} recurring transactions')
+        )
 
+    def _list_due_recurring_transactions(self):
+        """Print every transaction a real run would create, without writing anything."""
         today = timezone.now().date()
 
-        # Get all active recurring transactions that are due
-        due_recurring_transactions = RecurringTransaction.objects.filter(
-            is_active=True,
-            next_due_date__lte=today
-        ).select_related('account', 'category', 'user', 'family_group')
+        due_recurring_transactions = list(
+            RecurringTransaction.objects.filter(
+                is_active=True,
+                next_due_date__lte=today
+            ).only(
+                'id', 'name', 'description', 'amount', 'frequency',
+                'next_due_date', 'end_date', 'is_active',
+            )
+        )
 
-        if not due_recurring_transactions.exists():
+        if not due_recurring_transactions:
             self.stdout.write(
                 self.style.SUCCESS('No recurring transactions are due today')
             )
             return
 
         processed_count = 0
-        error_count = 0
+        dry_run_lines = []
 
         for recurring_transaction in due_recurring_transactions:
-            try:
-                # Check if end date has passed
-                if (recurring_transaction.end_date and
-                    recurring_transaction.next_due_date > recurring_transaction.end_date):
-
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'Recurring transaction {recurring_transaction.name} has ended'
-                        )
-                    )
-                    continue
-
-                if not dry_run:
-                    with transaction.atomic():
-                        new_transaction = recurring_transaction.generate_next_transaction()
-
-                        if new_transaction:
-                            processed_count += 1
-                            self.stdout.write(
-                                self.style.SUCCESS(
-                                    f'Created transaction: {new_transaction.description} '
-                                    f'for ${new_transaction.amount}'
-                                )
-                            )
-                        else:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f'Failed to create transaction for: {recurring_transaction.name}'
-                                )
-                            )
-                else:
-                    # Dry run mode
-                    self.stdout.write(
-                        f'Would create: {recurring_transaction.description} '
-                        f'for ${recurring_transaction.amount} on {recurring_transaction.next_due_date}'
-                    )
-                    processed_count += 1
+            # Check if end date has passed
+            if (recurring_transaction.end_date and
+                recurring_transaction.next_due_date > recurring_transaction.end_date):
 
-            except Exception as e:
-                error_count += 1
-                logger.error(
-                    f'Error processing recurring transaction {recurring_transaction.id}: {str(e)}'
-                )
                 self.stdout.write(
-                    self.style.ERROR(
-                        f'Error processing {recurring_transaction.name}: {str(e)}'
+                    self.style.WARNING(
+                        f'Recurring transaction {recurring_transaction.name} has ended'
                     )
                 )
-
-        if not dry_run:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'Processed {processed_count} recurring transactions with {error_count} errors'
+                continue
+
+            # The same schedule walk the real run uses, so every missed
+            # period up to today is listed
+            for due_date in recurring_transaction.due_dates(today):
+                dry_run_lines.append(
+                    f'Would create: {recurring_transaction.description} '
+                    f'for ${recurring_transaction.amount} on {due_date}'
                 )
+                processed_count += 1
+
+        if dry_run_lines:
+            self.stdout.write('\n'.join(dry_run_lines))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Would create {processed_count} recurring transactions'
             )
-        else:
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f'Would process {processed_count} recurring transactions'
-                )
-            )
\ No newline at end of file
+        )
@@ -2,20 +2,39 @@
 
 from django.db import migrations
 
+# Rows updated per statement, keeps each UPDATE (and its row locks) short
+BATCH_SIZE = 5000
+
+
+def _update_currency_in_batches(Account, from_currency, to_currency):
+    """Move accounts from one currency to another in primary-key batches."""
+    while True:
+        batch_ids = list(
+            Account.objects.filter(currency=from_currency)
+            .values_list('pk', flat=True)[:BATCH_SIZE]
+        )
+        if not batch_ids:
+            break
+        Account.objects.filter(pk__in=batch_ids).update(currency=to_currency)
+
 
 def update_existing_accounts_currency(apps, schema_editor):
     """Update existing accounts' currency from USD to INR"""
     Account = apps.get_model('transactions', 'Account')
-    Account.objects.filter(currency='USD').update(currency='INR')
+    _update_currency_in_batches(Account, 'USD', 'INR')
 
 
 def reverse_update_accounts_currency(apps, schema_editor):
     """Reverse migration: update currency back from INR to USD"""
     Account = apps.get_model('transactions', 'Account')
-    Account.objects.filter(currency='INR').update(currency='USD')
+    _update_currency_in_batches(Account, 'INR', 'USD')
 
 
 class Migration(migrations.Migration):
+    # Let each batch commit on its own instead of holding every row lock
+    # until the whole migration finishes
+    atomic = False
+
     dependencies = [
         ('transactions', '0002_update_currency_to_inr'),
     ]
@@ -25,4 +44,4 @@ class Migration(migrations.Migration):
             update_existing_accounts_currency,
             reverse_update_accounts_currency,
         ),
-    ]
\ No newline at end of file
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.0.14 on 2026-10-17 05:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('transactions', '0003_migrate_existing_currency_data'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account', 'is_active', 'transaction_type'], name='txn_acct_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['to_account', 'transaction_type', 'is_active'], name='txn_to_acct_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['from_account', 'transaction_type', 'is_active'], name='txn_from_acct_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-date'], name='txn_user_date_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-17 05:58
+
+import django.db.models.expressions
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('transactions', '0004_transaction_balance_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='income_expense_signed',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(then=models.F('amount'), transaction_type='income'), models.When(then=django.db.models.expressions.CombinedExpression(models.F('amount'), '*', models.Value(-1)), transaction_type='expense'), default=models.Value(Decimal('0'))), output_field=models.DecimalField(decimal_places=2, max_digits=12)),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['account', 'is_active', 'income_expense_signed'], name='txn_acct_signed_idx'),
+        ),
+    ]
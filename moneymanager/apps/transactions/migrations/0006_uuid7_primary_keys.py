@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:00
+
+import moneymanager.apps.core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0005_transaction_income_expense_signed'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='id',
+            field=models.UUIDField(default=moneymanager.apps.core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='recurringtransaction',
+            name='id',
+            field=models.UUIDField(default=moneymanager.apps.core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='id',
+            field=models.UUIDField(default=moneymanager.apps.core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
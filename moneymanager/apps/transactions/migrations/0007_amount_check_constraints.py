@@ -0,0 +1,25 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:01
+
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('transactions', '0006_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='recurringtransaction',
+            constraint=models.CheckConstraint(check=models.Q(('amount__gte', Decimal('0.01'))), name='recurring_amount_gte_min', violation_error_message='Ensure the amount is at least 0.01.'),
+        ),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.CheckConstraint(check=models.Q(('amount__gte', Decimal('0.01'))), name='txn_amount_gte_min', violation_error_message='Ensure the amount is at least 0.01.'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0007_amount_check_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='transactions', through='transactions.TransactionTagRelation', to='transactions.transactiontag'),
+        ),
+        migrations.AddIndex(
+            model_name='transactiontagrelation',
+            index=models.Index(fields=['tag', 'transaction'], name='txn_tag_transaction_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:05
+
+from django.db import migrations
+
+from moneymanager.apps.transactions.db_triggers import (
+    create_updated_at_triggers,
+    drop_updated_at_triggers,
+)
+
+
+def create_triggers(apps, schema_editor):
+    create_updated_at_triggers(schema_editor.connection)
+
+
+def drop_triggers(apps, schema_editor):
+    drop_updated_at_triggers(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0008_transaction_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
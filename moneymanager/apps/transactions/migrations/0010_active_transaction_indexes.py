@@ -0,0 +1,28 @@
+# Generated by Django 5.0.14 on 2026-10-17 06:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('transactions', '0009_updated_at_triggers'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['account'], name='active_txn_by_acct'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['to_account'], name='active_txn_by_to_acct'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['from_account'], name='active_txn_by_from_acct'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.14 on 2026-10-17 07:22
+
+from django.db import migrations, models
+from django.db.models import Case, DecimalField, F, Sum, When
+
+# Accounts written per bulk_update statement
+BATCH_SIZE = 500
+
+
+def set_opening_balances(apps, schema_editor):
+    """
+    Derive each account's opening balance from its stored balance.
+
+    The opening balance is whatever the stored balance holds beyond the net
+    effect of the active transactions, so current balances are unchanged.
+    """
+    Account = apps.get_model('transactions', 'Account')
+    Transaction = apps.get_model('transactions', 'Transaction')
+
+    # Same expression as Account._balance_sum()
+    totals = dict(
+        Transaction.objects.filter(is_active=True)
+        .values('account_id')
+        .annotate(balance=Sum(Case(
+            When(transaction_type='transfer', to_account=F('account'), then=F('amount')),
+            When(transaction_type='transfer', from_account=F('account'), then=-F('amount')),
+            default=F('income_expense_signed'),
+            output_field=DecimalField(max_digits=12, decimal_places=2)
+        )))
+        .order_by()
+        .values_list('account_id', 'balance')
+    )
+
+    accounts = []
+    for account in Account.objects.only('pk', 'current_balance').iterator():
+        account.opening_balance = account.current_balance - (totals.get(account.pk) or 0)
+        accounts.append(account)
+    Account.objects.bulk_update(accounts, ['opening_balance'], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('transactions', '0010_active_transaction_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='opening_balance',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.RunPython(set_opening_balances, migrations.RunPython.noop),
+    ]
@@ -1,12 +1,93 @@
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.core.validators import MinValueValidator
+from collections import Counter
+from contextlib import contextmanager
+from datetime import timedelta
+from dateutil.relativedelta import relativedelta
 from decimal import Decimal
-import uuid
+import logging
+import threading
 
-from moneymanager.apps.core.models import TimeStampedModel, FamilyGroup, Category
+from moneymanager.apps.budgets.services import update_budgets_for_transaction
+from moneymanager.apps.core.models import TimeStampedModel, FamilyGroup, Category, uuid7
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
+
+# How far each recurring frequency advances a due date
+_FREQ_STEP = {
+    'daily': lambda d: d + timedelta(days=1),
+    'weekly': lambda d: d + timedelta(weeks=1),
+    'biweekly': lambda d: d + timedelta(weeks=2),
+    'monthly': lambda d: d + relativedelta(months=1),
+    'quarterly': lambda d: d + relativedelta(months=3),
+    'semi_annually': lambda d: d + relativedelta(months=6),
+    'annually': lambda d: d + relativedelta(years=1),
+}
+
+
+# Account ids collected by an active deferred_balance_updates() block
+_balance_deferral = threading.local()
+
+
+def _deferred_account_ids():
+    """Return the set collecting account ids for deferred updates, or None."""
+    return getattr(_balance_deferral, 'account_ids', None)
+
+
+@contextmanager
+def deferred_balance_updates():
+    """
+    Coalesce balance work for transactions saved or deleted inside the block.
+
+    Rather than adjusting balances row by row, the affected account ids are
+    collected and recalculated together with Account.update_balances() once
+    the surrounding database transaction commits. Nested blocks share the
+    outermost block's set.
+    """
+    from django.db import transaction as db_transaction
+
+    account_ids = _deferred_account_ids()
+    if account_ids is not None:
+        yield account_ids
+        return
+
+    account_ids = set()
+    _balance_deferral.account_ids = account_ids
+    try:
+        yield account_ids
+    finally:
+        _balance_deferral.account_ids = None
+
+    if account_ids:
+        db_transaction.on_commit(lambda: Account.update_balances(account_ids))
+
+
+def _balance_effect(amount, transaction_type, account_id, to_account_id=None,
+                    from_account_id=None, is_active=True):
+    """
+    Signed amount a transaction contributes to its own account's balance.
+
+    Mirrors Account.transactions_balance(): only active rows count, income adds,
+    expenses subtract and transfers add or subtract by direction.
+    """
+    if not is_active or amount is None:
+        return Decimal('0')
+
+    amount = Decimal(str(amount))
+    if transaction_type == 'income':
+        return amount
+    if transaction_type == 'expense':
+        return -amount
+    if transaction_type == 'transfer':
+        effect = Decimal('0')
+        if to_account_id == account_id:
+            effect += amount
+        if from_account_id == account_id:
+            effect -= amount
+        return effect
+    return Decimal('0')
 
 
 class Account(TimeStampedModel):
@@ -20,13 +101,17 @@ class Account(TimeStampedModel):
         ('cash', 'Cash'),
         ('other', 'Other'),
     ]
+    ACCOUNT_TYPE_LABELS = dict(ACCOUNT_TYPES)
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100)
     account_type = models.CharField(max_length=20, choices=ACCOUNT_TYPES)
     bank_name = models.CharField(max_length=100, blank=True)
     account_number = models.CharField(max_length=50, blank=True)
+    # Stored balance: adjusted by transaction deltas, reconciled by update_balance()
+    # as opening_balance plus the net effect of the active transactions
     current_balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    opening_balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     currency = models.CharField(max_length=3, default='INR')
     is_active = models.BooleanField(default=True)
     include_in_totals = models.BooleanField(default=True)
@@ -44,35 +129,128 @@ class Account(TimeStampedModel):
         ordering = ['name']
 
     def __str__(self):
-        return f"{self.name} ({self.get_account_type_display()})"
+        # Plain dict lookup; get_account_type_display() scans the choices list
+        label = self.ACCOUNT_TYPE_LABELS.get(self.account_type, self.account_type)
+        return f"{self.name} ({label})"
 
     def update_balance(self):
-        """Update account balance based on transactions."""
-        from django.db.models import Sum, Q
+        """
+        Update account balance based on the opening balance and transactions.
+
+        The balance is written with a plain UPDATE, so no save signals fire.
+        """
+        self.current_balance = self.opening_balance + self.transactions_balance()
+        type(self).objects.filter(pk=self.pk).update(current_balance=self.current_balance)
+
+    def transactions_balance(self):
+        """Net effect of this account's active transactions on its balance."""
+        if self._state.adding:
+            return Decimal('0')
+
+        # Calculate balance from transactions in a single aggregate query
+        totals = self.transactions.filter(is_active=True).aggregate(
+            balance=self._balance_sum()
+        )
+        return totals['balance'] or Decimal('0')
+
+    @staticmethod
+    def _balance_sum():
+        """
+        Sum of each active transaction's signed effect on its own account.
+
+        Income and expenses are pre-signed in income_expense_signed; a transfer
+        row is netted in the same pass by comparing its direction with ``account``.
+        """
+        from django.db.models import Case, DecimalField, F, Sum, When
+
+        return Sum(Case(
+            When(transaction_type='transfer', to_account=F('account'), then=F('amount')),
+            When(transaction_type='transfer', from_account=F('account'), then=-F('amount')),
+            default=F('income_expense_signed'),
+            output_field=DecimalField(max_digits=12, decimal_places=2)
+        ))
+
+    @classmethod
+    def apply_balance_deltas(cls, deltas):
+        """
+        Adjust balances in place by ``{account_id: delta}`` amounts.
+
+        Each adjustment is a single atomic ``current_balance + delta`` UPDATE,
+        so nothing is re-aggregated. update_balance() remains the way to
+        reconcile an account against its full transaction history.
+        """
+        from django.db.models import F
+
+        for account_id, delta in deltas.items():
+            if account_id and delta:
+                cls.objects.filter(pk=account_id).update(
+                    current_balance=F('current_balance') + delta
+                )
+
+    @classmethod
+    def update_balances(cls, account_ids):
+        """
+        Recalculate balances for several accounts at once.
+
+        Produces the same result as calling update_balance() on each account,
+        but with one grouped aggregate query and one UPDATE statement.
+        """
+        from django.db.models import Case, DecimalField, F, Value, When
+
+        account_ids = set(account_ids)
+        if not account_ids:
+            return
+
+        amount_field = DecimalField(max_digits=12, decimal_places=2)
+        balances = Transaction.objects.filter(
+            account_id__in=account_ids,
+            is_active=True
+        ).values('account_id').annotate(balance=cls._balance_sum()).order_by()
+
+        whens = [
+            When(pk=row['account_id'],
+                 then=F('opening_balance') + Value(row['balance'], output_field=amount_field))
+            for row in balances
+        ]
+        # Accounts without active transactions fall back to the opening balance
+        cls.objects.filter(pk__in=account_ids).update(
+            current_balance=Case(*whens, default=F('opening_balance'), output_field=amount_field)
+        )
+
+
+class TransactionQuerySet(models.QuerySet):
+    """QuerySet helpers for transactions."""
 
-        # Calculate balance from transactions
-        transactions = self.transactions.filter(is_active=True)
+    # Wide columns that list pages never display
+    heavy_fields = ('notes', 'receipt', 'external_id', 'imported_from')
 
-        income = transactions.filter(
-            transaction_type='income'
-        ).aggregate(total=Sum('amount'))['total'] or 0
+    def lightweight(self):
+        """Skip loading the wide columns listings don't render."""
+        return self.defer(*self.heavy_fields)
 
-        expenses = transactions.filter(
-            transaction_type='expense'
-        ).aggregate(total=Sum('amount'))['total'] or 0
+    def with_tags(self):
+        """Prefetch tags in one extra query."""
+        return self.prefetch_related('tags')
 
-        transfers_in = transactions.filter(
-            transaction_type='transfer',
-            to_account=self
-        ).aggregate(total=Sum('amount'))['total'] or 0
 
-        transfers_out = transactions.filter(
-            transaction_type='transfer',
-            from_account=self
-        ).aggregate(total=Sum('amount'))['total'] or 0
+class TransactionManager(models.Manager):
+    """Default manager that joins the single-valued relations used by listings."""
+
+    related_fields = (
+        'category', 'account', 'to_account', 'from_account',
+        'user', 'family_group', 'recurring_transaction',
+    )
+
+    def get_queryset(self):
+        return TransactionQuerySet(self.model, using=self._db).select_related(
+            *self.related_fields
+        )
+
+    def with_tags(self):
+        return self.get_queryset().with_tags()
 
-        self.current_balance = income - expenses + transfers_in - transfers_out
-        self.save(update_fields=['current_balance'])
+    def lightweight(self):
+        return self.get_queryset().lightweight()
 
 
 class Transaction(TimeStampedModel):
@@ -82,8 +260,9 @@ class Transaction(TimeStampedModel):
         ('expense', 'Expense'),
         ('transfer', 'Transfer'),
     ]
+    TRANSACTION_TYPE_LABELS = dict(TRANSACTION_TYPES)
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     amount = models.DecimalField(
         max_digits=12,
         decimal_places=2,
@@ -132,11 +311,30 @@ class Transaction(TimeStampedModel):
         related_name='generated_transactions'
     )
     is_active = models.BooleanField(default=True)
+    tags = models.ManyToManyField(
+        'TransactionTag',
+        through='TransactionTagRelation',
+        blank=True,
+        related_name='transactions'
+    )
 
     # Import tracking
     imported_from = models.CharField(max_length=50, blank=True)
     external_id = models.CharField(max_length=100, blank=True)
 
+    # Income as +amount, expenses as -amount, transfers as 0; kept by the database
+    income_expense_signed = models.GeneratedField(
+        expression=models.Case(
+            models.When(transaction_type='income', then=models.F('amount')),
+            models.When(transaction_type='expense', then=-models.F('amount')),
+            default=models.Value(Decimal('0')),
+        ),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+    )
+
+    objects = TransactionManager()
+
     class Meta:
         db_table = 'transactions_transaction'
         ordering = ['-date', '-created_at']
@@ -145,24 +343,103 @@ class Transaction(TimeStampedModel):
             models.Index(fields=['transaction_type']),
             models.Index(fields=['user']),
             models.Index(fields=['family_group']),
+            # Match the filters used by Account.update_balance()
+            models.Index(fields=['account', 'is_active', 'transaction_type'],
+                         name='txn_acct_type_idx'),
+            models.Index(fields=['to_account', 'transaction_type', 'is_active'],
+                         name='txn_to_acct_type_idx'),
+            models.Index(fields=['from_account', 'transaction_type', 'is_active'],
+                         name='txn_from_acct_type_idx'),
+            # Serve per-user listings in the default ordering
+            models.Index(fields=['user', '-date'], name='txn_user_date_idx'),
+            # Lets balance sums read income_expense_signed from the index alone
+            models.Index(fields=['account', 'is_active', 'income_expense_signed'],
+                         name='txn_acct_signed_idx'),
+            # Inactive rows are tombstones; keep them out of the per-account lookups
+            models.Index(fields=['account'], condition=models.Q(is_active=True),
+                         name='active_txn_by_acct'),
+            models.Index(fields=['to_account'], condition=models.Q(is_active=True),
+                         name='active_txn_by_to_acct'),
+            models.Index(fields=['from_account'], condition=models.Q(is_active=True),
+                         name='active_txn_by_from_acct'),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(amount__gte=Decimal('0.01')),
+                name='txn_amount_gte_min',
+                violation_error_message='Ensure the amount is at least 0.01.'
+            ),
         ]
 
     def __str__(self):
-        return f"{self.get_transaction_type_display()}: {self.description} - ₹{self.amount}"
+        label = self.TRANSACTION_TYPE_LABELS.get(self.transaction_type, self.transaction_type)
+        return f"{label}: {self.description} - ₹{self.amount}"
 
     def save(self, *args, **kwargs):
-        # Set family group from account if not set
-        if not self.family_group and self.account:
-            self.family_group = self.account.family_group
+        # Set family group from account if not set, without loading the account
+        if not self.family_group_id and self.account_id:
+            if Transaction.account.is_cached(self):
+                self.family_group_id = self.account.family_group_id
+            else:
+                self.family_group_id = Account.objects.filter(
+                    pk=self.account_id
+                ).values_list('family_group_id', flat=True).first()
 
         # Don't trigger signals if we're in the middle of a bulk operation
         skip_signals = kwargs.pop('skip_signals', False)
 
+        deferred_account_ids = _deferred_account_ids()
+
+        # Remember what the stored row contributed before it is overwritten
+        previous = None
+        if not skip_signals and not self._state.adding:
+            previous = Transaction.objects.filter(pk=self.pk).values(
+                'amount', 'transaction_type', 'account_id',
+                'to_account_id', 'from_account_id', 'is_active'
+            ).first()
+
         super().save(*args, **kwargs)
 
-        # Account balance update is handled by signals unless explicitly skipped
-        if not skip_signals and self.account:
-            self.account.update_balance()
+        if skip_signals:
+            return
+
+        if deferred_account_ids is not None:
+            # Recalculated once when the deferred_balance_updates() block ends
+            if previous:
+                deferred_account_ids.add(previous['account_id'])
+            if self.account_id:
+                deferred_account_ids.add(self.account_id)
+        else:
+            # Apply only the change in this row's contribution to the balance
+            # instead of re-aggregating the account's whole history
+            deltas = Counter()
+            if previous:
+                deltas[previous['account_id']] -= _balance_effect(**previous)
+            if self.account_id:
+                deltas[self.account_id] += self.balance_effect()
+            Account.apply_balance_deltas(deltas)
+
+    def validate_before_save(self):
+        """
+        Raise ValueError for a row the pre_save signal would reject.
+
+        bulk_create() skips pre_save, so bulk insert paths call this per row.
+        """
+        if not self.amount or self.amount <= 0:
+            raise ValueError("Transaction amount must be positive")
+
+        if self.transaction_type == 'transfer':
+            if not self.to_account_id:
+                raise ValueError("Transfer transactions must have a to_account")
+            if self.account_id == self.to_account_id:
+                raise ValueError("Cannot transfer to the same account")
+
+    def balance_effect(self):
+        """Signed amount this transaction contributes to its account's balance."""
+        return _balance_effect(
+            self.amount, self.transaction_type, self.account_id,
+            self.to_account_id, self.from_account_id, self.is_active
+        )
 
 
 class RecurringTransaction(TimeStampedModel):
@@ -176,8 +453,9 @@ class RecurringTransaction(TimeStampedModel):
         ('semi_annually', 'Semi-annually'),
         ('annually', 'Annually'),
     ]
+    FREQUENCY_LABELS = dict(FREQUENCY_CHOICES)
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     name = models.CharField(max_length=100)
     amount = models.DecimalField(
         max_digits=12,
@@ -207,54 +485,187 @@ class RecurringTransaction(TimeStampedModel):
     class Meta:
         db_table = 'transactions_recurring_transaction'
         ordering = ['next_due_date']
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(amount__gte=Decimal('0.01')),
+                name='recurring_amount_gte_min',
+                violation_error_message='Ensure the amount is at least 0.01.'
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.name} - {self.get_frequency_display()}"
+        label = self.FREQUENCY_LABELS.get(self.frequency, self.frequency)
+        return f"{self.name} - {label}"
 
-    def generate_next_transaction(self):
-        """Generate the next transaction for this recurring transaction."""
-        from datetime import timedelta
-        from dateutil.relativedelta import relativedelta
+    def build_next_transaction(self):
+        """
+        Build the next transaction for this recurring transaction without saving it.
 
+        Returns a ``(transaction, next_due_date)`` tuple. ``transaction`` is None
+        when the recurring transaction is inactive or has ended.
+        """
         if not self.is_active:
-            return None
+            return None, self.next_due_date
 
         if self.end_date and self.next_due_date > self.end_date:
-            return None
+            return None, self.next_due_date
 
-        # Create the transaction
-        transaction = Transaction.objects.create(
+        # Foreign keys are copied by id so building doesn't fetch related rows
+        transaction = Transaction(
             amount=self.amount,
             description=self.description,
             transaction_type=self.transaction_type,
-            category=self.category,
+            category_id=self.category_id,
             account=self.account,
             date=self.next_due_date,
-            user=self.user,
-            family_group=self.family_group,
+            user_id=self.user_id,
+            family_group_id=self.family_group_id or self.account.family_group_id,
             is_recurring=True,
             recurring_transaction=self
         )
 
-        # Calculate next due date
-        if self.frequency == 'daily':
-            self.next_due_date += timedelta(days=1)
-        elif self.frequency == 'weekly':
-            self.next_due_date += timedelta(weeks=1)
-        elif self.frequency == 'biweekly':
-            self.next_due_date += timedelta(weeks=2)
-        elif self.frequency == 'monthly':
-            self.next_due_date += relativedelta(months=1)
-        elif self.frequency == 'quarterly':
-            self.next_due_date += relativedelta(months=3)
-        elif self.frequency == 'semi_annually':
-            self.next_due_date += relativedelta(months=6)
-        elif self.frequency == 'annually':
-            self.next_due_date += relativedelta(years=1)
+        # Transfers debit their own account; the pre_save signal sets this
+        # on save(), but generate_due_transactions() inserts with bulk_create
+        if transaction.transaction_type == 'transfer':
+            transaction.from_account_id = transaction.account_id
+
+        return transaction, self._get_following_due_date(self.next_due_date)
+
+    def generate_next_transaction(self):
+        """Generate the next transaction for this recurring transaction."""
+        transaction, next_due_date = self.build_next_transaction()
+        if transaction is None:
+            return None
 
+        transaction.save()
+
+        self.next_due_date = next_due_date
         self.save(update_fields=['next_due_date'])
         return transaction
 
+    def due_dates(self, until=None):
+        """
+        Return the dates generate_due_transactions() would create transactions for.
+
+        Walks the schedule from next_due_date up to ``until`` (today by
+        default), stopping at end_date, without touching the database.
+        """
+        from django.utils import timezone
+
+        until = until or timezone.now().date()
+
+        dates = []
+        if not self.is_active:
+            return dates
+
+        due_date = self.next_due_date
+        while due_date <= until:
+            if self.end_date and due_date > self.end_date:
+                break
+            following_due_date = self._get_following_due_date(due_date)
+            if following_due_date == due_date:
+                break
+            dates.append(due_date)
+            due_date = following_due_date
+        return dates
+
+    def generate_due_transactions(self, until=None):
+        """
+        Generate every transaction that has fallen due up to ``until`` (today by default).
+
+        Catching up several missed periods inserts all of them with one
+        bulk_create and adjusts the account balance once. Returns the list of
+        created transactions.
+        """
+        from django.db import transaction as db_transaction
+
+        due_dates = self.due_dates(until)
+        if not due_dates:
+            return []
+
+        transactions = []
+        for due_date in due_dates:
+            self.next_due_date = due_date
+            transactions.append(self.build_next_transaction()[0])
+        next_due_date = self._get_following_due_date(due_dates[-1])
+        self.next_due_date = next_due_date
+
+        # bulk_create skips the pre_save checks. Recurring transactions have
+        # no to_account, so a recurring transfer is rejected here before any
+        # row is inserted or the balance moves
+        for new_transaction in transactions:
+            new_transaction.validate_before_save()
+
+        with db_transaction.atomic():
+            Transaction.objects.bulk_create(transactions, batch_size=500)
+            RecurringTransaction.objects.filter(pk=self.pk).update(next_due_date=next_due_date)
+
+            # bulk_create skips Transaction.save(), so apply the balance change here
+            Account.apply_balance_deltas({
+                self.account_id: sum(t.balance_effect() for t in transactions)
+            })
+
+        if self.transaction_type == 'expense':
+            update_budgets_for_transaction(transactions[0], until=transactions[-1].date)
+
+        return transactions
+
+    @classmethod
+    def process_due_recurring(cls, until=None, batch_size=100):
+        """
+        Generate due transactions for every active recurring transaction.
+
+        Work is claimed in batches with SELECT ... FOR UPDATE SKIP LOCKED, so
+        several workers can run this at once without blocking each other or
+        generating the same period twice. Each recurring transaction runs in
+        its own savepoint; one that fails is logged and left due without
+        holding up the rest. Returns the number of transactions created.
+        """
+        from django.db import connection, transaction as db_transaction
+        from django.utils import timezone
+
+        until = until or timezone.now().date()
+        lock_kwargs = {'skip_locked': True}
+        if connection.features.has_select_for_update_of:
+            # Lock only the recurring rows, not the joined accounts
+            lock_kwargs['of'] = ('self',)
+
+        due = (
+            cls.objects.select_related('account')
+            .filter(is_active=True, next_due_date__lte=until)
+            .filter(models.Q(end_date__isnull=True) |
+                    models.Q(end_date__gte=models.F('next_due_date')))
+            .order_by('pk')
+        )
+
+        created_count = 0
+        last_pk = None
+        while True:
+            with db_transaction.atomic():
+                # Page forward by primary key, so rows that failed or were
+                # handled earlier in this run are not claimed again
+                page = due if last_pk is None else due.filter(pk__gt=last_pk)
+                batch = list(page.select_for_update(**lock_kwargs)[:batch_size])
+                if not batch:
+                    break
+
+                for recurring in batch:
+                    last_pk = recurring.pk
+                    try:
+                        with db_transaction.atomic():
+                            created_count += len(recurring.generate_due_transactions(until))
+                    except Exception as e:
+                        logger.error(
+                            f'Error processing recurring transaction {recurring.pk}: {str(e)}'
+                        )
+
+        return created_count
+
+    def _get_following_due_date(self, due_date):
+        """Return the due date that follows ``due_date`` for this frequency."""
+        step = _FREQ_STEP.get(self.frequency)
+        return step(due_date) if step else due_date
+
 
 class TransactionTag(TimeStampedModel):
     """Tags for transactions."""
@@ -284,4 +695,8 @@ class TransactionTagRelation(models.Model):
 
     class Meta:
         db_table = 'transactions_transaction_tags'
-        unique_together = ['transaction', 'tag']
\ No newline at end of file
+        unique_together = ['transaction', 'tag']
+        indexes = [
+            # Serve "transactions with tag X" lookups; the unique index leads with transaction
+            models.Index(fields=['tag', 'transaction'], name='txn_tag_transaction_idx'),
+        ]
\ No newline at end of file
@@ -3,22 +3,34 @@ Services for transaction import/export and bulk operations.
 """
 import csv
 import io
+import os
 import openpyxl
 import logging
 import re
 import PyPDF2
-from datetime import datetime
+from collections import Counter
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Iterable, List, Tuple, Optional
 from django.db import transaction
 from django.contrib.auth import get_user_model
 from .models import Account, Transaction
+from .signals import _clear_transaction_caches
+from ..budgets.services import update_budgets_for_transaction
 from ..core.models import Category
 
+# PyMuPDF extracts text in compiled MuPDF; PyPDF2 stays as the fallback
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 # Import modular bank analyzers
 try:
     import sys
-    import os
     # Add the project root to Python path
     project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     sys.path.insert(0, project_root)
@@ -31,29 +43,589 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
+# PDF parsing patterns, compiled once at import
+_PDF_DATE_RES = tuple(re.compile(pattern) for pattern in (
+    r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',  # MM/DD/YYYY or DD/MM/YYYY
+    r'\b(\d{4}-\d{1,2}-\d{1,2})\b',           # YYYY-MM-DD
+    r'\b(\d{1,2}\s+\w{3}\s+\d{4})\b',         # DD MMM YYYY
+    r'\b(\w{3}\s+\d{1,2},?\s+\d{4})\b'        # MMM DD, YYYY
+))
+
+_PDF_AMOUNT_RES = tuple(re.compile(pattern) for pattern in (
+    r'[-+]?\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # Currency with commas
+    r'[-+]?\s*(\d+\.\d{2})',                          # Decimal amounts
+    r'\((\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\)',          # Parentheses for negative
+))
+
+# Any line carrying a two-decimal amount
+_AMOUNT_LINE_RE = re.compile(r'\d+\.\d{2}')
+
+# Statement date labels, tried in order by _extract_statement_date
+_STATEMENT_DATE_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Date of Issue\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'Statement Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'Generated on\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'Transaction Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})',  # Date range
+    r'As on\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
+))
+_SLASH_DATE_RE = re.compile(r'\b(\d{1,2}/\d{1,2}/\d{4})\b')
+# Statement dates sit in the first page header
+_STATEMENT_HEADER_CHARS = 8192
+
+# Drops thousands separators and the sign from a statement amount
+_UNSIGNED_AMOUNT_TABLE = str.maketrans('', '', ',-')
+
+
+def _unsigned_amount(amount_str: str) -> str:
+    """Strip separators and sign from a statement amount in a single pass."""
+    return amount_str.translate(_UNSIGNED_AMOUNT_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def _amount_in_paise(amount_str: str) -> int:
+    """Parse a statement amount into whole paise so thresholds compare as ints."""
+    rupees, _, paise = amount_str.replace(',', '').partition('.')
+    return int(rupees or '0') * 100 + int((paise + '00')[:2])
+
+
+# Separators and currency symbols dropped from a parsed PDF amount
+_PARSED_AMOUNT_TABLE = str.maketrans('', '', ',$₹')
+
+
+# Shared pieces of the bank statement parsers
+_REF_NUMBER_RE = re.compile(r'\d{8,}')
+_WHITESPACE_RE = re.compile(r'\s+')
+_STATEMENT_AMOUNT_RE = re.compile(r'([\d,]+\.\d{2})')
+_SIGNED_STATEMENT_AMOUNT_RE = re.compile(r'(-?[\d,]+\.\d{2})')
+
+
+def _clean_description(description: str, strip_refs: bool = True) -> str:
+    """Drop reference numbers from a statement narration and collapse its whitespace."""
+    if strip_refs:
+        description = _REF_NUMBER_RE.sub('', description)
+    return _WHITESPACE_RE.sub(' ', description).strip()
+
+
+# Bank name/IFSC indicators and their weights for _detect_bank_type; strong
+# indicators get higher scores
+_BANK_INDICATORS = {
+    'FEDERAL': (
+        ('federal bank limited', 5),
+        ('federal bank', 3),
+        ('federal towers', 4),
+        ('fdrl', 3),
+        ('fdrlinbb', 4)
+    ),
+    'SBI': (
+        ('state bank of india', 5),
+        ('sbin0020312', 4),  # Specific IFSC from the PDF
+        ('state bank', 3),
+        ('sbi', 2),
+        ('sbin0', 3)
+    ),
+    'HDFC': (
+        ('hdfc bank limited', 5),
+        ('housing development finance corporation', 5),
+        ('hdfc bank', 4),
+        ('hdfc0', 3)
+    ),
+    'AXIS': (
+        ('axis bank limited', 5),
+        ('axis account no', 4),
+        ('statement of axis account', 5),
+        ('axis bank', 4),
+        ('utib0004080', 4),  # Specific IFSC from the PDF
+        ('utib', 3)
+    ),
+}
+# Context bonuses for _detect_bank_type: the first rule whose phrases all
+# appear adds its bonus to that bank
+_BANK_CONTEXT_RULES = (
+    ('AXIS', ('statement of axis account',), 10),
+    ('SBI', ('state bank of india', 'account number'), 8),
+    ('HDFC', ('hdfc bank', 'statement'), 8),
+    ('FEDERAL', ('federal bank', 'statement'), 8),
+)
+# Most each bank's indicators can add to its score
+_BANK_INDICATOR_TOTALS = {
+    bank: sum(score for _, score in indicators)
+    for bank, indicators in _BANK_INDICATORS.items()
+}
+
+# Federal Bank: "22-MAY-2023 22-MAY-2023 IFN/..." opens a transaction whose
+# amounts follow on a "... TFR S123 1,000.00 5,000.00 Cr" line
+_FEDERAL_DATE_DESC_RE = re.compile(r'^(\d{1,2}-[A-Z]{3}-\d{4})\s+\d{1,2}-[A-Z]{3}-\d{4}\s+(.+)$')
+# Federal Bank header/footer phrases, matched against the lowercased line
+_FEDERAL_BANK_SKIP_RE = re.compile('|'.join(map(re.escape, (
+    'federal bank', 'corporate office', 'statement of account', 'opening balance',
+    'grand total', 'abbreviations', 'disclaimer', 'page ', 'name :',
+    'communication address', 'ifsc', 'micr', 'swift',
+))))
+_FEDERAL_BANK_TXN_RES = (
+    re.compile(r'^(.+?TFR\s+[A-Z0-9]+)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)\s*(.*)$', re.IGNORECASE),
+)
+
+# SBI header/footer phrases, matched against the lowercased line
+_SBI_SKIP_RE = re.compile('|'.join(map(re.escape, (
+    'state bank of india', 'account name', 'account number', 'branch', 'ifsc code',
+    'micr code', 'customer id', 'nominee registered', 'date credit balance details',
+    'ref no./cheque no', 'debit', 'drawing power', 'interest rate', 'address', 'cif no',
+    'ckyc no',
+))))
+# SBI, in _parse_sbi_transactions' pattern order
+_SBI_TXN_RES = tuple(re.compile(pattern) for pattern in (
+    # Pattern 1: Amount - Date Description Balance
+    r'^(\d+\.?\d*)\s*-\s*(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$',
+    # Pattern 2: - Amount Date Description Balance
+    r'^-\s+(\d+\.?\d*)\s+(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$',
+    # Pattern 3: Date Description Amount Balance
+    r'^(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+(\d+\.?\d*)\s+([\d,]+\.?\d*)\s*$'
+))
+# SBI narrations of outgoing money, matched against the lowercased narration;
+# pattern 1 rows carry their direction in the narration, pattern 3 rows may
+# also just say withdrawal or debit
+_SBI_TRANSFER_OUT_RE = re.compile(r'transfer to|upi/dr')
+_SBI_DEBIT_RE = re.compile(r'transfer to|upi/dr|withdrawal|debit')
+
+class _RowPatterns:
+    """
+    A bank's ``^``-anchored row patterns joined into one alternation.
+
+    One scan finds the first pattern that matches a line; if the caller
+    rejects that match, the later patterns are tried one by one, exactly as
+    when each pattern was searched in turn.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self._alternatives = {}
+        bodies = []
+        group_index = 1
+        for pattern_num, pattern in enumerate(patterns, 1):
+            # Each alternative is wrapped in an outer group, which closes last
+            # and so becomes the match's lastindex
+            self._alternatives[group_index] = pattern_num
+            bodies.append(f'({pattern.pattern[1:]})')
+            group_index += pattern.groups + 1
+        self._union = re.compile('^(?:' + '|'.join(bodies) + ')', patterns[0].flags)
+
+    def iter_matches(self, line: str):
+        """Yield ``(pattern_num, groups)`` for each pattern matching ``line``, in order."""
+        match = self._union.match(line)
+        if match is None:
+            return
+        outer = match.lastindex
+        pattern_num = self._alternatives[outer]
+        yield pattern_num, match.groups()[outer:outer + self.patterns[pattern_num - 1].groups]
+        for later_num in range(pattern_num + 1, len(self.patterns) + 1):
+            later = self.patterns[later_num - 1].match(line)
+            if later:
+                yield later_num, later.groups()
+
+
+# HDFC, in _parse_hdfc_transactions' pattern order
+_HDFC_TXN_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Pattern 1: Full HDFC format - DD/MM/YY Description RefNo DD/MM/YY Amount Balance
+    r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+(\d{10,})\s+\d{2}/\d{2}/\d{2}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
+    # Pattern 2: DD/MM/YY or DD/MM/YYYY simple format with two amounts (transaction amount and balance)
+    r'^(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
+    # Pattern 3: With reference number between description and amounts, amount may be negative
+    # (also covers the UPI-/ATM/ATW/POS narrations)
+    r'^(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+(\d{8,})\s+(-?[\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
+    # Pattern 4: Date + Description + single negative amount + balance (common HDFC format)
+    r'^(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+(-?[\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
+    # Pattern 5: ATM/EAW transactions with specific format (captures missing June 27th transaction)
+    r'^(\d{2}/\d{2}/\d{2,4})\s+(EAW-|ATW-|ATM-)(.+?)\s+(\d{8,})\s+\d{2}/\d{2}/\d{2,4}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})',
+    # Pattern 6: Flexible date at start - capture everything and parse amounts
+    r'^(\d{2}/\d{2}/\d{2,4})\s+(.+)$'
+))
+# A hand-written splitter for patterns 1 and 2 was tried in front of this
+# and measured no faster: the anchored union already settles a row in a
+# few microseconds, so the regexes stay the single source of truth
+_HDFC_ROWS = _RowPatterns(_HDFC_TXN_RES)
+# HDFC page-number lines and header/footer phrases, matched against the
+# lowercased, stripped line; kept specific so they don't catch transaction
+# narrations
+_HDFC_SKIP_RE = re.compile(r'^page\s+no|' + '|'.join(map(re.escape, (
+    'hdfc bank', 'housing development finance', 'statement of account', 'account number:',
+    'branch:', 'customer name:', 'ifsc code:', 'opening balance', 'closing balance',
+    'generated on:', 'cheque no', 'ref no', 'value dt', 'withdrawal amt', 'deposit amt',
+    'this is a computer generated', 'contents of this statement', 'mr ', 'joint holders',
+    'nomination', 'address', 'city', 'state', 'phone no', 'email', 'cust id',
+    'account status', 'rtgs/neft ifsc',
+))))
+_HDFC_DATE_RE = re.compile(r'(\d{2}/\d{2}/\d{2,4})')
+# Dates, amounts and reference numbers, removed from a fallback line in one pass
+_HDFC_STRIP_RE = re.compile(r'\d{2}/\d{2}/\d{2,4}|[\d,]+\.\d{2}|\d{8,}')
+
+# HDFC description classifiers, matched against the lowercased narration.
+# Each side is one alternation of strong indicator phrases and company or
+# merchant patterns, so a narration is scanned once per side
+_HDFC_INCOME_RE = re.compile('|'.join(
+    [re.escape(phrase) for phrase in (
+        'interest paid', 'salary', 'wage', 'dividend', 'bonus', 'refund',
+        'cashback', 'commission', 'reversal', 'credit interest'
+    )]
+    + [f'(?:{pattern})' for pattern in (
+        # Company payments (legitimate income sources)
+        r'\b(software|tech|technologies|solutions|systems|consulting|services)\s+(p\s*l|pvt\s*ltd)',
+        r'\b[a-z0-9]+\s*(software|tech|solutions|systems|services)\b',
+        r'\b(microsoft|google|amazon|apple|oracle|sap)\b(?!.*\b(recharge|payment|purchase)\b)'
+    )]
+))
+_HDFC_EXPENSE_RE = re.compile('|'.join(
+    [re.escape(phrase) for phrase in (
+        'atw-', 'atm-', 'eaw-', 'pos ', 'nwd-', 'withdrawal', 'purchase',
+        'bill payment', 'recharge', 'fee', 'charge', 'emi', 'loan'
+    )]
+    + [f'(?:{pattern})' for pattern in (
+        # Merchant/service payments (always expense)
+        r'\b(zomato|swiggy|uber|ola|rapido|amazon|flipkart|myntra|nykaa)\b',
+        r'\b(airtel|jio|vodafone)\b.*\brecharge\b',
+        r'\bgoogle.*\brecharge\b'
+    )]
+))
+# Narration hints for large and medium HDFC amounts without a strong indicator
+_HDFC_PAYMENT_RE = re.compile(r'payment|purchase|bill')
+_HDFC_SHOP_RE = re.compile(r'store|mart|shop|restaurant')
+
+# Axis Bank header/footer phrases, matched against the lowercased line
+_AXIS_SKIP_RE = re.compile('|'.join(map(re.escape, (
+    'axis bank', 'statement of account', 'account number:', 'joint holder', 'customer id',
+    'customer name:', 'branch:', 'ifsc code:', 'micr code:', 'registered mobile',
+    'registered email', 'scheme :', 'ckyc number', 'nominee', 'opening balance',
+    'closing balance', 'statement summary', 'transaction codes', 'end of statement',
+    'request from:', 'this is a system generated', 'please contact the branch',
+))))
+# Axis Bank: DD-MM-YYYYDESCRIPTION  AMOUNT  BALANCE BRANCH
+_AXIS_TXN_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Main pattern: DD-MM-YYYY + Description + Amount + Balance + Branch
+    r'^(\d{2}-\d{2}-\d{4})(.+?)\s+(\d[\d,]*\.\d{2})\s+(\d[\d,]*\.\d{2})\s+(\d+)\s*$',
+    # Alternative pattern with debit amount at end
+    r'^(\d{2}-\d{2}-\d{4})(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+\d+\s*$'
+))
+_AXIS_ROWS = _RowPatterns(_AXIS_TXN_RES)
+
+# Statements from banks without a dedicated parser
+_GENERIC_TXN_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Pattern for date + description + amount + Dr/Cr
+    r'^(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\s+(.+?)\s+([\d,]+\.\d{2})\s+(Dr|Cr|DR|CR)',
+    # Pattern for transactions with balance
+    r'^(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Dr|Cr|DR|CR)'
+))
+# Uppercased Dr/Cr markers that make a generic row an expense
+_GENERIC_DEBIT_MARKERS = frozenset({'DR', 'DEBIT'})
+
+# Federal Bank single-line format read by _parse_federal_transactions;
+# skip phrases are matched against the lowercased line
+_FEDERAL_SKIP_RE = re.compile('|'.join(map(re.escape, (
+    'federal bank', 'corporate office', 'prakhya venkata', 'branch name',
+    'customer id', 'swift code', 'currency', 'date value date',
+    'particulars', 'withdrawals', 'deposits', 'balance',
+    'abbreviations used', 'grand total',
+))))
+_FEDERAL_TXN_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    # Pattern 1: DD-MMM-YYYY DD-MMM-YYYY Description TFR SXXXXXXXX Amount Balance Cr/Dr
+    r'^(\d{2}-[A-Z]{3}-\d{4})\s+(\d{2}-[A-Z]{3}-\d{4})\s+(.+?)TFR\s+S\d+\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)$',
+    # Pattern 2: UPI transactions
+    r'^(\d{2}-[A-Z]{3}-\d{4})\s+(\d{2}-[A-Z]{3}-\d{4})\s+(UPI\s+IN|UPI\s*OUT).+?TFR\s+S\d+\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)$'
+))
+_FEDERAL_ROWS = _RowPatterns(_FEDERAL_TXN_RES)
+_FEDERAL_DATE_RE = re.compile(r'\b(\d{1,2}-[A-Z]{3}-\d{4})\b')
+
+# Axis Bank date shapes and the strptime format for each, in priority order
+_AXIS_DATE_SHAPES = (
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{2}'), '%d-%b-%y', 'DD-MMM-YY'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{2}'), '%d/%m/%y', 'DD/MM/YY'),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4}'), '%d-%m-%Y', 'DD-MM-YYYY'),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), '%d/%m/%Y', 'DD/MM/YYYY'),
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}'), '%d-%b-%Y', 'DD-MMM-YYYY'),
+)
+
+# SBI date shapes for _convert_sbi_date
+_SBI_SHORT_DATE_RE = re.compile(r'\d{2}-\d{2}-\d{2}')
+_SBI_MONTH_DATE_RE = re.compile(r'\d{1,2} [A-Za-z]{3} \d{4}')
+_SBI_UPPER_MONTH_DATE_RE = re.compile(r'\d{1,2} [A-Z]{3} \d{4}')
+
+# Date shapes _extract_transaction_dates looks for in the whole text
+_TRANSACTION_DATE_RES = tuple(re.compile(pattern) for pattern in (
+    r'\b(\d{1,2}/\d{1,2}/\d{4})\b',
+    r'\b(\d{4}-\d{1,2}-\d{1,2})\b',
+    r'\b(\d{1,2}-\d{1,2}-\d{4})\b'
+))
+
+# Any dated line with an amount, for _flexible_pdf_parsing
+_FLEXIBLE_DATE_RE = re.compile(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})')
+_FLEXIBLE_AMOUNT_RE = re.compile(r'(\d{1,3}(?:,\d{3})*\.\d{2})')
+# Explicit credit/debit markers, matched against the lowercased line
+_CREDIT_MARKER_RE = re.compile(r'\b(cr|credit|\+)\b')
+_DEBIT_MARKER_RE = re.compile(r'\b(dr|debit|\-)\b')
+
+# Everything that is not a letter or digit, stripped to count readable text
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+# Words that mark text as coming from a bank statement
+_BANK_INDICATOR_RE = re.compile(
+    r'statement|account|balance|transaction|debit|credit', re.IGNORECASE
+)
+
+# Strips currency symbols and thousands separators and turns "(5)" into "-5"
+_AMOUNT_TABLE = str.maketrans({'$': None, '₹': None, ',': None, '(': '-', ')': None})
+
+
+# Transaction types an imported row may declare
+_IMPORT_TRANSACTION_TYPES = frozenset({'income', 'expense'})
+
+# Rows per multi-row INSERT when imported transactions are bulk created
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+def _batched(iterable, size: int):
+    """Yield lists of up to ``size`` items, like itertools.batched on Python 3.12."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _clean_amount(amount_str: str) -> str:
+    """Normalise an imported amount string in a single pass."""
+    return amount_str.translate(_AMOUNT_TABLE)
+
+
+# Date formats accepted by _parse_date, in priority order.
+# YYYY-MM-DD first for converted dates, then DD/MM/YYYY for original formats
+_DATE_FORMATS = (
+    '%Y-%m-%d',        # For converted dates (HDFC, SBI, Axis)
+    '%d/%m/%Y',        # DD/MM/YYYY format (Federal Bank, original HDFC)
+    '%d/%m/%y',        # DD/MM/YY format (HDFC 2-digit year)
+    '%Y-%m-%d %H:%M:%S',  # With timestamp
+    '%m/%d/%Y',        # MM/DD/YYYY format (US style)
+    '%d-%m-%Y',        # DD-MM-YYYY format
+    '%d %b %Y',        # DD MMM YYYY format (SBI)
+    '%d-%b-%Y'         # DD-MMM-YYYY format
+)
+
+# Shape of a date string -> the only formats from _DATE_FORMATS it can match
+_DATE_SHAPES = (
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), ('%Y-%m-%d',)),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{4}'), ('%d/%m/%Y', '%m/%d/%Y')),
+    (re.compile(r'\d{1,2}/\d{1,2}/\d{2}'), ('%d/%m/%y',)),
+    (re.compile(r'\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}'), ('%Y-%m-%d %H:%M:%S',)),
+    (re.compile(r'\d{1,2}-\d{1,2}-\d{4}'), ('%d-%m-%Y',)),
+    (re.compile(r'\d{1,2} [A-Za-z]{3} \d{4}'), ('%d %b %Y',)),
+    (re.compile(r'\d{1,2}-[A-Za-z]{3}-\d{4}'), ('%d-%b-%Y',)),
+)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_string(date_str: str):
+    """
+    Parse a stripped date string against _DATE_FORMATS.
+
+    Statements repeat the same few dates on many rows, so results are cached
+    and each distinct string is only parsed once.
+    """
+    logger.debug(f"Parsing date string: '{date_str}'")
+
+    if len(date_str) == 10:
+        # Fast path for already-normalised ISO dates, parsed in C
+        if date_str[4] == '-' and date_str[7] == '-':
+            try:
+                return date.fromisoformat(date_str)
+            except ValueError:
+                pass
+
+        # Zero-padded DD/MM/YYYY, the usual Indian bank format
+        elif date_str[2] == '/' and date_str[5] == '/':
+            try:
+                return date(int(date_str[6:]), int(date_str[3:5]), int(date_str[:2]))
+            except ValueError:
+                pass
+
+    # Only try the formats the string's shape can match
+    for shape_re, shape_formats in _DATE_SHAPES:
+        if shape_re.fullmatch(date_str):
+            for date_format in shape_formats:
+                try:
+                    return datetime.strptime(date_str, date_format).date()
+                except ValueError:
+                    continue
+            break
+
+    # Unusual spacing or padding: fall back to trying every format
+    for date_format in _DATE_FORMATS:
+        try:
+            parsed_date = datetime.strptime(date_str, date_format).date()
+            logger.debug(f"Successfully parsed '{date_str}' using format '{date_format}' -> {parsed_date}")
+            return parsed_date
+        except ValueError:
+            continue
+
+    # If no format worked, log the issue with more details
+    logger.error(f"Failed to parse date: '{date_str}' using any known format")
+    logger.error(f"Attempted formats: {list(_DATE_FORMATS)}")
+    return None
+
+
+# English month abbreviations, as statements print them
+_MONTH_ABBR = {
+    'JAN': 1, 'FEB': 2, 'MAR': 3, 'APR': 4, 'MAY': 5, 'JUN': 6,
+    'JUL': 7, 'AUG': 8, 'SEP': 9, 'OCT': 10, 'NOV': 11, 'DEC': 12,
+}
+
+
+def _ascii_digits(value: str, min_len: int, max_len: int) -> bool:
+    return min_len <= len(value) <= max_len and value.isascii() and value.isdigit()
+
+
+def _sliced_date(date_str: str, sep: str, named_month: bool, year_digits: int) -> Optional[date]:
+    """
+    Parse a ``D<sep>M<sep>Y`` date by splitting it, without strptime.
+
+    Accepts what the matching strptime format would (``%d``, ``%m`` or
+    ``%b``, and ``%y`` or ``%Y``); returns None for anything else so the
+    caller can fall back to its strptime handling.
+    """
+    day, _, rest = date_str.partition(sep)
+    month, _, year = rest.partition(sep)
+    if not _ascii_digits(day, 1, 2) or not _ascii_digits(year, year_digits, year_digits):
+        return None
+    if named_month:
+        month_num = _MONTH_ABBR.get(month.upper())
+    else:
+        month_num = int(month) if _ascii_digits(month, 1, 2) else None
+    if not month_num:
+        return None
+
+    year_num = int(year)
+    if year_digits == 2:
+        # strptime's %y pivot
+        year_num += 1900 if year_num >= 69 else 2000
+    elif year_num < 1000:
+        # strftime doesn't zero-pad these; leave them to the strptime path
+        return None
+    try:
+        return date(year_num, month_num, int(day))
+    except ValueError:
+        return None
+
+
+# Bank-specific date converters, memoised like _parse_date_string since a
+# statement repeats a handful of dates across all of its rows
+@lru_cache(maxsize=512)
+def _convert_federal_date_string(federal_date: str) -> str:
+    """Convert Federal Bank date format (22-MAY-2023) to DD/MM/YYYY."""
+    parsed = _sliced_date(federal_date, '-', True, 4)
+    if parsed:
+        return f'{parsed.day:02d}/{parsed.month:02d}/{parsed.year}'
+
+    try:
+        # Parse DD-MMM-YYYY and convert to DD/MM/YYYY
+        date_obj = datetime.strptime(federal_date, '%d-%b-%Y')
+        return date_obj.strftime('%d/%m/%Y')
+    except ValueError:
+        logger.error(f"Failed to parse Federal Bank date: {federal_date}")
+        return federal_date
+
+
+@lru_cache(maxsize=512)
+def _convert_sbi_date_string(date_str: str) -> str:
+    """Convert a stripped SBI date (DD MMM YYYY) to YYYY-MM-DD."""
+    parsed = _sliced_date(date_str, ' ', True, 4) or _sliced_date(date_str, '-', True, 4)
+    if parsed:
+        return parsed.isoformat()
+
+    try:
+        # SBI format from PDF: "01 JUN 2024"
+        dt_obj = datetime.strptime(date_str, '%d %b %Y')
+        formatted_date = dt_obj.strftime('%Y-%m-%d')
+        logger.debug(f"SBI date conversion: '{date_str}' -> '{formatted_date}'")
+        return formatted_date
+    except ValueError as e:
+        logger.error(f"Error converting SBI date format2 '{date_str}': {e}")
+        # Try alternative SBI formats
+        try:
+            # Try DD-MMM-YYYY format
+            dt_obj = datetime.strptime(date_str, '%d-%b-%Y')
+            return dt_obj.strftime('%Y-%m-%d')
+        except ValueError:
+            logger.error(f"Could not parse SBI date in any known format: '{date_str}'")
+            return date_str
+
+
+@lru_cache(maxsize=512)
+def _convert_hdfc_date_string(date_str: str) -> str:
+    """Convert a stripped HDFC date to YYYY-MM-DD, or None if no format fits."""
+    logger.debug(f"Converting HDFC date: '{date_str}'")
+
+    # Slice the usual shapes directly, switching on the delimiter the same
+    # way the strptime chain below does; anything unusual falls through to it
+    if '/' in date_str:
+        year_digits = len(date_str.rpartition('/')[2])
+        parsed = _sliced_date(date_str, '/', False, year_digits) if year_digits in (2, 4) else None
+    elif '-' in date_str:
+        parsed = _sliced_date(date_str, '-', True, 4)
+    else:
+        parsed = _sliced_date(date_str, ' ', True, 4)
+    if parsed:
+        return parsed.isoformat()
+
+    try:
+        # Handle DD/MM/YYYY format (like "01/06/2024")
+        if '/' in date_str and len(date_str.split('/')[2]) == 4:
+            dt_obj = datetime.strptime(date_str, "%d/%m/%Y")
+            formatted_date = dt_obj.strftime("%Y-%m-%d")
+            logger.debug(f"HDFC 4-digit year: '{date_str}' -> '{formatted_date}'")
+            return formatted_date
+
+        # Handle DD/MM/YY format (like "01/06/24") - most common HDFC format
+        elif '/' in date_str and len(date_str.split('/')[2]) == 2:
+            dt_obj = datetime.strptime(date_str, '%d/%m/%y')
+            formatted_date = dt_obj.strftime('%Y-%m-%d')
+            logger.debug(f"HDFC 2-digit year: '{date_str}' -> '{formatted_date}'")
+            return formatted_date
+
+        # Handle DD-MMM-YYYY format (like "01-JUN-2024") 
+        elif '-' in date_str and len(date_str.split('-')) == 3:
+            dt_obj = datetime.strptime(date_str, "%d-%b-%Y")
+            formatted_date = dt_obj.strftime('%Y-%m-%d')
+            logger.debug(f"HDFC month name format: '{date_str}' -> '{formatted_date}'")
+            return formatted_date
+
+        # Handle DD MMM YYYY format (like "01 JUN 2024")
+        elif ' ' in date_str and len(date_str.split(' ')) == 3:
+            dt_obj = datetime.strptime(date_str, "%d %b %Y")
+            formatted_date = dt_obj.strftime('%Y-%m-%d')
+            logger.debug(f"HDFC space-separated format: '{date_str}' -> '{formatted_date}'")
+            return formatted_date
+
+    except ValueError as e:
+        logger.error(f"Error parsing HDFC date '{date_str}': {str(e)}")
+    except Exception as e:
+        logger.error(f"Unexpected error parsing HDFC date '{date_str}': {str(e)}")
+
+    # If all parsing fails, return None to indicate failure
+    logger.warning(f"Could not parse HDFC date format: '{date_str}', all formats failed")
+    return None
+
 
 class TransactionImportService:
     """Service for importing transactions from various file formats."""
 
     def __init__(self):
-        self.supported_formats = ['.csv', '.xlsx', '.xls', '.pdf']
+        # File extension -> importer
+        self.importers = {
+            '.csv': self._import_csv,
+            '.xlsx': self._import_excel,
+            '.xls': self._import_excel,
+            '.pdf': self._import_pdf,
+        }
+        self.supported_formats = list(self.importers)
         self.required_columns = ['date', 'description', 'amount', 'type']
         self.date_formats = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']
 
-        # PDF parsing patterns
-        self.pdf_date_patterns = [
-            r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',  # MM/DD/YYYY or DD/MM/YYYY
-            r'\b(\d{4}-\d{1,2}-\d{1,2})\b',           # YYYY-MM-DD
-            r'\b(\d{1,2}\s+\w{3}\s+\d{4})\b',         # DD MMM YYYY
-            r'\b(\w{3}\s+\d{1,2},?\s+\d{4})\b'        # MMM DD, YYYY
-        ]
-
-        self.pdf_amount_patterns = [
-            r'[-+]?\$?\s*(\d{1,3}(?:,\d{3})*(?:\.\d{2})?)',  # Currency with commas
-            r'[-+]?\s*(\d+\.\d{2})',                          # Decimal amounts
-            r'\((\d{1,3}(?:,\d{3})*(?:\.\d{2})?)\)',          # Parentheses for negative
-        ]
-
     def import_transactions(
         self,
         file,
@@ -65,6 +637,10 @@ class TransactionImportService:
         """
         Import transactions from a file.
 
+        Each call handles one upload on the calling thread. Parsing is pure
+        Python regex work that holds the GIL, so separate uploads are spread
+        across the server's request workers rather than a thread pool here.
+
         Args:
             file: Uploaded file object
             account: Account to associate transactions with
@@ -76,9 +652,8 @@ class TransactionImportService:
             Dict with success status, created count, and errors
         """
         try:
-            file_name = file.name.lower()
-
-            if not any(file_name.endswith(fmt) for fmt in self.supported_formats):
+            importer = self.importers.get(os.path.splitext(file.name)[1].lower())
+            if importer is None:
                 return {
                     'success': False,
                     'error': f'Unsupported file format. Supported formats: {", ".join(self.supported_formats)}',
@@ -86,20 +661,7 @@ class TransactionImportService:
                     'errors': []
                 }
 
-            # Parse file based on format
-            if file_name.endswith('.csv'):
-                return self._import_csv(file, account, user, family_group, has_header)
-            elif file_name.endswith(('.xlsx', '.xls')):
-                return self._import_excel(file, account, user, family_group, has_header)
-            elif file_name.endswith('.pdf'):
-                return self._import_pdf(file, account, user, family_group, has_header)
-            else:
-                return {
-                    'success': False,
-                    'error': 'Unsupported file format',
-                    'created_count': 0,
-                    'errors': []
-                }
+            return importer(file, account, user, family_group, has_header)
 
         except Exception as e:
             logger.error(f"Error importing transactions: {str(e)}")
@@ -109,6 +671,14 @@ class TransactionImportService:
                 'created_count': 0,
                 'errors': []
             }
+        finally:
+            # Dates are memoised for the length of one file; starting each
+            # import cold keeps unparseable dates logged for every upload
+            _parse_date_string.cache_clear()
+            _convert_federal_date_string.cache_clear()
+            _convert_sbi_date_string.cache_clear()
+            _convert_hdfc_date_string.cache_clear()
+            _amount_in_paise.cache_clear()
 
     def _import_csv(
         self,
@@ -123,11 +693,8 @@ class TransactionImportService:
         errors = []
 
         try:
-            # Read and decode file
-            file.seek(0)
-            decoded_file = file.read().decode('utf-8-sig')  # Handle BOM
-            io_string = io.StringIO(decoded_file)
-            reader = csv.reader(io_string)
+            # Decode the file lazily while reading rows
+            reader = csv.reader(self._iter_csv_text(file))
 
             # Skip header if present
             if has_header:
@@ -140,37 +707,18 @@ class TransactionImportService:
                         'errors': []
                     }
 
-            # Process rows in batches
-            batch_size = 100
-            transactions_to_create = []
-            row_num = 2 if has_header else 1
-
-            for row in reader:
-                try:
-                    parsed_transaction = self._parse_csv_row(
-                        row, row_num, account, user, family_group
-                    )
-                    if parsed_transaction:
-                        transactions_to_create.append(parsed_transaction)
-
-                    # Create batch when size reached
-                    if len(transactions_to_create) >= batch_size:
-                        created = self._create_transaction_batch(transactions_to_create)
-                        transactions_created += created
-                        transactions_to_create = []
-
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-
-                row_num += 1
+            # Rows are parsed as they are read and created in batches
+            parsed_rows = self._iter_parsed_rows(
+                reader, 2 if has_header else 1, errors, self._parse_csv_row,
+                account, user, family_group, {}
+            )
 
-            # Create remaining transactions
-            if transactions_to_create:
-                created = self._create_transaction_batch(transactions_to_create)
-                transactions_created += created
-
-            # Update account balance
-            account.update_balance()
+            # One transaction for the whole file; each batch runs in its own
+            # savepoint so a failed batch is rolled back on its own, and has
+            # already moved the account balance by what it inserted
+            with transaction.atomic():
+                for batch in _batched(parsed_rows, BULK_CREATE_BATCH_SIZE):
+                    transactions_created += self._create_transaction_batch(batch)
 
             return {
                 'success': True,
@@ -183,10 +731,24 @@ class TransactionImportService:
             return {
                 'success': False,
                 'error': str(e),
-                'created_count': transactions_created,
+                'created_count': 0,  # Rolled back with the file's transaction
                 'errors': errors
             }
 
+    def _iter_csv_text(self, file):
+        """
+        Yield lines of an uploaded CSV, decoding it in chunks as it is read.
+
+        utf-8-sig strips a leading BOM. The wrapper is detached afterwards so
+        the uploaded file isn't closed along with it.
+        """
+        file.seek(0)
+        text_stream = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        try:
+            yield from text_stream
+        finally:
+            text_stream.detach()
+
     def _import_excel(
         self,
         file,
@@ -200,50 +762,30 @@ class TransactionImportService:
         errors = []
 
         try:
-            # Load workbook
+            # Load workbook, reading cached cell values rather than formulas.
+            # Read-only mode keeps seeking within the zip, so hand it the
+            # bytes rather than the upload's temporary file
             file.seek(0)
-            wb = openpyxl.load_workbook(file, read_only=True)
+            wb = openpyxl.load_workbook(io.BytesIO(file.read()), read_only=True, data_only=True)
             ws = wb.active
 
             # Skip header if present
             start_row = 2 if has_header else 1
 
-            # Process rows in batches
-            batch_size = 100
-            transactions_to_create = []
-            row_num = start_row
-
-            for row in ws.iter_rows(min_row=start_row, values_only=True):
-                try:
-                    if not row or all(cell is None for cell in row):
-                        continue
-
-                    parsed_transaction = self._parse_excel_row(
-                        row, row_num, account, user, family_group
-                    )
-                    if parsed_transaction:
-                        transactions_to_create.append(parsed_transaction)
-
-                    # Create batch when size reached
-                    if len(transactions_to_create) >= batch_size:
-                        created = self._create_transaction_batch(transactions_to_create)
-                        transactions_created += created
-                        transactions_to_create = []
-
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-
-                row_num += 1
-
-            # Create remaining transactions
-            if transactions_to_create:
-                created = self._create_transaction_batch(transactions_to_create)
-                transactions_created += created
+            # Rows are parsed as they are read and created in batches
+            parsed_rows = self._iter_parsed_rows(
+                ws.iter_rows(min_row=start_row, values_only=True), start_row, errors,
+                self._parse_excel_row, account, user, family_group, {}
+            )
 
-            wb.close()
+            # One transaction for the whole file; each batch runs in its own
+            # savepoint so a failed batch is rolled back on its own, and has
+            # already moved the account balance by what it inserted
+            with transaction.atomic():
+                for batch in _batched(parsed_rows, BULK_CREATE_BATCH_SIZE):
+                    transactions_created += self._create_transaction_batch(batch)
 
-            # Update account balance
-            account.update_balance()
+                wb.close()
 
             return {
                 'success': True,
@@ -256,17 +798,32 @@ class TransactionImportService:
             return {
                 'success': False,
                 'error': str(e),
-                'created_count': transactions_created,
+                'created_count': 0,  # Rolled back with the file's transaction
                 'errors': errors
             }
 
+    def _iter_parsed_rows(self, rows, start: int, errors: List[str], parse_row, *args):
+        """
+        Yield the transaction data ``parse_row(row, row_num, *args)`` builds for
+        each row, skipping rows it rejects and recording rows that fail in ``errors``.
+        """
+        for row_num, row in enumerate(rows, start=start):
+            try:
+                parsed_transaction = parse_row(row, row_num, *args)
+            except Exception as e:
+                errors.append(f"Row {row_num}: {str(e)}")
+                continue
+            if parsed_transaction:
+                yield parsed_transaction
+
     def _parse_csv_row(
         self,
         row: List[str],
         row_num: int,
         account: Account,
         user,  # User model instance
-        family_group=None
+        family_group=None,
+        category_cache: Optional[Dict] = None
     ) -> Optional[Dict]:
         """Parse a single CSV row into transaction data."""
         if len(row) < 4:
@@ -278,7 +835,7 @@ class TransactionImportService:
         amount_str = row[2].strip() if row[2] else ''
         trans_type = row[3].strip().lower() if row[3] else ''
 
-        if not all([date_str, description, amount_str, trans_type]):
+        if not (date_str and description and amount_str and trans_type):
             raise ValueError("Missing required data")
 
         # Parse and validate date
@@ -288,47 +845,22 @@ class TransactionImportService:
 
         # Parse and validate amount
         try:
-            amount = Decimal(amount_str.replace('$', '').replace('₹', '').replace(',', '').replace('(', '-').replace(')', ''))
+            amount = Decimal(_clean_amount(amount_str))
             if amount <= 0:
                 raise ValueError("Amount must be positive")
         except (InvalidOperation, ValueError):
             raise ValueError(f"Invalid amount format: {amount_str}")
 
         # Validate transaction type
-        if trans_type not in ['income', 'expense']:
+        if trans_type not in _IMPORT_TRANSACTION_TYPES:
             raise ValueError(f"Invalid transaction type: {trans_type}")
 
         # Parse optional category
         category = None
         if len(row) > 4 and row[4] and row[4].strip():
-            category_name = row[4].strip()
-            try:
-                # Try to find existing category first
-                if family_group:
-                    category = Category.objects.filter(
-                        name__iexact=category_name,
-                        family_group=family_group,
-                        category_type=trans_type
-                    ).first()
-                else:
-                    category = Category.objects.filter(
-                        name__iexact=category_name,
-                        family_group__isnull=True,
-                        category_type=trans_type,
-                        is_system_category=False
-                    ).first()
-
-                # Create category if not found
-                if not category:
-                    category = Category.objects.create(
-                        name=category_name,
-                        category_type=trans_type,
-                        family_group=family_group,
-                        color='#007bff'
-                    )
-            except Exception as e:
-                logger.warning(f"Could not create category '{category_name}': {str(e)}")
-                category = None
+            category = self._resolve_category(
+                row[4].strip(), trans_type, family_group, category_cache
+            )
 
         return {
             'amount': amount,
@@ -348,19 +880,32 @@ class TransactionImportService:
         row_num: int,
         account: Account,
         user,  # User model instance
-        family_group=None
+        family_group=None,
+        category_cache: Optional[Dict] = None
     ) -> Optional[Dict]:
         """Parse a single Excel row into transaction data."""
-        if len(row) < 4:
+        if len(row) < 4 or all(cell is None for cell in row):
             return None
 
-        # Parse required fields
+        # Parse required fields; openpyxl already returns native Python types,
+        # so only non-string cells are converted
         date_cell = row[0]
-        description = str(row[1]).strip() if row[1] else ''
-        amount_str = str(row[2]).strip() if row[2] else ''
-        trans_type = str(row[3]).strip().lower() if row[3] else ''
+        if isinstance(row[1], str):
+            description = row[1].strip()
+        else:
+            description = str(row[1]) if row[1] else ''
 
-        if not all([date_cell, description, amount_str, trans_type]):
+        amount_cell = row[2]
+        numeric_amount = isinstance(amount_cell, (int, float, Decimal))
+        if not numeric_amount:
+            amount_cell = str(amount_cell).strip() if amount_cell else ''
+
+        if isinstance(row[3], str):
+            trans_type = row[3].strip().lower()
+        else:
+            trans_type = str(row[3]).lower() if row[3] else ''
+
+        if not (date_cell and description and amount_cell and trans_type):
             raise ValueError("Missing required data")
 
         # Parse date (handle both datetime and string)
@@ -373,14 +918,18 @@ class TransactionImportService:
 
         # Parse and validate amount
         try:
-            amount = Decimal(str(amount_str).replace('$', '').replace('₹', '').replace(',', '').replace('(', '-').replace(')', ''))
+            if numeric_amount:
+                # Numeric cells carry no currency symbols or separators
+                amount = Decimal(str(amount_cell))
+            else:
+                amount = Decimal(_clean_amount(amount_cell))
             if amount <= 0:
                 raise ValueError("Amount must be positive")
         except (InvalidOperation, ValueError):
-            raise ValueError(f"Invalid amount format: {amount_str}")
+            raise ValueError(f"Invalid amount format: {amount_cell}")
 
         # Validate transaction type
-        if trans_type not in ['income', 'expense']:
+        if trans_type not in _IMPORT_TRANSACTION_TYPES:
             raise ValueError(f"Invalid transaction type: {trans_type}")
 
         # Parse optional category (for Excel)
@@ -388,33 +937,9 @@ class TransactionImportService:
         if len(row) > 4 and row[4]:
             category_name = str(row[4]).strip()
             if category_name:
-                try:
-                    # Try to find existing category first
-                    if family_group:
-                        category = Category.objects.filter(
-                            name__iexact=category_name,
-                            family_group=family_group,
-                            category_type=trans_type
-                        ).first()
-                    else:
-                        category = Category.objects.filter(
-                            name__iexact=category_name,
-                            family_group__isnull=True,
-                            category_type=trans_type,
-                            is_system_category=False
-                        ).first()
-
-                    # Create category if not found
-                    if not category:
-                        category = Category.objects.create(
-                            name=category_name,
-                            category_type=trans_type,
-                            family_group=family_group,
-                            color='#007bff'
-                        )
-                except Exception as e:
-                    logger.warning(f"Could not create category '{category_name}': {str(e)}")
-                    category = None
+                category = self._resolve_category(
+                    category_name, trans_type, family_group, category_cache
+                )
 
         return {
             'amount': amount,
@@ -428,40 +953,62 @@ class TransactionImportService:
             'imported_from': 'excel_upload'
         }
 
+    def _resolve_category(
+        self,
+        category_name: str,
+        trans_type: str,
+        family_group=None,
+        category_cache: Optional[Dict] = None
+    ) -> Optional[Category]:
+        """
+        Find or create the category named in an imported row.
+
+        ``category_cache`` remembers results for the current import, so each
+        distinct name and type costs one lookup rather than one per row.
+        """
+        cache_key = (category_name.lower(), trans_type)
+        if category_cache is not None and cache_key in category_cache:
+            return category_cache[cache_key]
+
+        try:
+            # Try to find existing category first
+            if family_group:
+                category = Category.objects.filter(
+                    name__iexact=category_name,
+                    family_group=family_group,
+                    category_type=trans_type
+                ).first()
+            else:
+                category = Category.objects.filter(
+                    name__iexact=category_name,
+                    family_group__isnull=True,
+                    category_type=trans_type,
+                    is_system_category=False
+                ).first()
+
+            # Create category if not found
+            if not category:
+                category = Category.objects.create(
+                    name=category_name,
+                    category_type=trans_type,
+                    family_group=family_group,
+                    color='#007bff'
+                )
+        except Exception as e:
+            logger.warning(f"Could not create category '{category_name}': {str(e)}")
+            category = None
+
+        if category_cache is not None:
+            category_cache[cache_key] = category
+        return category
+
     def _parse_date(self, date_str: str):
         """Parse date string using multiple formats with bank-specific handling."""
         if not date_str:
             logger.error("Empty date string provided to _parse_date")
             return None
-            
-        date_str = date_str.strip()
-        logger.debug(f"Parsing date string: '{date_str}'")
-        
-        # Enhanced format list with bank-specific priorities
-        # YYYY-MM-DD first for converted dates, then DD/MM/YYYY for original formats
-        priority_formats = [
-            '%Y-%m-%d',        # For converted dates (HDFC, SBI, Axis)
-            '%d/%m/%Y',        # DD/MM/YYYY format (Federal Bank, original HDFC)
-            '%d/%m/%y',        # DD/MM/YY format (HDFC 2-digit year)
-            '%Y-%m-%d %H:%M:%S',  # With timestamp
-            '%m/%d/%Y',        # MM/DD/YYYY format (US style)
-            '%d-%m-%Y',        # DD-MM-YYYY format
-            '%d %b %Y',        # DD MMM YYYY format (SBI)
-            '%d-%b-%Y'         # DD-MMM-YYYY format
-        ]
-        
-        for date_format in priority_formats:
-            try:
-                parsed_date = datetime.strptime(date_str, date_format).date()
-                logger.debug(f"Successfully parsed '{date_str}' using format '{date_format}' -> {parsed_date}")
-                return parsed_date
-            except ValueError:
-                continue
-                
-        # If no format worked, log the issue with more details
-        logger.error(f"Failed to parse date: '{date_str}' using any known format")
-        logger.error(f"Attempted formats: {priority_formats}")
-        return None
+
+        return _parse_date_string(date_str.strip())
 
     def _create_transaction_batch(self, transactions: List[Dict]) -> int:
         """Create transactions in batch for better performance with duplicate detection."""
@@ -469,32 +1016,40 @@ class TransactionImportService:
         skipped_duplicates = 0
         
         try:
-            # Create transactions one by one to trigger signals and validation
-            with transaction.atomic():
-                for trans_data in transactions:
-                    try:
-                        # Check for duplicates based on date, description (first 50 chars), amount, and account
-                        description_part = trans_data.get('description', '')[:50]  # First 50 chars
-                        
-                        existing_transaction = Transaction.objects.filter(
-                            date=trans_data.get('date'),
-                            description__icontains=description_part,
-                            amount=trans_data.get('amount'),
-                            account=trans_data.get('account')
-                        ).first()
-                        
-                        if existing_transaction:
-                            logger.info(f"Skipping duplicate transaction: {description_part} - {trans_data.get('amount')} on {trans_data.get('date')}")
-                            skipped_duplicates += 1
-                            continue
-                            
-                        Transaction.objects.create(**trans_data)
-                        created_count += 1
-                        
-                    except Exception as e:
-                        logger.error(f"Error creating individual transaction: {str(e)}")
-                        # Continue with other transactions
-                        continue
+            # Load possible duplicates for the whole batch in one query, keyed on
+            # account, date, amount and the first 50 characters of the description
+            account_ids = {self._duplicate_key(t)[0] for t in transactions}
+            dates = {t.get('date') for t in transactions}
+            seen = {
+                (account_id, date, amount, description[:50].lower())
+                for account_id, date, amount, description in Transaction.objects.filter(
+                    account_id__in=account_ids, date__in=dates
+                ).values_list('account_id', 'date', 'amount', 'description')
+            }
+
+            new_transactions = []
+            for trans_data in transactions:
+                key = self._duplicate_key(trans_data)
+                if key in seen:
+                    logger.debug("Skipping duplicate transaction: %s - %s on %s", key[3], trans_data.get('amount'), trans_data.get('date'))
+                    skipped_duplicates += 1
+                    continue
+                seen.add(key)
+
+                try:
+                    new_transactions.append(self._build_import_transaction(trans_data))
+                except Exception as e:
+                    logger.error(f"Error creating individual transaction: {str(e)}")
+                    # Continue with other transactions
+                    continue
+
+            if new_transactions:
+                # One multi-row INSERT per 1000 transactions; a savepoint when
+                # the importer already holds a transaction for the whole file
+                with transaction.atomic():
+                    Transaction.objects.bulk_create(new_transactions, batch_size=BULK_CREATE_BATCH_SIZE)
+                    self._after_bulk_create(new_transactions)
+                created_count = len(new_transactions)
 
             if skipped_duplicates > 0:
                 logger.info(f"Skipped {skipped_duplicates} duplicate transactions during bulk import")
@@ -505,6 +1060,63 @@ class TransactionImportService:
             logger.error(f"Error in transaction batch creation: {str(e)}")
             return created_count
 
+    def _duplicate_key(self, trans_data: Dict) -> Tuple:
+        """Key that identifies an imported transaction as a duplicate of an existing one."""
+        account = trans_data.get('account')
+        return (
+            getattr(account, 'pk', account),
+            trans_data.get('date'),
+            trans_data.get('amount'),
+            trans_data.get('description', '')[:50].lower()
+        )
+
+    def _build_import_transaction(self, trans_data: Dict) -> Transaction:
+        """
+        Build an unsaved transaction, applying the checks and defaults that
+        Transaction.save() and its pre_save signal apply to single saves.
+        """
+        new_transaction = Transaction(**trans_data)
+        new_transaction.validate_before_save()
+
+        if new_transaction.transaction_type == 'transfer':
+            new_transaction.from_account_id = new_transaction.account_id
+
+        if not new_transaction.family_group_id and new_transaction.account_id:
+            new_transaction.family_group_id = new_transaction.account.family_group_id
+
+        return new_transaction
+
+    def _after_bulk_create(self, new_transactions: List[Transaction]) -> None:
+        """Run the post-save work that bulk_create skips, once per account and scope."""
+        # The new rows only add to the stored balances, so shift them by the
+        # net amount per account instead of re-summing every transaction
+        deltas = Counter()
+        for new_transaction in new_transactions:
+            deltas[new_transaction.account_id] += new_transaction.balance_effect()
+        Account.apply_balance_deltas(deltas)
+
+        cache_scopes = {}
+        budget_ranges = {}
+        for new_transaction in new_transactions:
+            cache_scopes.setdefault(
+                (new_transaction.user_id, new_transaction.family_group_id, new_transaction.account_id),
+                new_transaction
+            )
+            if new_transaction.transaction_type == 'expense':
+                # Budgets are scoped to the family group, or to the user without one
+                scope = new_transaction.family_group_id or ('user', new_transaction.user_id)
+                first, last = budget_ranges.get(scope, (new_transaction, new_transaction))
+                if new_transaction.date < first.date:
+                    first = new_transaction
+                if new_transaction.date > last.date:
+                    last = new_transaction
+                budget_ranges[scope] = (first, last)
+
+        for new_transaction in cache_scopes.values():
+            _clear_transaction_caches(new_transaction)
+        for first, last in budget_ranges.values():
+            update_budgets_for_transaction(first, until=last.date)
+
     def _import_pdf(
         self,
         file,
@@ -521,9 +1133,14 @@ class TransactionImportService:
             # Read PDF content
             file.seek(0)
             
-            # Try to create PDF reader with error handling
+            # Try to open the PDF with error handling
             try:
-                pdf_reader = PyPDF2.PdfReader(file)
+                if PYMUPDF_AVAILABLE:
+                    pdf_document = pymupdf.open(stream=file.read(), filetype='pdf')
+                    is_encrypted = pdf_document.needs_pass
+                else:
+                    pdf_document = PyPDF2.PdfReader(file)
+                    is_encrypted = pdf_document.is_encrypted
             except Exception as pdf_error:
                 logger.error(f"Failed to read PDF file: {pdf_error}")
                 return {
@@ -547,7 +1164,7 @@ class TransactionImportService:
                 }
 
             # Check if PDF is encrypted
-            if pdf_reader.is_encrypted:
+            if is_encrypted:
                 return {
                     'success': False,
                     'error': 'PDF is password protected. Please provide an unprotected PDF.',
@@ -555,76 +1172,12 @@ class TransactionImportService:
                     'errors': []
                 }
 
-            # Extract text from all pages with enhanced extraction
-            pdf_text = ""
-            total_pages = len(pdf_reader.pages)
-            logger.info(f"Processing PDF with {total_pages} pages")
-            
-            extraction_attempts = []
-            
-            for page_num in range(total_pages):
-                page_text = ""
-                attempt_info = f"Page {page_num + 1}"
-                
-                try:
-                    page = pdf_reader.pages[page_num]
-                    logger.info(f"Extracting text from page {page_num + 1}")
-                    
-                    # Method 1: Standard text extraction
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            attempt_info += f" - Standard extraction: {len(page_text)} chars"
-                        else:
-                            attempt_info += " - Standard extraction: No text"
-                    except Exception as e:
-                        attempt_info += f" - Standard extraction failed: {e}"
-                    
-                    # Method 2: Alternative extraction methods
-                    if not page_text or len(page_text.strip()) < 20:
-                        logger.info(f"Trying alternative extraction methods for page {page_num + 1}")
-                        
-                        # Try extractText (older PyPDF2 method)
-                        try:
-                            if hasattr(page, 'extractText'):
-                                alt_text = page.extractText()
-                                if alt_text and len(alt_text) > len(page_text):
-                                    page_text = alt_text
-                                    attempt_info += f" - Alt method 1: {len(alt_text)} chars"
-                        except Exception as e:
-                            attempt_info += f" - Alt method 1 failed: {e}"
-                        
-                        # Try accessing text content directly
-                        try:
-                            if hasattr(page, '_get_contents_of_obj'):
-                                # This is a more advanced method
-                                pass
-                        except:
-                            pass
-                    
-                    # Method 3: Check if page has any content objects
-                    try:
-                        if hasattr(page, '/Contents'):
-                            contents = page['/Contents']
-                            if contents:
-                                attempt_info += " - Has content objects"
-                            else:
-                                attempt_info += " - No content objects"
-                    except:
-                        pass
-                    
-                    if page_text and page_text.strip():
-                        pdf_text += f"\n--- PAGE {page_num + 1} ---\n" + page_text + "\n"
-                        logger.info(f"Successfully extracted {len(page_text)} characters from page {page_num + 1}")
-                    else:
-                        logger.warning(f"No meaningful text extracted from page {page_num + 1}")
-                        
-                except Exception as e:
-                    logger.error(f"Critical error extracting from page {page_num + 1}: {str(e)}")
-                    attempt_info += f" - Critical error: {e}"
-                
-                extraction_attempts.append(attempt_info)
-            
+            # Extract text from all pages
+            if PYMUPDF_AVAILABLE:
+                pdf_text, extraction_attempts = self._extract_pdf_text_pymupdf(pdf_document)
+            else:
+                pdf_text, extraction_attempts = self._extract_pdf_text_pypdf2(pdf_document)
+
             # Log extraction summary
             logger.info("PDF Extraction Summary:")
             for attempt in extraction_attempts:
@@ -665,9 +1218,8 @@ class TransactionImportService:
                 }
                 
             # Check for meaningful content
-            meaningful_chars = sum(1 for c in pdf_text if c.isalnum())
-            text_lines = [line.strip() for line in pdf_text.split('\n') if line.strip()]
-            
+            meaningful_chars = len(_NON_ALNUM_RE.sub('', pdf_text))
+
             if meaningful_chars < 10:
                 logger.error(f"PDF contains insufficient readable text ({meaningful_chars} characters)")
                 return {
@@ -686,10 +1238,9 @@ class TransactionImportService:
                 }
             
             # Additional validation for bank statement format
-            bank_indicators = ['statement', 'account', 'balance', 'transaction', 'debit', 'credit']
-            has_bank_content = any(indicator.lower() in pdf_text.lower() for indicator in bank_indicators)
+            has_bank_content = bool(_BANK_INDICATOR_RE.search(pdf_text))
             
-            if not has_bank_content and len(text_lines) < 5:
+            if not has_bank_content and sum(1 for line in io.StringIO(pdf_text) if line.strip()) < 5:
                 logger.warning(f"PDF doesn't appear to contain bank statement data")
                 return {
                     'success': False,
@@ -718,13 +1269,18 @@ class TransactionImportService:
             logger.info(f"Found {len(transactions_data)} potential transactions in PDF")
 
             if not transactions_data:
-                # Provide more detailed feedback
-                lines_with_numbers = [line for line in pdf_text.split('\n')
-                                    if re.search(r'\d+\.\d{2}', line) and len(line.strip()) > 10]
-
-                debug_info = f"Lines with amounts found: {len(lines_with_numbers)}"
-                if lines_with_numbers:
-                    debug_info += f"\nSample lines:\n" + "\n".join(lines_with_numbers[:5])
+                # Provide more detailed feedback; keep five sample lines and
+                # only count the rest
+                lines_with_numbers = (line.rstrip('\n') for line in io.StringIO(pdf_text)
+                                      if _AMOUNT_LINE_RE.search(line) and len(line.strip()) > 10)
+                sample_lines = list(islice(lines_with_numbers, 5))
+                amount_line_count = len(sample_lines) + sum(1 for _ in lines_with_numbers)
+
+                debug_parts = [f"Lines with amounts found: {amount_line_count}"]
+                if sample_lines:
+                    debug_parts.append("Sample lines:")
+                    debug_parts.extend(sample_lines)
+                debug_info = "\n".join(debug_parts)
 
                 return {
                     'success': False,
@@ -734,36 +1290,17 @@ class TransactionImportService:
                 }
 
             # Process parsed transactions
-            batch_size = 100
-            transactions_to_create = []
-            row_num = 1
-
-            for trans_data in transactions_data:
-                try:
-                    parsed_transaction = self._create_pdf_transaction(
-                        trans_data, row_num, account, user, family_group
-                    )
-                    if parsed_transaction:
-                        transactions_to_create.append(parsed_transaction)
-
-                    # Create batch when size reached
-                    if len(transactions_to_create) >= batch_size:
-                        created = self._create_transaction_batch(transactions_to_create)
-                        transactions_created += created
-                        transactions_to_create = []
-
-                except Exception as e:
-                    errors.append(f"Row {row_num}: {str(e)}")
-
-                row_num += 1
-
-            # Create remaining transactions
+            transactions_to_create = list(self._iter_parsed_rows(
+                transactions_data, 1, errors, self._create_pdf_transaction,
+                account, user, family_group
+            ))
+
+            # The whole statement is already in memory, so it goes through
+            # duplicate detection and one bulk insert in a single transaction
+            # The account balance moves by what was inserted in the same
+            # transaction
             if transactions_to_create:
-                created = self._create_transaction_batch(transactions_to_create)
-                transactions_created += created
-
-            # Update account balance
-            account.update_balance()
+                transactions_created = self._create_transaction_batch(transactions_to_create)
 
             return {
                 'success': True,
@@ -780,53 +1317,91 @@ class TransactionImportService:
                 'errors': errors
             }
 
+    def _extract_pdf_text_pymupdf(self, pdf_document) -> Tuple[str, List[str]]:
+        """Extract page-delimited text from an open PyMuPDF document."""
+        logger.info(f"Processing PDF with {pdf_document.page_count} pages")
+
+        # Pages are read one after another and parsed as a single text: a
+        # MuPDF document can't be shared between threads, and the bank
+        # parsers carry running balances and wrapped descriptions across
+        # page breaks
+        page_texts = []
+        extraction_attempts = []
+        with pdf_document:
+            for page_num, page in enumerate(pdf_document, 1):
+                page_text = page.get_text('text')
+                if page_text and page_text.strip():
+                    page_texts.append(f"\n--- PAGE {page_num} ---\n{page_text}\n")
+                    extraction_attempts.append(f"Page {page_num} - {len(page_text)} chars")
+                else:
+                    logger.warning(f"No meaningful text extracted from page {page_num}")
+                    extraction_attempts.append(f"Page {page_num} - No text")
+
+        return "".join(page_texts), extraction_attempts
+
+    def _extract_pdf_text_pypdf2(self, pdf_reader) -> Tuple[str, List[str]]:
+        """Extract page-delimited text with PyPDF2 when PyMuPDF is not installed."""
+        logger.info(f"Processing PDF with {len(pdf_reader.pages)} pages")
+
+        page_texts = []
+        extraction_attempts = []
+        for page_num, page in enumerate(pdf_reader.pages, 1):
+            try:
+                page_text = page.extract_text() or ''
+            except Exception as e:
+                logger.error(f"Critical error extracting from page {page_num}: {str(e)}")
+                extraction_attempts.append(f"Page {page_num} - Extraction failed: {e}")
+                continue
+
+            if page_text.strip():
+                page_texts.append(f"\n--- PAGE {page_num} ---\n{page_text}\n")
+                extraction_attempts.append(f"Page {page_num} - {len(page_text)} chars")
+            else:
+                logger.warning(f"No meaningful text extracted from page {page_num}")
+                extraction_attempts.append(f"Page {page_num} - No text")
+
+        return "".join(page_texts), extraction_attempts
+
     def _extract_statement_date(self, pdf_text: str) -> str:
         """Extract statement date from PDF text with improved logic."""
         logger.info("=== EXTRACTING STATEMENT DATE ===")
         
-        # Enhanced date patterns for bank statements
-        date_patterns = [
-            r'Date of Issue\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Statement Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Generated on\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'Transaction Date\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{2}/\d{2}/\d{4})\s+to\s+(\d{2}/\d{2}/\d{4})',  # Date range
-            r'As on\s*:?\s*(\d{1,2}/\d{1,2}/\d{4})',
-        ]
-
-        # Look for date patterns
-        for i, pattern in enumerate(date_patterns, 1):
-            matches = re.findall(pattern, pdf_text, re.IGNORECASE)
-            if matches:
-                if isinstance(matches[0], tuple):  # Date range pattern
-                    found_date = matches[0][1]  # Use end date
-                else:
-                    found_date = matches[0]
-                logger.info(f"Found statement date using pattern {i}: '{found_date}'")
-                return found_date
+        # Look for date patterns, in the first page header before the rest
+        # of the statement
+        header = pdf_text[:_STATEMENT_HEADER_CHARS]
+        for text in (header, pdf_text) if len(pdf_text) > len(header) else (header,):
+            for i, pattern in enumerate(_STATEMENT_DATE_RES, 1):
+                match = pattern.search(text)
+                if match:
+                    # Last group is the end date for the date range pattern
+                    found_date = match.groups()[-1]
+                    logger.info(f"Found statement date using pattern {i}: '{found_date}'")
+                    return found_date
 
         # Extract all dates and use the most recent looking one
-        all_dates = re.findall(r'\b(\d{1,2}/\d{1,2}/\d{4})\b', pdf_text)
+        all_dates = _SLASH_DATE_RE.findall(pdf_text)
         if all_dates:
             # Filter dates that look like transaction dates (not too old)
-            from datetime import datetime, timedelta
             current_year = datetime.now().year
-            valid_dates = []
-            
+            found_date = None
+            best_key = None
+
+            # Keep the most recent date in one pass, comparing (year, month, day)
             for date_str in all_dates:
-                try:
-                    date_obj = datetime.strptime(date_str, '%d/%m/%Y')
-                    # Only consider dates from last 2 years
-                    if date_obj.year >= current_year - 1:
-                        valid_dates.append((date_str, date_obj))
-                except ValueError:
+                day, month, year = map(int, date_str.split('/'))
+                # Only consider dates from last 2 years
+                if year < current_year - 1:
                     continue
-            
-            if valid_dates:
-                # Sort by date and take the most recent
-                valid_dates.sort(key=lambda x: x[1], reverse=True)
-                found_date = valid_dates[0][0]
+                key = (year, month, day)
+                if best_key is None or key > best_key:
+                    try:
+                        date(year, month, day)
+                    except ValueError:
+                        continue
+                    found_date = date_str
+                    best_key = key
+
+            if found_date:
                 logger.info(f"Using most recent valid date: '{found_date}'")
                 return found_date
 
@@ -841,7 +1416,9 @@ class TransactionImportService:
         logger.info(f"Statement date: {statement_date}")
         logger.info(f"Processing {len(pdf_text)} characters from PDF")
 
-        # Try new modular analyzer system first
+        # Try new modular analyzer system first. The factory picks its
+        # analyzer from the text with its own rules, so _detect_bank_type
+        # only runs below when it has none
         if MODULAR_ANALYZERS_AVAILABLE:
             try:
                 analyzer = BankAnalyzerFactory.get_analyzer(pdf_text)
@@ -852,13 +1429,19 @@ class TransactionImportService:
                     
                     # Convert to expected format and add classifications
                     processed_transactions = []
+                    # Merchants repeat within a statement; classify each
+                    # description and amount once
+                    type_cache = {}
                     for txn in transactions:
                         # Ensure proper classification
-                        final_type = analyzer.classify_transaction(
-                            txn['description'], 
-                            txn['amount'], 
-                            txn
-                        )
+                        type_key = (txn['description'], txn['amount'])
+                        final_type = type_cache.get(type_key)
+                        if final_type is None:
+                            final_type = type_cache[type_key] = analyzer.classify_transaction(
+                                txn['description'], 
+                                txn['amount'], 
+                                txn
+                            )
                         
                         processed_transactions.append({
                             'date': txn['date'],
@@ -879,8 +1462,9 @@ class TransactionImportService:
 
         # Fallback to legacy system
         transactions = []
-        lines = pdf_text.split('\n')
-        logger.info(f"Using legacy parser for {len(lines)} lines")
+        # Parsers consume the text line by line rather than as a list
+        lines = io.StringIO(pdf_text)
+        logger.info(f"Using legacy parser for {pdf_text.count(chr(10)) + 1} lines")
 
         # Detect bank type from PDF content
         bank_type = self._detect_bank_type(pdf_text)
@@ -901,98 +1485,50 @@ class TransactionImportService:
     def _detect_bank_type(self, pdf_text: str) -> str:
         """Detect bank type from PDF content with improved accuracy."""
         text_lower = pdf_text.lower()
-        
-        # Score-based detection for better accuracy
-        bank_scores = {
-            'FEDERAL': 0,
-            'SBI': 0,
-            'HDFC': 0,
-            'AXIS': 0
-        }
-        
-        # Federal Bank indicators (strong indicators get higher scores)
-        federal_indicators = [
-            ('federal bank limited', 5),
-            ('federal bank', 3),
-            ('federal towers', 4),
-            ('fdrl', 3),
-            ('fdrlinbb', 4)
-        ]
-        
-        for indicator, score in federal_indicators:
-            if indicator in text_lower:
-                bank_scores['FEDERAL'] += score
-        
-        # SBI indicators
-        sbi_indicators = [
-            ('state bank of india', 5),
-            ('sbin0020312', 4),  # Specific IFSC from the PDF
-            ('state bank', 3),
-            ('sbi', 2),
-            ('sbin0', 3)
-        ]
-        
-        for indicator, score in sbi_indicators:
-            if indicator in text_lower:
-                bank_scores['SBI'] += score
-        
-        # HDFC indicators
-        hdfc_indicators = [
-            ('hdfc bank limited', 5),
-            ('housing development finance corporation', 5),
-            ('hdfc bank', 4),
-            ('hdfc0', 3)
-        ]
-        
-        for indicator, score in hdfc_indicators:
-            if indicator in text_lower:
-                bank_scores['HDFC'] += score
-        
-        # Axis Bank indicators
-        axis_indicators = [
-            ('axis bank limited', 5),
-            ('axis account no', 4),
-            ('statement of axis account', 5),
-            ('axis bank', 4),
-            ('utib0004080', 4),  # Specific IFSC from the PDF
-            ('utib', 3)
-        ]
-        
-        for indicator, score in axis_indicators:
-            if indicator in text_lower:
-                bank_scores['AXIS'] += score
-        
-        # Additional context-based scoring
-        # Look for account statements patterns
-        if 'statement of axis account' in text_lower:
-            bank_scores['AXIS'] += 10
-        elif 'state bank of india' in text_lower and 'account number' in text_lower:
-            bank_scores['SBI'] += 8
-        elif 'hdfc bank' in text_lower and 'statement' in text_lower:
-            bank_scores['HDFC'] += 8
-        elif 'federal bank' in text_lower and 'statement' in text_lower:
-            bank_scores['FEDERAL'] += 8
-        
-        # Return the bank with highest score (minimum threshold of 3)
-        max_score = max(bank_scores.values())
-        if max_score >= 3:
-            for bank, score in bank_scores.items():
-                if score == max_score:
-                    return bank
-        
-        return 'GENERIC'
 
-    def _parse_federal_bank_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+        # Look each distinct phrase up at most once
+        found = {}
+
+        def contains(phrase):
+            if phrase not in found:
+                found[phrase] = phrase in text_lower
+            return found[phrase]
+
+        bank_scores = dict.fromkeys(_BANK_INDICATORS, 0)
+
+        # Context-based scoring first; look for account statements patterns
+        for bank, phrases, bonus in _BANK_CONTEXT_RULES:
+            if all(contains(phrase) for phrase in phrases):
+                bank_scores[bank] += bonus
+                break
+
+        # Score-based detection for better accuracy. Banks are scored in
+        # order and the scan stops as soon as one can no longer be beaten:
+        # it is ahead of every bank already scored and no later bank can
+        # pass it even with all of its indicators
+        banks = list(_BANK_INDICATORS)
+        for i, bank in enumerate(banks):
+            bank_scores[bank] += sum(
+                score for indicator, score in _BANK_INDICATORS[bank] if contains(indicator)
+            )
+            score = bank_scores[bank]
+            if (score >= 3
+                    and all(score > bank_scores[other] for other in banks[:i])
+                    and all(score >= bank_scores[other] + _BANK_INDICATOR_TOTALS[other]
+                            for other in banks[i + 1:])):
+                return bank
+
+        # Return the bank with highest score (minimum threshold of 3); max()
+        # keeps the first of equal scores
+        winner = max(bank_scores, key=bank_scores.get)
+        return winner if bank_scores[winner] >= 3 else 'GENERIC'
+
+    def _parse_federal_bank_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Parse Federal Bank specific format."""
         transactions = []
         
         logger.info(f"=== FEDERAL BANK PARSING ===")
         
-        # Federal Bank specific patterns
-        federal_bank_patterns = [
-            r'^(.+?TFR\s+[A-Z0-9]+)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)\s*(.*)$'
-        ]
-
         # Track parsing state
         current_date = None
         current_description = ""
@@ -1004,25 +1540,19 @@ class TransactionImportService:
                 continue
 
             # Skip Federal Bank header/footer lines
-            skip_indicators = [
-                'federal bank', 'corporate office', 'statement of account',
-                'opening balance', 'grand total', 'abbreviations', 'disclaimer',
-                'page ', 'name :', 'communication address', 'ifsc', 'micr', 'swift'
-            ]
-            
-            if any(skip in line.lower() for skip in skip_indicators):
+            if _FEDERAL_BANK_SKIP_RE.search(line.lower()):
                 continue
 
             # Federal Bank date format: "22-MAY-2023 22-MAY-2023 IFN/..."
-            date_desc_match = re.search(r'^(\d{1,2}-[A-Z]{3}-\d{4})\s+\d{1,2}-[A-Z]{3}-\d{4}\s+(.+)$', line)
+            date_desc_match = _FEDERAL_DATE_DESC_RE.search(line)
             if date_desc_match:
                 current_date = self._convert_federal_date(date_desc_match.group(1))
                 current_description = date_desc_match.group(2).strip()
                 continue
 
             # Check for Federal Bank transaction pattern
-            for pattern_num, pattern in enumerate(federal_bank_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern_num, pattern in enumerate(_FEDERAL_BANK_TXN_RES, 1):
+                match = pattern.search(line)
                 if match and current_date:
                     transaction_data = self._process_federal_bank_transaction(
                         match, current_date, current_description, previous_balance, line_num
@@ -1038,7 +1568,7 @@ class TransactionImportService:
         logger.info(f"=== FOUND {len(transactions)} FEDERAL BANK TRANSACTIONS ===")
         return transactions
 
-    def _parse_sbi_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+    def _parse_sbi_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Parse SBI (State Bank of India) specific format - Improved for actual PDF format."""
         transactions = []
         
@@ -1050,33 +1580,17 @@ class TransactionImportService:
                 continue
 
             # Skip SBI header/footer lines
-            skip_indicators = [
-                'state bank of india', 'account name', 'account number', 'branch',
-                'ifsc code', 'micr code', 'customer id', 'nominee registered',
-                'date credit balance details', 'ref no./cheque no', 'debit',
-                'drawing power', 'interest rate', 'address', 'cif no', 'ckyc no'
-            ]
-            
-            if any(skip in line.lower() for skip in skip_indicators):
+            if _SBI_SKIP_RE.search(line.lower()):
                 continue
 
-            logger.info(f"SBI Line {line_num}: {line}")
+            logger.debug("SBI Line %d: %s", line_num, line)
 
             # SBI actual format from PDF: "100.00 - 01 JUN 2024 TRANSFER TO 4897695162091 -UPI/DR/415388277978/MOHAMMAD/KKBK/mohammadmu/UPI9.13"
             # Pattern: AMOUNT - DATE DESCRIPTION BALANCE
-            sbi_patterns = [
-                # Pattern 1: Amount - Date Description Balance
-                r'^(\d+\.?\d*)\s*-\s*(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$',
-                # Pattern 2: - Amount Date Description Balance  
-                r'^-\s+(\d+\.?\d*)\s+(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*$',
-                # Pattern 3: Date Description Amount Balance
-                r'^(\d{2}\s+[A-Z]{3}\s+\d{4})\s+(.+?)\s+(\d+\.?\d*)\s+([\d,]+\.?\d*)\s*$'
-            ]
-            
             transaction_found = False
             
-            for pattern_num, pattern in enumerate(sbi_patterns, 1):
-                match = re.search(pattern, line)
+            for pattern_num, pattern in enumerate(_SBI_TXN_RES, 1):
+                match = pattern.search(line)
                 if match:
                     try:
                         if pattern_num == 1:  # Amount - Date Description Balance
@@ -1086,8 +1600,7 @@ class TransactionImportService:
                             balance = match.group(4)
                             
                             # Determine transaction type from description
-                            desc_lower = description.lower()
-                            if 'transfer to' in desc_lower or 'upi/dr' in desc_lower:
+                            if _SBI_TRANSFER_OUT_RE.search(description.lower()):
                                 trans_type = 'expense'
                             else:
                                 trans_type = 'income'
@@ -1108,8 +1621,7 @@ class TransactionImportService:
                             balance = match.group(4)
                             
                             # Determine type from description
-                            desc_lower = description.lower()
-                            if any(term in desc_lower for term in ['transfer to', 'upi/dr', 'withdrawal', 'debit']):
+                            if _SBI_DEBIT_RE.search(description.lower()):
                                 trans_type = 'expense'
                             else:
                                 trans_type = 'income'
@@ -1117,12 +1629,13 @@ class TransactionImportService:
                         # Clean amount
                         transaction_amount = transaction_amount.replace(',', '')
                         
-                        if float(transaction_amount) > 0:
-                            logger.info(f"*** SBI TRANSACTION FOUND ON LINE {line_num} ***")
-                            logger.info(f"  Date: {date_str}")
-                            logger.info(f"  Description: {description}")
-                            logger.info(f"  Amount: {transaction_amount}")
-                            logger.info(f"  Type: {trans_type}")
+                        if _amount_in_paise(transaction_amount) > 0:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("*** SBI TRANSACTION FOUND ON LINE %d ***", line_num)
+                                logger.debug("  Date: %s", date_str)
+                                logger.debug("  Description: %s", description)
+                                logger.debug("  Amount: %s", transaction_amount)
+                                logger.debug("  Type: %s", trans_type)
                             
                             transactions.append({
                                 'date_str': date_str,
@@ -1144,213 +1657,161 @@ class TransactionImportService:
         logger.info(f"=== FOUND {len(transactions)} SBI TRANSACTIONS ===")
         return transactions
 
-    def _parse_hdfc_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+    def _parse_hdfc_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Parse HDFC Bank specific format with enhanced multi-line and comprehensive pattern matching."""
         transactions = []
         
         logger.info(f"=== HDFC PARSING ===")
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            line_num = i + 1
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
             
             if len(line) < 8:
-                i += 1
                 continue
 
-            # Skip HDFC header/footer lines - made more specific to avoid false positives
-            skip_indicators = [
-                'hdfc bank', 'housing development finance', 'statement of account',
-                'account number:', 'branch:', 'customer name:', 'ifsc code:',
-                'opening balance', 'closing balance', 'generated on:',
-                'cheque no', 'ref no', 'value dt', 'withdrawal amt', 'deposit amt',
-                'this is a computer generated', 'contents of this statement',
-                'mr ', 'joint holders', 'nomination', 'address', 'city', 'state',
-                'phone no', 'email', 'cust id', 'account status', 'rtgs/neft ifsc'
-            ]
-            
-            # Additional specific checks to avoid filtering valid transactions
-            # Skip lines that are ONLY page numbers or headers
-            if (line.lower().startswith('page no') or 
-                line.lower() == 'page no' or
-                re.match(r'^\s*page\s+no\s*[:.]?\s*\d+\s*$', line, re.IGNORECASE)):
-                i += 1
-                continue
-            
-            if any(skip in line.lower() for skip in skip_indicators):
-                i += 1
+            line_lower = line.lower()
+
+            # Skip page numbers and HDFC header/footer lines - made more specific to avoid false positives
+            if _HDFC_SKIP_RE.search(line_lower):
                 continue
 
-            logger.info(f"HDFC Line {line_num}: {line}")
-
-            # Enhanced HDFC patterns for comprehensive transaction capture
-            hdfc_patterns = [
-                # Pattern 1: Full HDFC format - DD/MM/YY Description RefNo DD/MM/YY Amount Balance
-                r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+(\d{10,})\s+\d{2}/\d{2}/\d{2}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 2: DD/MM/YYYY format with 4-digit year 
-                r'^(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 3: DD/MM/YY simple format with two amounts (transaction amount and balance)
-                r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 4: With reference number between description and amounts
-                r'^(\d{2}/\d{2}/\d{2})\s+(.+?)\s+(\d{8,})\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 5: HDFC format with description, ref number, negative amount, balance 
-                r'^(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+(\d{8,})\s+(-?[\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 6: UPI/ATM/POS specific pattern with negative amounts
-                r'^(\d{2}/\d{2}/\d{2,4})\s+(UPI-|ATM|ATW|POS).+?\s+(\d{8,})\s+(-?[\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 7: Date + Description + single negative amount + balance (common HDFC format)
-                r'^(\d{2}/\d{2}/\d{2,4})\s+(.+?)\s+(-?[\d,]+\.\d{2})\s+([\d,]+\.\d{2})$',
-                # Pattern 8: ATM/EAW transactions with specific format (captures missing June 27th transaction)
-                r'^(\d{2}/\d{2}/\d{2,4})\s+(EAW-|ATW-|ATM-)(.+?)\s+(\d{8,})\s+\d{2}/\d{2}/\d{2,4}\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})',
-                # Pattern 9: Flexible date at start - capture everything and parse amounts
-                r'^(\d{2}/\d{2}/\d{2,4})\s+(.+)$'
-            ]
-            
+            logger.debug("HDFC Line %d: %s", line_num, line)
+
+            # Scan the line for amounts once; the flexible pattern and the
+            # fallback both read them
+            signed_amounts = _SIGNED_STATEMENT_AMOUNT_RE.findall(line)
+
             transaction_found = False
-            
-            # Try to match current line with patterns
-            for pattern_num, pattern in enumerate(hdfc_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    try:
-                        raw_date = match.group(1)
-                        date_str = self._convert_hdfc_date(raw_date)
-                        
-                        if not date_str or date_str == raw_date:
-                            logger.warning(f"HDFC date conversion failed for '{raw_date}', skipping")
-                            continue
-                        
-                        # Handle different pattern structures
-                        if pattern_num in [1]:  # Full format with reference number (Date Desc RefNo Date Amount Balance)
-                            description = match.group(2).strip()
-                            amount_str = match.group(4).replace(',', '').replace('-', '')
-                            balance_str = match.group(5)
-                                
-                        elif pattern_num in [2, 3]:  # Simple format DD/MM/YYYY or DD/MM/YY (Date Desc Amount Balance)
-                            description = match.group(2).strip()
-                            amount_str = match.group(3).replace(',', '').replace('-', '')
-                            balance_str = match.group(4)
-                            
-                        elif pattern_num in [4]:  # With reference number (Date Desc RefNo Amount Balance)
-                            description = match.group(2).strip()
-                            # Remove reference number from description
-                            description = re.sub(r'\d{8,}', '', description).strip()
-                            amount_str = match.group(4).replace(',', '').replace('-', '')
-                            balance_str = match.group(5)
-                            
-                        elif pattern_num in [5, 6]:  # HDFC with ref number and negative amounts (Date Desc RefNo -Amount Balance)
-                            description = match.group(2).strip()
-                            # Remove reference number from description if it exists
-                            description = re.sub(r'\d{8,}', '', description).strip()
-                            amount_str = match.group(4).replace(',', '').replace('-', '')
-                            balance_str = match.group(5)
-                            
-                        elif pattern_num == 7:  # Date + Description + negative amount + balance (Date Desc -Amount Balance)
-                            description = match.group(2).strip()
-                            amount_str = match.group(3).replace(',', '').replace('-', '')
-                            balance_str = match.group(4)
-                            
-                        elif pattern_num == 8:  # ATM/EAW transactions (Date EAW-/ATW-/ATM- Desc RefNo Date Amount Balance)
-                            prefix = match.group(2).strip()  # EAW-, ATW-, ATM-
-                            description = prefix + match.group(3).strip()
-                            # Remove reference number from description if it exists
-                            description = re.sub(r'\d{8,}', '', description).strip()
-                            amount_str = match.group(5).replace(',', '').replace('-', '')
-                            balance_str = match.group(6)
-                            
-                        elif pattern_num == 9:  # Flexible - extract amounts from line
-                            full_content = match.group(2).strip()
-                            amounts = re.findall(r'(-?[\d,]+\.\d{2})', full_content)
+            
+            # Try to match current line with patterns; every pattern opens with
+            # a DD/ date, so other lines go straight to the fallback below
+            if line[2:3] == '/' and line[:2].isdigit():
+                row_matches = _HDFC_ROWS.iter_matches(line)
+            else:
+                row_matches = ()
+            for pattern_num, groups in row_matches:
+                try:
+                    # Captured dates are never blank or padded, so go straight
+                    # to the memoised converter rather than the method's checks
+                    raw_date = groups[0]
+                    date_str = _convert_hdfc_date_string(raw_date)
+                    
+                    if not date_str or date_str == raw_date:
+                        logger.warning(f"HDFC date conversion failed for '{raw_date}', skipping")
+                        continue
+                    
+                    # Handle different pattern structures
+                    if pattern_num in [1]:  # Full format with reference number (Date Desc RefNo Date Amount Balance)
+                        description = groups[1].strip()
+                        amount_str = _unsigned_amount(groups[3])
+                        balance_str = groups[4]
                             
-                            if len(amounts) >= 1:
-                                # Build description by removing amounts
-                                description = full_content
-                                for amt in amounts:
-                                    description = description.replace(amt, ' ')
-                                description = re.sub(r'\d{8,}', '', description)  # Remove ref numbers
-                                description = re.sub(r'\s+', ' ', description).strip()
-                                
-                                # If we have multiple amounts, first is usually transaction amount, last is balance
-                                if len(amounts) >= 2:
-                                    # Find the transaction amount (look for negative or smaller positive amount)
-                                    trans_amounts = [amt for amt in amounts if '-' in amt or float(amt.replace(',', '').replace('-', '')) < 50000]
-                                    if trans_amounts:
-                                        amount_str = trans_amounts[0].replace(',', '').replace('-', '')
-                                    else:
-                                        amount_str = amounts[0].replace(',', '').replace('-', '')
-                                    balance_str = amounts[-1]  # Last amount is usually balance
-                                else:
-                                    amount_str = amounts[0].replace(',', '').replace('-', '')
-                                    balance_str = None
-                            else:
-                                continue
+                    elif pattern_num == 2:  # Simple format DD/MM/YYYY or DD/MM/YY (Date Desc Amount Balance)
+                        description = groups[1].strip()
+                        amount_str = _unsigned_amount(groups[2])
+                        balance_str = groups[3]
                         
-                        # Clean and validate description
-                        description = re.sub(r'\s+', ' ', description).strip()
-                        if not description or len(description) < 3:
-                            description = 'HDFC Transaction'
+                    elif pattern_num == 3:  # With reference number (Date Desc RefNo [-]Amount Balance)
+                        description = groups[1].strip()
+                        amount_str = _unsigned_amount(groups[3])
+                        balance_str = groups[4]
                         
-                        # **ENHANCED HDFC COLUMN-BASED CLASSIFICATION**
-                        # HDFC Format: Date | Narration | Chq./Ref.No. | Value Dt | Withdrawal Amt. | Deposit Amt. | Closing Balance
-                        # Key insight: The column position determines the transaction type!
+                    elif pattern_num == 4:  # Date + Description + negative amount + balance (Date Desc -Amount Balance)
+                        description = groups[1].strip()
+                        amount_str = _unsigned_amount(groups[2])
+                        balance_str = groups[3]
                         
-                        desc_lower = description.lower()
-                        line_lower = line.lower()
+                    elif pattern_num == 5:  # ATM/EAW transactions (Date EAW-/ATW-/ATM- Desc RefNo Date Amount Balance)
+                        prefix = groups[1].strip()  # EAW-, ATW-, ATM-
+                        description = prefix + groups[2].strip()
+                        amount_str = _unsigned_amount(groups[4])
+                        balance_str = groups[5]
                         
-                        # Parse all amounts from the line to understand column structure
-                        all_amounts = re.findall(r'([\d,]+\.\d{2})', line)
+                    elif pattern_num == 6:  # Flexible - extract amounts from line
+                        full_content = groups[1].strip()
+                        # The date prefix holds no amounts, so the line's are the content's
+                        amounts = signed_amounts
                         
-                        # Determine transaction type based on HDFC column analysis and context
-                        trans_type = self._determine_hdfc_transaction_type_by_columns(
-                            description, amount_str, balance_str, all_amounts, line
-                        )
+                        if len(amounts) >= 1:
+                            # Build description by removing amounts
+                            description = full_content
+                            for amt in amounts:
+                                description = description.replace(amt, ' ')
+                            
+                            # If we have multiple amounts, first is usually transaction amount, last is balance
+                            if len(amounts) >= 2:
+                                # Find the transaction amount (look for negative or smaller positive amount)
+                                trans_amount = next(
+                                    (amt for amt in amounts if '-' in amt or _amount_in_paise(_unsigned_amount(amt)) < 5000000),
+                                    amounts[0]
+                                )
+                                amount_str = _unsigned_amount(trans_amount)
+                                balance_str = amounts[-1]  # Last amount is usually balance
+                            else:
+                                amount_str = _unsigned_amount(amounts[0])
+                                balance_str = None
+                        else:
+                            continue
+                    
+                    # Clean and validate description; patterns 3, 5 and 6 leave
+                    # reference numbers in it
+                    description = _clean_description(description, strip_refs=pattern_num in (3, 5, 6))
+                    if not description or len(description) < 3:
+                        description = 'HDFC Transaction'
+                    
+                    # **ENHANCED HDFC COLUMN-BASED CLASSIFICATION**
+                    # HDFC Format: Date | Narration | Chq./Ref.No. | Value Dt | Withdrawal Amt. | Deposit Amt. | Closing Balance
+                    # Key insight: The column position determines the transaction type!
+                    
+                    # Determine transaction type based on HDFC column analysis and context
+                    trans_type = self._determine_hdfc_transaction_type_by_columns(
+                        description.lower(), amount_str, balance_str
+                    )
+                    
+                    # Validate amount; the branches above already stripped separators
+                    amount_str = amount_str or '0'
+                    
+                    if _amount_in_paise(amount_str) > 0:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("*** HDFC TRANSACTION FOUND ON LINE %d (Pattern %s) ***", line_num, pattern_num)
+                            logger.debug("  Date: %s", date_str)
+                            logger.debug("  Description: %s", description)
+                            logger.debug("  Amount: %s", amount_str)
+                            logger.debug("  Type: %s", trans_type)
                         
-                        # Validate amount
-                        amount_str = amount_str.replace(',', '') if amount_str else '0'
+                        transactions.append({
+                            'date_str': date_str,
+                            'description': description,
+                            'amount_str': amount_str,
+                            'type': trans_type,
+                            'source_line': line,
+                            'pattern_used': pattern_num,
+                            'bank_type': 'HDFC'
+                        })
                         
-                        if float(amount_str) > 0:
-                            logger.info(f"*** HDFC TRANSACTION FOUND ON LINE {line_num} (Pattern {pattern_num}) ***")
-                            logger.info(f"  Date: {date_str}")
-                            logger.info(f"  Description: {description}")
-                            logger.info(f"  Amount: {amount_str}")
-                            logger.info(f"  Type: {trans_type}")
-                            
-                            transactions.append({
-                                'date_str': date_str,
-                                'description': description,
-                                'amount_str': amount_str,
-                                'type': trans_type,
-                                'source_line': line,
-                                'pattern_used': pattern_num,
-                                'bank_type': 'HDFC'
-                            })
-                            
-                            transaction_found = True
-                            break
-                            
-                    except Exception as e:
-                        logger.error(f"Error parsing HDFC transaction on line {line_num}: {str(e)}")
-                        continue
-            
+                        transaction_found = True
+                        break
+                        
+                except Exception as e:
+                    logger.error(f"Error parsing HDFC transaction on line {line_num}: {str(e)}")
+                    continue
+        
             # Enhanced fallback parsing - catch any missed transactions
             if not transaction_found:
                 # Look for any line with date pattern and amounts
-                date_match = re.search(r'(\d{2}/\d{2}/\d{2,4})', line)
-                amounts = re.findall(r'([\d,]+\.\d{2})', line)
+                date_match = _HDFC_DATE_RE.search(line)
+                amounts = [amt.lstrip('-') for amt in signed_amounts]
                 
                 if date_match and len(amounts) >= 1:
                     try:
+                        # Usually the row's own date, already converted and
+                        # cached by the pattern loop above
                         raw_date = date_match.group(1)
-                        date_str = self._convert_hdfc_date(raw_date)
+                        date_str = _convert_hdfc_date_string(raw_date)
                         
                         if date_str and date_str != raw_date:
-                            # Extract description by removing date and amounts
-                            description = line
-                            description = re.sub(r'\d{2}/\d{2}/\d{2,4}', '', description)
-                            for amt in amounts:
-                                description = description.replace(amt, ' ')
-                            description = re.sub(r'\d{8,}', '', description)  # Remove reference numbers
-                            description = re.sub(r'\s+', ' ', description).strip()
+                            # Extract description by removing dates, amounts and reference numbers
+                            description = _clean_description(_HDFC_STRIP_RE.sub(' ', line), strip_refs=False)
                             
                             if not description or len(description) < 3:
                                 description = 'HDFC Transaction'
@@ -1359,15 +1820,16 @@ class TransactionImportService:
                             
                             # Use the same column-based classification for fallback transactions
                             trans_type = self._determine_hdfc_transaction_type_by_columns(
-                                description, amount_str, amounts[-1] if len(amounts) > 1 else None, amounts, line
+                                description.lower(), amount_str, amounts[-1] if len(amounts) > 1 else None
                             )
                             
-                            if float(amount_str) > 0:
-                                logger.info(f"*** HDFC FALLBACK TRANSACTION ON LINE {line_num} ***")
-                                logger.info(f"  Date: {date_str}")
-                                logger.info(f"  Description: {description}")
-                                logger.info(f"  Amount: {amount_str}")
-                                logger.info(f"  Type: {trans_type}")
+                            if _amount_in_paise(amount_str) > 0:
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("*** HDFC FALLBACK TRANSACTION ON LINE %d ***", line_num)
+                                    logger.debug("  Date: %s", date_str)
+                                    logger.debug("  Description: %s", description)
+                                    logger.debug("  Amount: %s", amount_str)
+                                    logger.debug("  Type: %s", trans_type)
                                 
                                 transactions.append({
                                     'date_str': date_str,
@@ -1381,13 +1843,11 @@ class TransactionImportService:
                             
                     except Exception as e:
                         logger.error(f"Error in HDFC fallback parsing on line {line_num}: {str(e)}")
-            
-            i += 1
 
         logger.info(f"=== FOUND {len(transactions)} HDFC TRANSACTIONS ===")
         return transactions
 
-    def _determine_hdfc_transaction_type_by_columns(self, description: str, amount_str: str, balance_str: str, all_amounts: list, full_line: str) -> str:
+    def _determine_hdfc_transaction_type_by_columns(self, desc_lower: str, amount_str: str, balance_str: str) -> str:
         """
         Determine HDFC transaction type using column-based analysis
         
@@ -1397,75 +1857,47 @@ class TransactionImportService:
         - Withdrawal Amt. column = expense (money going out)
         - Deposit Amt. column = income (money coming in) 
         - ALL UPI- transactions are outgoing payments (expenses) regardless of recipient
+
+        ``desc_lower`` is the cleaned narration, already lowercased by the caller.
         """
         
-        desc_lower = description.lower()
-        line_lower = full_line.lower()
-        
         # **CRITICAL UPI RULE**: ALL UPI- transactions are expenses (outgoing payments)
         # This overrides all other logic because UPI- prefix indicates money leaving account
         if desc_lower.startswith('upi-'):
             return 'expense'
         
-        # Strong income indicators (override column analysis)
-        strong_income_indicators = [
-            'interest paid', 'salary', 'wage', 'dividend', 'bonus', 'refund',
-            'cashback', 'commission', 'reversal', 'credit interest'
-        ]
-        
-        if any(indicator in desc_lower for indicator in strong_income_indicators):
+        # Strong income indicators and company payments (override column analysis)
+        if _HDFC_INCOME_RE.search(desc_lower):
             return 'income'
         
-        # Company payment detection (legitimate income sources)
-        company_patterns = [
-            r'\b(software|tech|technologies|solutions|systems|consulting|services)\s+(p\s*l|pvt\s*ltd)',
-            r'\b[a-z0-9]+\s*(software|tech|solutions|systems|services)\b',
-            r'\b(microsoft|google|amazon|apple|oracle|sap)\b(?!.*\b(recharge|payment|purchase)\b)'
-        ]
-        
-        for pattern in company_patterns:
-            if re.search(pattern, desc_lower):
-                return 'income'
-        
-        # Strong expense indicators
-        strong_expense_indicators = [
-            'atw-', 'atm-', 'eaw-', 'pos ', 'nwd-', 'withdrawal', 'purchase',
-            'bill payment', 'recharge', 'fee', 'charge', 'emi', 'loan'
-        ]
-        
-        if any(indicator in desc_lower for indicator in strong_expense_indicators):
+        # Strong expense indicators and merchant/service payments
+        if _HDFC_EXPENSE_RE.search(desc_lower):
             return 'expense'
         
-        # Merchant/Service payments (always expense)
-        merchant_patterns = [
-            r'\b(zomato|swiggy|uber|ola|rapido|amazon|flipkart|myntra|nykaa)\b',
-            r'\b(airtel|jio|vodafone)\b.*\brecharge\b',
-            r'\bgoogle.*\brecharge\b'
-        ]
-        
-        for pattern in merchant_patterns:
-            if re.search(pattern, desc_lower):
-                return 'expense'
+        # Parse the amount once, in paise, for every threshold below
+        try:
+            amount_paise = _amount_in_paise(amount_str)
+        except (ValueError, TypeError, AttributeError):
+            return 'expense'
         
         # Column-based analysis using balance change
         try:
-            transaction_amount = float(amount_str.replace(',', ''))
-            
             if balance_str:
-                closing_balance = float(balance_str.replace(',', ''))
+                # The closing balance only has to parse; its value is unused
+                _amount_in_paise(balance_str)
                 
                 # Large amounts analysis
-                if transaction_amount >= 5000:
+                if amount_paise >= 500000:
                     # Large amounts are typically income unless clearly expense
-                    if any(term in desc_lower for term in ['payment', 'purchase', 'bill']):
+                    if _HDFC_PAYMENT_RE.search(desc_lower):
                         return 'expense'
                     else:
                         return 'income'
                 
                 # Medium amounts (1000-5000)
-                elif transaction_amount >= 1000:
+                elif amount_paise >= 100000:
                     # Context-based decision
-                    if any(term in desc_lower for term in ['store', 'mart', 'shop', 'restaurant']):
+                    if _HDFC_SHOP_RE.search(desc_lower):
                         return 'expense'
                     else:
                         return 'income'  # Could be person-to-person payment received
@@ -1478,236 +1910,93 @@ class TransactionImportService:
             pass
         
         # Default fallback based on amount size
-        try:
-            amount_val = float(amount_str.replace(',', ''))
-            return 'income' if amount_val >= 2000 else 'expense'
-        except:
-            return 'expense'
-
-    def _parse_axis_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
-        """Parse AXIS Bank specific format."""
-        transactions = []
-        
-        logger.info(f"=== AXIS PARSING ===")
-        
-        for i, line in enumerate(lines):
-            line = line.strip()
-            line_num = i + 1
-            
-            if len(line) < 8:
-                continue
-
-            # Skip AXIS header/footer lines
-            skip_indicators = [
-                'axis bank', 'prakhya venkata', 'joint holder', 'customer id',
-                'ifsc code', 'micr code', 'nominee', 'scheme', 'tran date',
-                'particulars', 'debit', 'credit', 'balance', 'legends',
-                'transaction total', 'registered office', 'this is a system'
-            ]
-            
-            if any(skip in line.lower() for skip in skip_indicators):
-                continue
-
-            logger.info(f"AXIS Line {line_num}: {line}")
-
-            # AXIS patterns
-            axis_patterns = [
-                # Pattern 1: DD-MM-YYYY Description Amount Balance Init
-                r'^(\d{2}-\d{2}-\d{4})(.+?)\s+([\d,]+\.00)\s+([\d,]+\.00)\s+\d+$',
-                # Pattern 2: UPI/IMPS/RTGS transactions
-                r'^(\d{2}-\d{2}-\d{4})(UPI|IMPS|RTGS).+?\s+([\d,]+\.00)\s+([\d,]+\.00)\s+\d+$',
-                # Pattern 3: ATM transactions
-                r'^(\d{2}-\d{2}-\d{4})(ATM-CASH).+?\s+([\d,]+\.00)\s+([\d,]+\.00)\s+\d+$'
-            ]
-            
-            transaction_found = False
-            
-            for pattern_num, pattern in enumerate(axis_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    try:
-                        raw_date = match.group(1)
-                        date_str = self._convert_axis_date(raw_date)
-                        
-                        if not date_str:
-                            continue
-                        
-                        description = match.group(2).strip()
-                        amount_str = match.group(3).replace(',', '')
-                        balance_str = match.group(4)
-                        
-                        # Determine transaction type
-                        desc_lower = description.lower()
-                        if any(term in desc_lower for term in ['credit', 'deposit', 'received']):
-                            trans_type = 'income'
-                        else:
-                            trans_type = 'expense'
-                        
-                        if float(amount_str) > 0:
-                            logger.info(f"*** AXIS TRANSACTION FOUND ON LINE {line_num} (Pattern {pattern_num}) ***")
-                            logger.info(f"  Date: {date_str}")
-                            logger.info(f"  Description: {description}")
-                            logger.info(f"  Amount: {amount_str}")
-                            logger.info(f"  Type: {trans_type}")
-                            
-                            transactions.append({
-                                'date_str': date_str,
-                                'description': description,
-                                'amount_str': amount_str,
-                                'type': trans_type,
-                                'source_line': line,
-                                'pattern_used': pattern_num,
-                                'bank_type': 'AXIS'
-                            })
-                            
-                            transaction_found = True
-                            break
-                            
-                    except Exception as e:
-                        logger.error(f"Error parsing AXIS transaction on line {line_num}: {str(e)}")
-                        continue
-        
-        logger.info(f"=== FOUND {len(transactions)} AXIS TRANSACTIONS ===")
-        return transactions
+        return 'income' if amount_paise >= 200000 else 'expense'
 
-    def _parse_federal_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+    def _parse_federal_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Parse Federal Bank specific format."""
         transactions = []
         
         logger.info(f"=== FEDERAL PARSING ===")
         
-        for i, line in enumerate(lines):
+        for line_num, line in enumerate(lines, 1):
             line = line.strip()
-            line_num = i + 1
             
-            if len(line) < 8:
+            # Rows open with a DD-MMM-YYYY date; anything else is header or noise
+            if len(line) < 8 or not line[0].isdigit():
                 continue
 
             # Skip Federal header/footer lines
-            skip_indicators = [
-                'federal bank', 'corporate office', 'prakhya venkata', 'branch name',
-                'customer id', 'swift code', 'currency', 'date value date',
-                'particulars', 'withdrawals', 'deposits', 'balance',
-                'abbreviations used', 'grand total'
-            ]
-            
-            if any(skip in line.lower() for skip in skip_indicators):
+            if _FEDERAL_SKIP_RE.search(line.lower()):
                 continue
 
-            logger.info(f"FEDERAL Line {line_num}: {line}")
+            logger.debug("FEDERAL Line %d: %s", line_num, line)
 
-            # Federal patterns
-            federal_patterns = [
-                # Pattern 1: DD-MMM-YYYY DD-MMM-YYYY Description TFR SXXXXXXXX Amount Balance Cr/Dr
-                r'^(\d{2}-[A-Z]{3}-\d{4})\s+(\d{2}-[A-Z]{3}-\d{4})\s+(.+?)TFR\s+S\d+\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)$',
-                # Pattern 2: UPI transactions
-                r'^(\d{2}-[A-Z]{3}-\d{4})\s+(\d{2}-[A-Z]{3}-\d{4})\s+(UPI\s+IN|UPI\s*OUT).+?TFR\s+S\d+\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Cr|Dr)$'
-            ]
-            
             transaction_found = False
             
-            for pattern_num, pattern in enumerate(federal_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    try:
-                        raw_date = match.group(1)
-                        date_str = self._convert_federal_date(raw_date)
-                        
-                        if not date_str:
-                            continue
+            for pattern_num, groups in _FEDERAL_ROWS.iter_matches(line):
+                try:
+                    raw_date = groups[0]
+                    date_str = self._convert_federal_date(raw_date)
+                    
+                    if not date_str:
+                        continue
+                    
+                    if pattern_num == 1:
+                        description = groups[2].strip()
+                        amount_str = groups[3].replace(',', '')
+                        balance_str = groups[4]
+                        cr_dr = groups[5]
+                    else:
+                        description = groups[2].strip()
+                        amount_str = groups[3].replace(',', '')
+                        balance_str = groups[4]
+                        cr_dr = groups[5]
+                    
+                    # Determine transaction type based on Cr/Dr
+                    trans_type = 'income' if cr_dr.lower() == 'cr' else 'expense'
+                    
+                    if _amount_in_paise(amount_str) > 0:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("*** FEDERAL TRANSACTION FOUND ON LINE %d (Pattern %s) ***", line_num, pattern_num)
+                            logger.debug("  Date: %s", date_str)
+                            logger.debug("  Description: %s", description)
+                            logger.debug("  Amount: %s", amount_str)
+                            logger.debug("  Type: %s", trans_type)
                         
-                        if pattern_num == 1:
-                            description = match.group(3).strip()
-                            amount_str = match.group(4).replace(',', '')
-                            balance_str = match.group(5)
-                            cr_dr = match.group(6)
-                        else:
-                            description = match.group(3).strip()
-                            amount_str = match.group(4).replace(',', '')
-                            balance_str = match.group(5)
-                            cr_dr = match.group(6)
+                        transactions.append({
+                            'date_str': date_str,
+                            'description': description,
+                            'amount_str': amount_str,
+                            'type': trans_type,
+                            'source_line': line,
+                            'pattern_used': pattern_num,
+                            'bank_type': 'FEDERAL'
+                        })
                         
-                        # Determine transaction type based on Cr/Dr
-                        trans_type = 'income' if cr_dr.lower() == 'cr' else 'expense'
+                        transaction_found = True
+                        break
                         
-                        if float(amount_str) > 0:
-                            logger.info(f"*** FEDERAL TRANSACTION FOUND ON LINE {line_num} (Pattern {pattern_num}) ***")
-                            logger.info(f"  Date: {date_str}")
-                            logger.info(f"  Description: {description}")
-                            logger.info(f"  Amount: {amount_str}")
-                            logger.info(f"  Type: {trans_type}")
-                            
-                            transactions.append({
-                                'date_str': date_str,
-                                'description': description,
-                                'amount_str': amount_str,
-                                'type': trans_type,
-                                'source_line': line,
-                                'pattern_used': pattern_num,
-                                'bank_type': 'FEDERAL'
-                            })
-                            
-                            transaction_found = True
-                            break
-                            
-                    except Exception as e:
-                        logger.error(f"Error parsing FEDERAL transaction on line {line_num}: {str(e)}")
-                        continue
-        
+                except Exception as e:
+                    logger.error(f"Error parsing FEDERAL transaction on line {line_num}: {str(e)}")
+                    continue
+    
         logger.info(f"=== FOUND {len(transactions)} FEDERAL TRANSACTIONS ===")
         return transactions
 
-    def _convert_axis_date(self, date_str: str) -> str:
-        """Convert AXIS date format DD-MM-YYYY to YYYY-MM-DD."""
-        try:
-            parts = date_str.split('-')
-            if len(parts) == 3:
-                day, month, year = parts
-                return f"{year}-{month.zfill(2)}-{day.zfill(2)}"
-            return None
-        except:
-            return None
-
-    def _convert_federal_date(self, date_str: str) -> str:
-        """Convert Federal date format DD-MMM-YYYY to YYYY-MM-DD."""
-        try:
-            month_map = {
-                'JAN': '01', 'FEB': '02', 'MAR': '03', 'APR': '04',
-                'MAY': '05', 'JUN': '06', 'JUL': '07', 'AUG': '08',
-                'SEP': '09', 'OCT': '10', 'NOV': '11', 'DEC': '12'
-            }
-            
-            parts = date_str.split('-')
-            if len(parts) == 3:
-                day, month_abbr, year = parts
-                month = month_map.get(month_abbr.upper())
-                if month:
-                    return f"{year}-{month}-{day.zfill(2)}"
-            return None
-        except:
-            return None
-
-    def _parse_generic_bank_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+    def _parse_generic_bank_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Generic bank statement parsing for unknown formats."""
         transactions = []
         
         logger.info(f"=== GENERIC BANK PARSING ===")
         
-        # Generic patterns that might work across different banks
-        generic_patterns = [
-            # Pattern for date + description + amount + Dr/Cr
-            r'^(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\s+(.+?)\s+([\d,]+\.\d{2})\s+(Dr|Cr|DR|CR)',
-            # Pattern for transactions with balance
-            r'^(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+(Dr|Cr|DR|CR)'
-        ]
         
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
             if len(line) < 15:
                 continue
 
-            for pattern_num, pattern in enumerate(generic_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
+            for pattern_num, pattern in enumerate(_GENERIC_TXN_RES, 1):
+                match = pattern.search(line)
                 if match:
                     try:
                         if pattern_num == 1:  # Date-based pattern
@@ -1721,7 +2010,7 @@ class TransactionImportService:
                             dr_cr = match.group(4).upper()
                             date_str = statement_date or datetime.now().strftime('%d/%m/%Y')
 
-                        trans_type = 'expense' if dr_cr in ['DR', 'DEBIT'] else 'income'
+                        trans_type = 'expense' if dr_cr in _GENERIC_DEBIT_MARKERS else 'income'
                         
                         transactions.append({
                             'date_str': date_str,
@@ -1746,8 +2035,7 @@ class TransactionImportService:
         dates = []
         
         # Federal Bank uses DD-MMM-YYYY format
-        federal_date_pattern = r'\b(\d{1,2}-[A-Z]{3}-\d{4})\b'
-        matches = re.findall(federal_date_pattern, pdf_text)
+        matches = _FEDERAL_DATE_RE.findall(pdf_text)
         
         for match in matches:
             converted_date = self._convert_federal_date(match)
@@ -1758,29 +2046,23 @@ class TransactionImportService:
 
     def _convert_federal_date(self, federal_date: str) -> str:
         """Convert Federal Bank date format (22-MAY-2023) to DD/MM/YYYY."""
-        try:
-            # Parse DD-MMM-YYYY and convert to DD/MM/YYYY
-            date_obj = datetime.strptime(federal_date, '%d-%b-%Y')
-            return date_obj.strftime('%d/%m/%Y')
-        except ValueError:
-            logger.error(f"Failed to parse Federal Bank date: {federal_date}")
-            return federal_date
+        return _convert_federal_date_string(federal_date)
 
     def _convert_sbi_date(self, date_str: str) -> str:
         """Convert SBI date formats to DD/MM/YYYY."""
         try:
             # Try SBI format: "01-08-23" (DD-MM-YY)
-            if re.match(r'\d{2}-\d{2}-\d{2}', date_str):
+            if _SBI_SHORT_DATE_RE.match(date_str):
                 date_obj = datetime.strptime(date_str, '%d-%m-%y')
                 return date_obj.strftime('%d/%m/%Y')
             
             # Try SBI format: "01 Aug 2023" (DD MMM YYYY)
-            elif re.match(r'\d{1,2} [A-Za-z]{3} \d{4}', date_str):
+            elif _SBI_MONTH_DATE_RE.match(date_str):
                 date_obj = datetime.strptime(date_str, '%d %b %Y')
                 return date_obj.strftime('%d/%m/%Y')
             
             # Try SBI format: "01 JUN 2024" (DD MMM YYYY uppercase)
-            elif re.match(r'\d{1,2} [A-Z]{3} \d{4}', date_str):
+            elif _SBI_UPPER_MONTH_DATE_RE.match(date_str):
                 date_obj = datetime.strptime(date_str, '%d %B %Y')
                 return date_obj.strftime('%d/%m/%Y')
                 
@@ -1800,23 +2082,7 @@ class TransactionImportService:
             return None
             
         date_str = date_str.strip()
-        
-        try:
-            # SBI format from PDF: "01 JUN 2024"
-            dt_obj = datetime.strptime(date_str, '%d %b %Y')
-            formatted_date = dt_obj.strftime('%Y-%m-%d')
-            logger.debug(f"SBI date conversion: '{date_str}' -> '{formatted_date}'")
-            return formatted_date
-        except ValueError as e:
-            logger.error(f"Error converting SBI date format2 '{date_str}': {e}")
-            # Try alternative SBI formats
-            try:
-                # Try DD-MMM-YYYY format
-                dt_obj = datetime.strptime(date_str, '%d-%b-%Y')
-                return dt_obj.strftime('%Y-%m-%d')
-            except ValueError:
-                logger.error(f"Could not parse SBI date in any known format: '{date_str}'")
-                return date_str
+        return _convert_sbi_date_string(date_str)
 
     def _convert_hdfc_date(self, date_str: str) -> str:
         """Convert HDFC date format to YYYY-MM-DD with enhanced format handling."""
@@ -1825,47 +2091,9 @@ class TransactionImportService:
             return None
             
         date_str = date_str.strip()
-        logger.debug(f"Converting HDFC date: '{date_str}'")
-        
-        try:
-            # Handle DD/MM/YYYY format (like "01/06/2024")
-            if '/' in date_str and len(date_str.split('/')[2]) == 4:
-                dt_obj = datetime.strptime(date_str, "%d/%m/%Y")
-                formatted_date = dt_obj.strftime("%Y-%m-%d")
-                logger.debug(f"HDFC 4-digit year: '{date_str}' -> '{formatted_date}'")
-                return formatted_date
-            
-            # Handle DD/MM/YY format (like "01/06/24") - most common HDFC format
-            elif '/' in date_str and len(date_str.split('/')[2]) == 2:
-                dt_obj = datetime.strptime(date_str, '%d/%m/%y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"HDFC 2-digit year: '{date_str}' -> '{formatted_date}'")
-                return formatted_date
-            
-            # Handle DD-MMM-YYYY format (like "01-JUN-2024") 
-            elif '-' in date_str and len(date_str.split('-')) == 3:
-                dt_obj = datetime.strptime(date_str, "%d-%b-%Y")
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"HDFC month name format: '{date_str}' -> '{formatted_date}'")
-                return formatted_date
-                
-            # Handle DD MMM YYYY format (like "01 JUN 2024")
-            elif ' ' in date_str and len(date_str.split(' ')) == 3:
-                dt_obj = datetime.strptime(date_str, "%d %b %Y")
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"HDFC space-separated format: '{date_str}' -> '{formatted_date}'")
-                return formatted_date
-                
-        except ValueError as e:
-            logger.error(f"Error parsing HDFC date '{date_str}': {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error parsing HDFC date '{date_str}': {str(e)}")
-            
-        # If all parsing fails, return None to indicate failure
-        logger.warning(f"Could not parse HDFC date format: '{date_str}', all formats failed")
-        return None
+        return _convert_hdfc_date_string(date_str)
 
-    def _parse_axis_transactions(self, lines: List[str], statement_date: str = None) -> List[Dict]:
+    def _parse_axis_transactions(self, lines: Iterable[str], statement_date: str = None) -> List[Dict]:
         """Parse Axis Bank specific format."""
         transactions = []
         
@@ -1873,72 +2101,55 @@ class TransactionImportService:
         
         for line_num, line in enumerate(lines, 1):
             line = line.strip()
-            if len(line) < 15:
+            # Rows open with a DD-MM-YYYY date; anything else is header or noise
+            if len(line) < 15 or not line[0].isdigit():
                 continue
 
             # Skip Axis Bank header/footer lines
-            skip_indicators = [
-                'axis bank', 'statement of account', 'account number:', 'joint holder', 'customer id',
-                'customer name:', 'branch:', 'ifsc code:', 'micr code:', 'registered mobile',
-                'registered email', 'scheme :', 'ckyc number', 'nominee', 'opening balance',
-                'closing balance', 'statement summary', 'transaction codes', 'end of statement',
-                'request from:', 'this is a system generated', 'please contact the branch'
-            ]
-            
-            if any(skip in line.lower() for skip in skip_indicators):
+            if _AXIS_SKIP_RE.search(line.lower()):
                 continue
 
-            logger.info(f"Axis Line {line_num}: {line}")
+            logger.debug("Axis Line %d: %s", line_num, line)
 
-            # Axis Bank format patterns
-            # Format: DD-MM-YYYYDESCRIPTION                          AMOUNT             BALANCE BRANCH
-            axis_patterns = [
-                # Main pattern: DD-MM-YYYY + Description + Amount + Balance + Branch
-                r'^(\d{2}-\d{2}-\d{4})(.+?)\s+(\d[\d,]*\.\d{2})\s+(\d[\d,]*\.\d{2})\s+(\d+)\s*$',
-                
-                # Alternative pattern with debit amount at end
-                r'^(\d{2}-\d{2}-\d{4})(.+?)\s+([\d,]+\.\d{2})\s+([\d,]+\.\d{2})\s+\d+\s*$'
-            ]
             
             transaction_found = False
             
-            for pattern_num, pattern in enumerate(axis_patterns, 1):
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    try:
-                        # Both patterns have: date, description, amount, balance, branch
-                        date_str = self._convert_axis_date(match.group(1))
-                        description = match.group(2).strip()
-                        amount_str = match.group(3).replace(',', '')
-                        balance = match.group(4)
+            for pattern_num, groups in _AXIS_ROWS.iter_matches(line):
+                try:
+                    # Both patterns have: date, description, amount, balance, branch
+                    date_str = self._convert_axis_date(groups[0])
+                    description = groups[1].strip()
+                    amount_str = groups[2].replace(',', '')
+                    balance = groups[3]
+                    
+                    # Determine transaction type based on description keywords
+                    trans_type = self._classify_axis_transaction(description)
+                    
+                    if _amount_in_paise(amount_str) > 0:
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("*** AXIS TRANSACTION FOUND ON LINE %d ***", line_num)
+                            logger.debug("  Date: %s", date_str)
+                            logger.debug("  Description: %s", description)
+                            logger.debug("  Amount: %s", amount_str)
+                            logger.debug("  Type: %s", trans_type)
                         
-                        # Determine transaction type based on description keywords
-                        trans_type = self._classify_axis_transaction(description)
+                        transactions.append({
+                            'date_str': date_str,
+                            'description': description,
+                            'amount_str': amount_str,
+                            'type': trans_type,
+                            'source_line': line,
+                            'pattern_used': pattern_num,
+                            'bank_type': 'AXIS'
+                        })
                         
-                        if float(amount_str) > 0:
-                            logger.info(f"*** AXIS TRANSACTION FOUND ON LINE {line_num} ***")
-                            logger.info(f"  Date: {date_str}")
-                            logger.info(f"  Description: {description}")
-                            logger.info(f"  Amount: {amount_str}")
-                            logger.info(f"  Type: {trans_type}")
-                            
-                            transactions.append({
-                                'date_str': date_str,
-                                'description': description,
-                                'amount_str': amount_str,
-                                'type': trans_type,
-                                'source_line': line,
-                                'pattern_used': pattern_num,
-                                'bank_type': 'AXIS'
-                            })
-                            
-                            transaction_found = True
-                            break
-                            
-                    except Exception as e:
-                        logger.error(f"Error parsing Axis transaction on line {line_num}: {str(e)}")
-                        continue
-        
+                        transaction_found = True
+                        break
+                        
+                except Exception as e:
+                    logger.error(f"Error parsing Axis transaction on line {line_num}: {str(e)}")
+                    continue
+    
         logger.info(f"=== FOUND {len(transactions)} AXIS TRANSACTIONS ===")
         return transactions
 
@@ -1949,59 +2160,37 @@ class TransactionImportService:
             return None
             
         axis_date = axis_date.strip()
+
+        # Axis rows carry DD-MM-YYYY; slice it (and DD/MM/YY) directly
+        parsed = _sliced_date(axis_date, '-', False, 4) or _sliced_date(axis_date, '/', False, 2)
+        if parsed:
+            return parsed.isoformat()
         
         try:
-            # Handle DD-MMM-YY format (01-Aug-23) - case insensitive
-            if re.match(r'\d{1,2}-[A-Za-z]{3}-\d{2}', axis_date):
-                dt_obj = datetime.strptime(axis_date, '%d-%b-%y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"Axis date conversion (DD-MMM-YY): '{axis_date}' -> '{formatted_date}'")
-                return formatted_date
-                
-            # Handle DD/MM/YY format  
-            elif re.match(r'\d{1,2}/\d{1,2}/\d{2}', axis_date):
-                dt_obj = datetime.strptime(axis_date, '%d/%m/%y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"Axis date conversion (DD/MM/YY): '{axis_date}' -> '{formatted_date}'")
-                return formatted_date
-                
-            # Handle DD-MM-YYYY format
-            elif re.match(r'\d{1,2}-\d{1,2}-\d{4}', axis_date):
-                dt_obj = datetime.strptime(axis_date, '%d-%m-%Y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"Axis date conversion (DD-MM-YYYY): '{axis_date}' -> '{formatted_date}'")
-                return formatted_date
-                
-            # Handle DD/MM/YYYY format
-            elif re.match(r'\d{1,2}/\d{1,2}/\d{4}', axis_date):
-                dt_obj = datetime.strptime(axis_date, '%d/%m/%Y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"Axis date conversion (DD/MM/YYYY): '{axis_date}' -> '{formatted_date}'")
-                return formatted_date
-                
-            # Handle DD-MMM-YYYY format (01-Aug-2024)
-            elif re.match(r'\d{1,2}-[A-Za-z]{3}-\d{4}', axis_date):
-                dt_obj = datetime.strptime(axis_date, '%d-%b-%Y')
-                formatted_date = dt_obj.strftime('%Y-%m-%d')
-                logger.debug(f"Axis date conversion (DD-MMM-YYYY): '{axis_date}' -> '{formatted_date}'")
-                return formatted_date
-                
+            # Handle the known Axis shapes (DD-MMM-YY case insensitive,
+            # DD/MM/YY, DD-MM-YYYY, DD/MM/YYYY, DD-MMM-YYYY)
+            for shape_re, date_format, label in _AXIS_DATE_SHAPES:
+                if shape_re.match(axis_date):
+                    dt_obj = datetime.strptime(axis_date, date_format)
+                    formatted_date = dt_obj.strftime('%Y-%m-%d')
+                    logger.debug(f"Axis date conversion ({label}): '{axis_date}' -> '{formatted_date}'")
+                    return formatted_date
+
             # Fallback for unknown formats
-            else:
-                logger.warning(f"Unknown Axis date format: '{axis_date}', attempting flexible parsing")
-                # Try a few more common formats
-                fallback_formats = ['%d %b %Y', '%Y-%m-%d', '%m/%d/%Y']
-                for fmt in fallback_formats:
-                    try:
-                        dt_obj = datetime.strptime(axis_date, fmt)
-                        formatted_date = dt_obj.strftime('%Y-%m-%d')
-                        logger.debug(f"Axis fallback date conversion: '{axis_date}' -> '{formatted_date}'")
-                        return formatted_date
-                    except ValueError:
-                        continue
-                        
-                logger.error(f"Could not parse Axis date in any known format: '{axis_date}'")
-                return axis_date
+            logger.warning(f"Unknown Axis date format: '{axis_date}', attempting flexible parsing")
+            # Try a few more common formats
+            fallback_formats = ['%d %b %Y', '%Y-%m-%d', '%m/%d/%Y']
+            for fmt in fallback_formats:
+                try:
+                    dt_obj = datetime.strptime(axis_date, fmt)
+                    formatted_date = dt_obj.strftime('%Y-%m-%d')
+                    logger.debug(f"Axis fallback date conversion: '{axis_date}' -> '{formatted_date}'")
+                    return formatted_date
+                except ValueError:
+                    continue
+
+            logger.error(f"Could not parse Axis date in any known format: '{axis_date}'")
+            return axis_date
                 
         except Exception as e:
             logger.error(f"Error converting Axis date '{axis_date}': {str(e)}")
@@ -2081,11 +2270,12 @@ class TransactionImportService:
             else:
                 final_type = actual_trans_type
 
-            logger.info(f"*** FEDERAL BANK TRANSACTION PROCESSED ON LINE {line_num} ***")
-            logger.info(f"  Date: {current_date}")
-            logger.info(f"  Description: {full_description[:50]}...")
-            logger.info(f"  Amount: {amount_str}")
-            logger.info(f"  Type: {final_type}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("*** FEDERAL BANK TRANSACTION PROCESSED ON LINE %d ***", line_num)
+                logger.debug("  Date: %s", current_date)
+                logger.debug("  Description: %s...", full_description[:50])
+                logger.debug("  Amount: %s", amount_str)
+                logger.debug("  Type: %s", final_type)
 
             return {
                 'date_str': current_date,
@@ -2137,7 +2327,7 @@ class TransactionImportService:
         """Determine transaction type specifically for Federal Bank format."""
         description_lower = description.lower()
         
-        logger.info(f"Analyzing Federal Bank transaction: '{description}'")
+        logger.debug("Analyzing Federal Bank transaction: '%s'", description)
         
         # Federal Bank specific patterns from your statement
         
@@ -2178,35 +2368,35 @@ class TransactionImportService:
         # Check for strong income indicators
         for indicator in income_indicators:
             if indicator in description_lower:
-                logger.info(f"  >>> FEDERAL BANK INCOME: '{indicator}' found <<<")
+                logger.debug("  >>> FEDERAL BANK INCOME: '%s' found <<<", indicator)
                 return 'income'
         
         # Check for strong expense indicators
         for indicator in expense_indicators:
             if indicator in description_lower:
-                logger.info(f"  >>> FEDERAL BANK EXPENSE: '{indicator}' found <<<")
+                logger.debug("  >>> FEDERAL BANK EXPENSE: '%s' found <<<", indicator)
                 return 'expense'
         
         # For Federal Bank, if no clear indicator, analyze the description context
         # UPI transactions with specific patterns
         if 'upi' in description_lower:
             if any(pattern in description_lower for pattern in ['@', 'qr', 'pay']):
-                logger.info(f"  >>> UPI PAYMENT PATTERN - EXPENSE <<<")
+                logger.debug("  >>> UPI PAYMENT PATTERN - EXPENSE <<<")
                 return 'expense'
             else:
-                logger.info(f"  >>> UPI GENERIC - fallback to Cr/Dr <<<")
+                logger.debug("  >>> UPI GENERIC - fallback to Cr/Dr <<<")
         
         # Technology/company names usually indicate income
         if any(company in description_lower for company in ['tech', 'technologies', 'pvt', 'ltd']):
-            logger.info(f"  >>> COMPANY PAYMENT - INCOME <<<")
+            logger.debug("  >>> COMPANY PAYMENT - INCOME <<<")
             return 'income'
         
         # Final fallback to Cr/Dr (but Federal Bank format may need special handling)
         if cr_dr.upper() == 'CR':
-            logger.info(f"  >>> FEDERAL BANK CREDIT - INCOME (fallback) <<<")
+            logger.debug("  >>> FEDERAL BANK CREDIT - INCOME (fallback) <<<")
             return 'income'
         else:
-            logger.info(f"  >>> FEDERAL BANK DEBIT - EXPENSE (fallback) <<<")
+            logger.debug("  >>> FEDERAL BANK DEBIT - EXPENSE (fallback) <<<")
             return 'expense'
 
     def _extract_transaction_dates(self, pdf_text: str, statement_date: str) -> List[str]:
@@ -2214,14 +2404,8 @@ class TransactionImportService:
         dates = []
         
         # Look for date patterns in the text
-        date_patterns = [
-            r'\b(\d{1,2}/\d{1,2}/\d{4})\b',
-            r'\b(\d{4}-\d{1,2}-\d{1,2})\b',
-            r'\b(\d{1,2}-\d{1,2}-\d{4})\b'
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, pdf_text)
+        for pattern in _TRANSACTION_DATE_RES:
+            matches = pattern.findall(pdf_text)
             for match in matches:
                 if match not in dates:
                     # Validate date format
@@ -2304,12 +2488,12 @@ class TransactionImportService:
         # Check for strong indicators first
         for indicator in strong_expense_indicators:
             if indicator in description_lower:
-                logger.info(f"  >>> STRONG EXPENSE INDICATOR: '{indicator}' <<<")
+                logger.debug("  >>> STRONG EXPENSE INDICATOR: '%s' <<<", indicator)
                 return 'expense'
                 
         for indicator in strong_income_indicators:
             if indicator in description_lower:
-                logger.info(f"  >>> STRONG INCOME INDICATOR: '{indicator}' <<<")
+                logger.debug("  >>> STRONG INCOME INDICATOR: '%s' <<<", indicator)
                 return 'income'
         
         # Check for general patterns
@@ -2327,40 +2511,38 @@ class TransactionImportService:
         income_score = sum(1 for pattern in general_income_patterns if pattern in description_lower)
         
         if expense_score > income_score:
-            logger.info(f"  >>> EXPENSE by pattern score: {expense_score} vs {income_score} <<<")
+            logger.debug("  >>> EXPENSE by pattern score: %s vs %s <<<", expense_score, income_score)
             return 'expense'
         elif income_score > expense_score:
-            logger.info(f"  >>> INCOME by pattern score: {income_score} vs {expense_score} <<<")
+            logger.debug("  >>> INCOME by pattern score: %s vs %s <<<", income_score, expense_score)
             return 'income'
         
         # Final fallback to Cr/Dr with correction
         # Many banks show all transactions as Credit in statements, so be careful
         if cr_dr.upper() == 'DR':
-            logger.info(f"  >>> EXPENSE by DR indicator (fallback) <<<")
+            logger.debug("  >>> EXPENSE by DR indicator (fallback) <<<")
             return 'expense'
         else:
             # For Credit entries, default to income but this might need user review
-            logger.info(f"  >>> INCOME by CR indicator (fallback - review recommended) <<<")
+            logger.debug("  >>> INCOME by CR indicator (fallback - review recommended) <<<")
             return 'income'
 
     def _flexible_pdf_parsing(self, pdf_text: str, statement_date: str = None) -> List[Dict]:
         """Fallback parsing method for PDFs that don't match standard patterns."""
         transactions = []
-        lines = pdf_text.split('\n')
-
         # Look for any line with a date-like pattern and an amount
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(io.StringIO(pdf_text), 1):
             line = line.strip()
             if len(line) < 15:
                 continue
 
             # Find date patterns
-            date_match = re.search(r'(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})', line)
+            date_match = _FLEXIBLE_DATE_RE.search(line)
             if not date_match:
                 continue
 
             # Find amount patterns
-            amount_matches = re.findall(r'(\d{1,3}(?:,\d{3})*\.\d{2})', line)
+            amount_matches = _FLEXIBLE_AMOUNT_RE.findall(line)
             if not amount_matches:
                 continue
 
@@ -2374,7 +2556,7 @@ class TransactionImportService:
 
             if amount_start > desc_start:
                 description = line[desc_start:amount_start].strip()
-                description = re.sub(r'\s+', ' ', description)
+                description = _WHITESPACE_RE.sub(' ', description)
 
                 if len(description) > 3:
                     trans_type = self._determine_transaction_type(line, description, amount_str)
@@ -2430,9 +2612,9 @@ class TransactionImportService:
         ]
 
         # Check for explicit debit/credit indicators
-        if re.search(r'\b(cr|credit|\+)\b', line_lower):
+        if _CREDIT_MARKER_RE.search(line_lower):
             return 'income'
-        elif re.search(r'\b(dr|debit|\-)\b', line_lower):
+        elif _DEBIT_MARKER_RE.search(line_lower):
             return 'expense'
 
         # Check description for keywords
@@ -2455,7 +2637,13 @@ class TransactionImportService:
         user,  # User model instance
         family_group=None
     ) -> Optional[Dict]:
-        """Create transaction object from parsed PDF data."""
+        """
+        Create transaction object from parsed PDF data.
+
+        ``trans_data`` is one of the plain dicts the bank parsers return. They
+        stay dicts rather than a record type: the external analyzers hand back
+        dicts as well, and a statement holds at most a few hundred rows.
+        """
         try:
             # Parse date
             transaction_date = self._parse_date(trans_data['date_str'])
@@ -2463,7 +2651,7 @@ class TransactionImportService:
                 raise ValueError(f"Invalid date format: {trans_data['date_str']}")
 
             # Parse amount
-            amount_str = trans_data['amount_str'].replace(',', '').replace('$', '').replace('₹', '')
+            amount_str = trans_data['amount_str'].translate(_PARSED_AMOUNT_TABLE)
             try:
                 amount = Decimal(amount_str)
                 if amount <= 0:
@@ -2478,7 +2666,7 @@ class TransactionImportService:
 
             # Get transaction type
             trans_type = trans_data['type']
-            if trans_type not in ['income', 'expense']:
+            if trans_type not in _IMPORT_TRANSACTION_TYPES:
                 trans_type = 'expense'  # Default fallback
 
             return {
@@ -2521,7 +2709,9 @@ class TransactionExportService:
             'Notes'
         ])
 
-        # Write transactions
+        # Write transactions, streaming querysets instead of caching every row
+        if hasattr(transactions, 'iterator'):
+            transactions = transactions.iterator(chunk_size=2000)
         for transaction in transactions:
             writer.writerow([
                 transaction.date.strftime('%Y-%m-%d'),
@@ -2554,7 +2744,9 @@ class TransactionExportService:
             cell = ws.cell(row=1, column=col, value=header)
             cell.font = openpyxl.styles.Font(bold=True)
 
-        # Write transactions
+        # Write transactions, streaming querysets instead of caching every row
+        if hasattr(transactions, 'iterator'):
+            transactions = transactions.iterator(chunk_size=2000)
         for row_num, transaction in enumerate(transactions, 2):
             ws.cell(row=row_num, column=1, value=transaction.date)
             ws.cell(row=row_num, column=2, value=transaction.description)
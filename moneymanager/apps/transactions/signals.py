@@ -1,8 +1,9 @@
-from django.db.models.signals import post_save, post_delete, pre_save
+from django.db.models.signals import post_save, post_delete, pre_save, post_migrate
 from django.dispatch import receiver
 from django.core.cache import cache
-from .models import Transaction, Account, RecurringTransaction
-from ..budgets.models import Budget
+from .db_triggers import create_updated_at_triggers
+from .models import Transaction, Account, RecurringTransaction, _deferred_account_ids
+from ..budgets.services import update_budgets_for_transaction
 from decimal import Decimal
 import logging
 
@@ -11,25 +12,16 @@ logger = logging.getLogger(__name__)
 
 @receiver(post_save, sender=Transaction)
 def update_account_balance_on_save(sender, instance, created, **kwargs):
-    """Update account balance when transaction is saved."""
+    """Update caches and budgets when transaction is saved."""
     try:
-        if instance.account:
-            instance.account.update_balance()
-
-        # Update to_account balance for transfers
-        if instance.to_account and instance.transaction_type == 'transfer':
-            instance.to_account.update_balance()
-
-        # Update from_account balance for transfers
-        if instance.from_account and instance.transaction_type == 'transfer':
-            instance.from_account.update_balance()
+        # Account balances are adjusted incrementally in Transaction.save()
 
         # Clear related caches
         _clear_transaction_caches(instance)
 
         # Update budgets if expense transaction
         if instance.transaction_type == 'expense' and instance.is_active:
-            _update_related_budgets(instance)
+            update_budgets_for_transaction(instance)
 
     except Exception as e:
         logger.error(f"Error updating account balance for transaction {instance.id}: {str(e)}")
@@ -39,16 +31,16 @@ def update_account_balance_on_save(sender, instance, created, **kwargs):
 def update_account_balance_on_delete(sender, instance, **kwargs):
     """Update account balance when transaction is deleted."""
     try:
-        if instance.account:
-            instance.account.update_balance()
+        deferred_account_ids = _deferred_account_ids()
+        if deferred_account_ids is not None:
+            # Recalculated once when the deferred_balance_updates() block ends
+            deferred_account_ids.add(instance.account_id)
+            _clear_transaction_caches(instance)
+            return
 
-        # Update to_account balance for transfers
-        if instance.to_account and instance.transaction_type == 'transfer':
-            instance.to_account.update_balance()
-
-        # Update from_account balance for transfers
-        if instance.from_account and instance.transaction_type == 'transfer':
-            instance.from_account.update_balance()
+        # Take back only this row's contribution, as Transaction.save() does
+        # for edits, so the opening balance is kept
+        Account.apply_balance_deltas({instance.account_id: -instance.balance_effect()})
 
         # Clear related caches
         _clear_transaction_caches(instance)
@@ -61,16 +53,10 @@ def update_account_balance_on_delete(sender, instance, **kwargs):
 def validate_transaction_before_save(sender, instance, **kwargs):
     """Validate transaction data before saving."""
     try:
-        # Ensure amount is positive
-        if instance.amount <= 0:
-            raise ValueError("Transaction amount must be positive")
+        # Positive amount, and transfers need a distinct to_account
+        instance.validate_before_save()
 
-        # Validate transfer transactions
         if instance.transaction_type == 'transfer':
-            if not instance.to_account:
-                raise ValueError("Transfer transactions must have a to_account")
-            if instance.account == instance.to_account:
-                raise ValueError("Cannot transfer to the same account")
             # Set from_account to main account for transfers
             instance.from_account = instance.account
 
@@ -111,24 +97,23 @@ def _clear_transaction_caches(transaction):
         cache.delete(cache_key)
 
 
-def _update_related_budgets(transaction):
-    """Update budgets related to this expense transaction."""
-    try:
-        # Find active budgets that might be affected
-        budgets = Budget.objects.filter(
-            is_active=True,
-            start_date__lte=transaction.date,
-            end_date__gte=transaction.date
-        )
-
-        if transaction.family_group:
-            budgets = budgets.filter(family_group=transaction.family_group)
-        else:
-            budgets = budgets.filter(user=transaction.user, family_group__isnull=True)
-
-        # Update budget spent amounts
-        for budget in budgets:
-            budget.update_spent_amount()
+@receiver(post_migrate)
+def restore_sqlite_updated_at_triggers(sender, using='default', **kwargs):
+    """
+    Re-create the SQLite updated_at triggers after migrate.
 
-    except Exception as e:
-        logger.error(f"Error updating budgets for transaction {transaction.id}: {str(e)}")
\ No newline at end of file
+    Migration 0009 installs them on every backend, but SQLite drops a
+    table's triggers whenever a later migration rebuilds that table.
+    """
+    from django.db import connections
+    from django.db.migrations.recorder import MigrationRecorder
+
+    if sender.name != 'moneymanager.apps.transactions':
+        return
+
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    # Not when migrating back past the migration that owns the triggers
+    if ('transactions', '0009_updated_at_triggers') in MigrationRecorder(connection).applied_migrations():
+        create_updated_at_triggers(connection)
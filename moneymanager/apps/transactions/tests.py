@@ -0,0 +1,125 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from .models import Account, RecurringTransaction, Transaction, deferred_balance_updates
+
+User = get_user_model()
+
+
+class RecurringTransactionGenerationTests(TestCase):
+    """Catch-up generation of recurring transactions."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('owner', 'owner@example.com', 'password')
+        self.account = Account.objects.create(
+            name='Savings', account_type='savings', owner=self.user,
+            current_balance=Decimal('1000.00')
+        )
+        self.today = timezone.now().date()
+
+    def _recurring(self, transaction_type, weeks_overdue):
+        due_date = self.today - timedelta(weeks=weeks_overdue)
+        return RecurringTransaction.objects.create(
+            name='Rent', amount=Decimal('100.00'), description='Rent',
+            transaction_type=transaction_type, account=self.account,
+            frequency='weekly', start_date=due_date, next_due_date=due_date,
+            user=self.user
+        )
+
+    def test_catches_up_every_missed_period(self):
+        recurring = self._recurring('expense', weeks_overdue=2)
+
+        created = recurring.generate_due_transactions(self.today)
+
+        self.assertEqual(len(created), 3)
+        self.assertEqual(Transaction.objects.filter(recurring_transaction=recurring).count(), 3)
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal('700.00'))
+        recurring.refresh_from_db()
+        self.assertEqual(recurring.next_due_date, self.today + timedelta(weeks=1))
+
+    def test_due_dates_stop_at_end_date(self):
+        recurring = self._recurring('expense', weeks_overdue=3)
+        recurring.end_date = self.today - timedelta(weeks=2)
+
+        self.assertEqual(recurring.due_dates(self.today), [
+            self.today - timedelta(weeks=3),
+            self.today - timedelta(weeks=2),
+        ])
+
+    def test_recurring_transfer_is_rejected_like_a_single_save(self):
+        recurring = self._recurring('transfer', weeks_overdue=2)
+        due_date = recurring.next_due_date
+
+        with self.assertRaisesMessage(ValueError, 'Transfer transactions must have a to_account'):
+            recurring.generate_due_transactions(self.today)
+
+        self.assertFalse(Transaction.objects.exists())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.current_balance, Decimal('1000.00'))
+        recurring.refresh_from_db()
+        self.assertEqual(recurring.next_due_date, due_date)
+
+    def test_failing_recurring_does_not_block_the_rest(self):
+        transfer = self._recurring('transfer', weeks_overdue=1)
+        expense = self._recurring('expense', weeks_overdue=1)
+
+        with self.assertLogs('moneymanager.apps.transactions.models', level='ERROR'):
+            created_count = RecurringTransaction.process_due_recurring(self.today, batch_size=1)
+
+        self.assertEqual(created_count, 2)
+        self.assertEqual(Transaction.objects.filter(recurring_transaction=expense).count(), 2)
+        transfer.refresh_from_db()
+        self.assertLessEqual(transfer.next_due_date, self.today)
+
+
+class AccountBalanceTests(TestCase):
+    """Every balance path keeps the opening balance entered for an account."""
+
+    def setUp(self):
+        self.user = User.objects.create_user('owner', 'owner@example.com', 'password')
+        self.account = Account.objects.create(
+            name='Savings', account_type='savings', owner=self.user,
+            opening_balance=Decimal('1000.00'), current_balance=Decimal('1000.00')
+        )
+
+    def _expense(self, amount):
+        return Transaction.objects.create(
+            amount=Decimal(amount), description='Groceries', transaction_type='expense',
+            account=self.account, date=timezone.now().date(), user=self.user
+        )
+
+    def _balance(self):
+        self.account.refresh_from_db()
+        return self.account.current_balance
+
+    def test_save_and_delete_apply_deltas(self):
+        first = self._expense('100.00')
+        self._expense('50.00')
+        self.assertEqual(self._balance(), Decimal('850.00'))
+
+        first.delete()
+        self.assertEqual(self._balance(), Decimal('950.00'))
+
+    def test_reconciliation_matches_incremental_balance(self):
+        self._expense('100.00')
+        incremental = self._balance()
+
+        self.account.update_balance()
+        self.assertEqual(self._balance(), incremental)
+
+        Account.update_balances([self.account.pk])
+        self.assertEqual(self._balance(), incremental)
+
+    def test_deferred_delete_keeps_opening_balance(self):
+        expense = self._expense('100.00')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with deferred_balance_updates():
+                expense.delete()
+
+        self.assertEqual(self._balance(), Decimal('1000.00'))
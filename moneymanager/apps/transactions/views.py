@@ -18,7 +18,7 @@ from openpyxl.utils import get_column_letter
 
 logger = logging.getLogger(__name__)
 
-from .models import Account, Transaction, RecurringTransaction, TransactionTag
+from .models import Account, Transaction, RecurringTransaction, TransactionTag, deferred_balance_updates
 from .forms import (
     AccountForm, TransactionForm, TransactionFilterForm,
     RecurringTransactionForm, BulkTransactionUploadForm
@@ -34,9 +34,7 @@ class TransactionListView(LoginRequiredMixin, ListView):
     paginate_by = 25
 
     def get_queryset(self):
-        queryset = Transaction.objects.filter(is_active=True).select_related(
-            'category', 'account', 'user'
-        )
+        queryset = Transaction.objects.lightweight().filter(is_active=True)
 
         # Filter by user only - keep personal transactions private
         queryset = queryset.filter(user=self.request.user)
@@ -608,9 +606,7 @@ class FamilyTransactionListView(LoginRequiredMixin, ListView):
         return super().dispatch(request, *args, **kwargs)
 
     def get_queryset(self):
-        queryset = Transaction.objects.filter(is_active=True).select_related(
-            'category', 'account', 'user'
-        )
+        queryset = Transaction.objects.filter(is_active=True)
 
         # Show all transactions from family members (excluding current user's own transactions)
         if hasattr(self.request, 'current_family_group') and self.request.current_family_group:
@@ -689,22 +685,10 @@ def bulk_delete_transactions(request):
             else:
                 queryset = queryset.filter(family_group__isnull=True)
             
-            # Get affected accounts for balance updates
-            affected_accounts = set()
-            for transaction in queryset:
-                affected_accounts.add(transaction.account)
-                if transaction.to_account:
-                    affected_accounts.add(transaction.to_account)
-                if transaction.from_account:
-                    affected_accounts.add(transaction.from_account)
-            
-            # Delete transactions
+            # Delete transactions, recalculating each affected account once
             deleted_count = queryset.count()
-            queryset.delete()
-            
-            # Update account balances
-            for account in affected_accounts:
-                account.update_balance()
+            with deferred_balance_updates():
+                queryset.delete()
             
             messages.success(
                 request, 